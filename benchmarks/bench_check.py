@@ -0,0 +1,47 @@
+# SPDX-FileCopyrightText: Copyright 2021, Siavash Ameli <sameli@berkeley.edu>
+# SPDX-License-Identifier: BSD-3-Clause
+# SPDX-FileType: SOURCE
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the license found in the LICENSE.txt file in the root directory
+# of this source tree.
+
+
+# =======
+# Imports
+# =======
+
+import os
+from ortho import OrthogonalFunctions
+
+os.environ.pop('ORTHO_CACHE_DIR', None)
+
+
+# =====
+# Check
+# =====
+
+class Check(object):
+    """
+    Check of the mutual orthonormality of the functions.
+    """
+
+    params = [3, 6, 9, 12, 15]
+    param_names = ['num_func']
+
+    # The symbolic check takes minutes for the largest num_func
+    timeout = 1800
+    number = 1
+    repeat = (1, 3, 60.0)
+
+    def setup(self, num_func):
+        self.OF = OrthogonalFunctions(num_func=num_func)
+
+    def time_check_symbolic(self, num_func):
+        self.OF.check(mode='symbolic')
+
+    def time_check_numeric(self, num_func):
+        self.OF.check(mode='numeric')
+
+    def peakmem_check_symbolic(self, num_func):
+        self.OF.check(mode='symbolic')
@@ -0,0 +1,135 @@
+# SPDX-FileCopyrightText: Copyright 2021, Siavash Ameli <sameli@berkeley.edu>
+# SPDX-License-Identifier: BSD-3-Clause
+# SPDX-FileType: SOURCE
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the license found in the LICENSE.txt file in the root directory
+# of this source tree.
+
+
+# =======
+# Imports
+# =======
+
+import os
+from sympy.core.cache import clear_cache
+from ortho import OrthogonalFunctions
+
+# The persistent cache would hide the cost of the construction
+os.environ.pop('ORTHO_CACHE_DIR', None)
+
+
+# ============
+# Construction
+# ============
+
+class Construction(object):
+    """
+    Construction of the orthonormal functions.
+    """
+
+    params = ([3, 6, 9, 12, 15],
+              ['gram-schmidt', 'cholesky', 'product', 'symbolic'])
+    param_names = ['num_func', 'method']
+
+    # The symbolic method takes minutes for the largest num_func
+    timeout = 1800
+    number = 1
+    repeat = (1, 3, 60.0)
+
+    def setup(self, num_func, method):
+        # Measure the cost without the cached sympy expressions of a previous
+        # run
+        clear_cache()
+
+    def time_construct(self, num_func, method):
+        OrthogonalFunctions(num_func=num_func, method=method)
+
+    def peakmem_construct(self, num_func, method):
+        OrthogonalFunctions(num_func=num_func, method=method)
+
+
+# ==================
+# Large Construction
+# ==================
+
+class LargeConstruction(object):
+    """
+    Construction of a large number of functions by the exact methods.
+    """
+
+    params = ([50, 100, 200], ['gram-schmidt', 'cholesky', 'product'])
+    param_names = ['num_func', 'method']
+
+    timeout = 600
+    number = 1
+    repeat = (1, 3, 60.0)
+
+    def setup(self, num_func, method):
+        clear_cache()
+
+    def time_construct(self, num_func, method):
+        OrthogonalFunctions(num_func=num_func, method=method)
+
+
+# =====
+# Batch
+# =====
+
+class Batch(object):
+    """
+    Construction of the functions of many intervals and numbers of functions
+    at once, compared with their construction one by one.
+    """
+
+    params = [False, True]
+    param_names = ['batch']
+
+    timeout = 600
+    number = 1
+    repeat = (1, 3, 60.0)
+
+    def setup(self, batch):
+        clear_cache()
+        self.params_list = [
+            {'num_func': num_func, 'end_interval': end_interval,
+             'method': 'product'}
+            for num_func in [10, 20, 40] for end_interval in [0.5, 1, 2, 4]]
+
+    def time_construct(self, batch):
+        if batch:
+            OrthogonalFunctions.batch(self.params_list)
+        else:
+            for params in self.params_list:
+                OrthogonalFunctions(**params)
+
+
+# ==============
+# From Exponents
+# ==============
+
+class FromExponents(object):
+    """
+    Construction of the functions of arbitrary exponents and weights from
+    the closed-form Gram matrix, with rational and float exponents.
+    """
+
+    params = ([10, 20, 40], ['gram-schmidt', 'cholesky', 'product'],
+              ['rational', 'float'])
+    param_names = ['num_func', 'method', 'exponents']
+
+    timeout = 600
+    number = 1
+    repeat = (1, 3, 60.0)
+
+    def setup(self, num_func, method, exponents):
+        # The floats are converted to fractions of their binary values,
+        # which have large denominators
+        if exponents == 'rational':
+            self.exponents = ['1/%d' % (j+2) for j in range(num_func)]
+        else:
+            self.exponents = [1.0 / (j+2) for j in range(num_func)]
+
+    def time_construct(self, num_func, method, exponents):
+        OrthogonalFunctions.from_exponents(self.exponents, beta=1,
+                                           method=method)
@@ -0,0 +1,248 @@
+# SPDX-FileCopyrightText: Copyright 2021, Siavash Ameli <sameli@berkeley.edu>
+# SPDX-License-Identifier: BSD-3-Clause
+# SPDX-FileType: SOURCE
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the license found in the LICENSE.txt file in the root directory
+# of this source tree.
+
+
+# =======
+# Imports
+# =======
+
+import os
+import numpy
+from ortho import OrthogonalFunctions
+
+os.environ.pop('ORTHO_CACHE_DIR', None)
+
+
+# ========
+# Evaluate
+# ========
+
+class Evaluate(object):
+    """
+    Numeric evaluation of the functions on arrays of points.
+    """
+
+    params = ([10**4, 10**5, 10**6, 10**7], [9, 15])
+    param_names = ['num_points', 'num_func']
+
+    timeout = 300
+
+    def setup(self, num_points, num_func):
+        self.OF = OrthogonalFunctions(num_func=num_func)
+        self.t = numpy.linspace(0, 1, num_points)
+        self.out = numpy.empty((num_func, num_points))
+
+    def time_evaluate(self, num_points, num_func):
+        self.OF.evaluate(self.t)
+
+    def time_evaluate_out(self, num_points, num_func):
+        self.OF.evaluate(self.t, out=self.out)
+
+    def time_evaluate_chunks(self, num_points, num_func):
+        for phi in self.OF.evaluate_chunks(self.t, chunk_size=2**16):
+            pass
+
+    def peakmem_evaluate(self, num_points, num_func):
+        self.OF.evaluate(self.t)
+
+    def peakmem_evaluate_chunks(self, num_points, num_func):
+        for phi in self.OF.evaluate_chunks(self.t, chunk_size=2**16):
+            pass
+
+
+# ================
+# Evaluate Methods
+# ================
+
+class EvaluateMethods(object):
+    """
+    Methods to compute the powers of the points in the numeric evaluation.
+    """
+
+    params = (['power', 'log', 'horner'], [5, 9, 12, 15])
+    param_names = ['method', 'num_func']
+
+    def setup(self, method, num_func):
+        self.OF = OrthogonalFunctions(num_func=num_func)
+        self.t = numpy.linspace(0, 1, 10**6)
+        self.out = numpy.empty((num_func, self.t.size))
+
+    def time_evaluate(self, method, num_func):
+        self.OF.evaluate(self.t, out=self.out, method=method)
+
+
+# ===================
+# Evaluate Derivative
+# ===================
+
+class EvaluateDerivative(object):
+    """
+    Derivatives of the functions on arrays of points.
+    """
+
+    params = ([0, 1, 2], [9, 15])
+    param_names = ['derivative', 'num_func']
+
+    def setup(self, derivative, num_func):
+        self.OF = OrthogonalFunctions(num_func=num_func)
+        self.t = numpy.linspace(0, 1, 10**6 + 1)[1:]
+        self.out = numpy.empty((num_func, self.t.size))
+
+    def time_evaluate(self, derivative, num_func):
+        self.OF.evaluate(self.t, out=self.out, derivative=derivative)
+
+
+# =========
+# Integrate
+# =========
+
+class Integrate(object):
+    """
+    Integrals of the functions on arrays of intervals.
+    """
+
+    params = [9, 15]
+    param_names = ['num_func']
+
+    def setup(self, num_func):
+        self.OF = OrthogonalFunctions(num_func=num_func)
+        self.t = numpy.linspace(0, 1, 10**6 + 1)
+        self.out = numpy.empty((num_func, self.t.size - 1))
+
+    def time_integrate(self, num_func):
+        self.OF.integrate(self.t[:-1], self.t[1:], out=self.out)
+
+
+# ==========
+# Synthesize
+# ==========
+
+class Synthesize(object):
+    """
+    Synthesis of batches of expansions in the functions.
+    """
+
+    params = ([1, 100, 1000], [9, 15])
+    param_names = ['num_expansions', 'num_func']
+
+    timeout = 300
+
+    def setup(self, num_expansions, num_func):
+        self.OF = OrthogonalFunctions(num_func=num_func)
+        self.t = numpy.linspace(0, 1, 10**4)
+        self.c = numpy.random.randn(num_expansions, num_func)
+
+    def time_synthesize(self, num_expansions, num_func):
+        self.OF.synthesize(self.c, self.t)
+
+    def peakmem_synthesize(self, num_expansions, num_func):
+        self.OF.synthesize(self.c, self.t)
+
+
+# =======
+# Project
+# =======
+
+class Project(object):
+    """
+    Projection of batches of sampled signals onto the functions.
+    """
+
+    params = ([1, 100, 1000], [9, 15])
+    param_names = ['num_signals', 'num_func']
+
+    timeout = 300
+
+    def setup(self, num_signals, num_func):
+        self.OF = OrthogonalFunctions(num_func=num_func)
+        self.t = numpy.logspace(-300, 0, 10**5)
+        self.samples = numpy.random.randn(num_signals, self.t.size)
+
+    def time_project(self, num_signals, num_func):
+        self.OF.project(self.samples, self.t)
+
+    def peakmem_project(self, num_signals, num_func):
+        self.OF.project(self.samples, self.t)
+
+
+# ===
+# Fit
+# ===
+
+class Fit(object):
+    """
+    Streaming least-squares fit of sampled signals in the functions.
+    """
+
+    params = ([None, 4], [9, 15])
+    param_names = ['workers', 'num_func']
+
+    timeout = 300
+
+    def setup(self, workers, num_func):
+        self.OF = OrthogonalFunctions(num_func=num_func)
+        self.t = numpy.random.rand(10**6)
+        self.samples = numpy.sqrt(self.t)
+
+    def time_fit(self, workers, num_func):
+        self.OF.fit(self.samples, self.t, workers=workers)
+
+    def peakmem_fit(self, workers, num_func):
+        self.OF.fit(self.samples, self.t, workers=workers)
+
+
+# ===============
+# Evaluate Stable
+# ===============
+
+class EvaluateStable(object):
+    """
+    Stable evaluation of many functions by the Chebyshev expansions.
+    """
+
+    params = [9, 20, 50]
+    param_names = ['num_func']
+
+    timeout = 300
+
+    def setup(self, num_func):
+        self.OF = OrthogonalFunctions(num_func=num_func, method='cholesky')
+        self.t = numpy.linspace(0, 1, 10**6)
+        self.out = numpy.empty((num_func, self.t.size))
+
+        # The expansions are fitted on the first call
+        self.OF.evaluate(0.5, method='stable')
+
+    def time_evaluate(self, num_func):
+        self.OF.evaluate(self.t, out=self.out, method='stable')
+
+    def time_fit(self, num_func):
+        self.OF._expansions = None
+        self.OF.evaluate(0.5, method='stable')
+
+
+# ==================
+# Evaluate Precision
+# ==================
+
+class EvaluatePrecision(object):
+    """
+    Evaluation of the functions in arbitrary precision.
+    """
+
+    params = ([9, 50], [30, 100])
+    param_names = ['num_func', 'precision']
+
+    timeout = 300
+
+    def setup(self, num_func, precision):
+        self.OF = OrthogonalFunctions(num_func=num_func, method='cholesky')
+        self.t = numpy.linspace(0, 1, 1000)
+
+    def time_evaluate(self, num_func, precision):
+        self.OF.evaluate(self.t, precision=precision)
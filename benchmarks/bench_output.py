@@ -0,0 +1,109 @@
+# SPDX-FileCopyrightText: Copyright 2021, Siavash Ameli <sameli@berkeley.edu>
+# SPDX-License-Identifier: BSD-3-Clause
+# SPDX-FileType: SOURCE
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the license found in the LICENSE.txt file in the root directory
+# of this source tree.
+
+
+# =======
+# Imports
+# =======
+
+import os
+import io
+import contextlib
+import tempfile
+import matplotlib
+matplotlib.use('Agg')
+
+from ortho import OrthogonalFunctions                              # noqa: E402
+import matplotlib.pyplot as plt                                    # noqa: E402
+
+os.environ.pop('ORTHO_CACHE_DIR', None)
+
+
+# =====
+# Print
+# =====
+
+class Print(object):
+    """
+    Printing the coefficients of the functions.
+    """
+
+    params = [3, 6, 9, 12, 15]
+    param_names = ['num_func']
+
+    def setup(self, num_func):
+        self.OF = OrthogonalFunctions(num_func=num_func)
+
+    def time_print(self, num_func):
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.OF.print()
+
+
+# ====
+# Plot
+# ====
+
+class Plot(object):
+    """
+    Plotting the functions and saving the plot to files.
+    """
+
+    params = [3, 6, 9, 12, 15]
+    param_names = ['num_func']
+
+    timeout = 300
+    number = 1
+
+    def setup(self, num_func):
+        self.OF = OrthogonalFunctions(num_func=num_func)
+
+        # The plots are saved in the current directory
+        self.cwd = os.getcwd()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.temp_dir.name)
+
+    def teardown(self, num_func):
+        plt.close('all')
+        os.chdir(self.cwd)
+        self.temp_dir.cleanup()
+
+    def time_plot(self, num_func):
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.OF.plot(filename='plot')
+
+    def peakmem_plot(self, num_func):
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.OF.plot(filename='plot')
+
+
+# ==========
+# Save Table
+# ==========
+
+class SaveTable(object):
+    """
+    Saving the functions to a binary table and loading them back.
+    """
+
+    params = ([9, 50, 200], [True, False])
+    param_names = ['num_func', 'mmap']
+
+    def setup(self, num_func, mmap):
+        self.OF = OrthogonalFunctions(num_func=num_func, method='product')
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.temp_dir.name, 'ortho.npz')
+        self.OF.save(self.filename)
+
+    def teardown(self, num_func, mmap):
+        self.temp_dir.cleanup()
+
+    def time_save(self, num_func, mmap):
+        self.OF.save(self.filename)
+
+    def time_load(self, num_func, mmap):
+        OrthogonalFunctions.load(self.filename, mmap=mmap)
@@ -8,7 +8,9 @@
 
 
 from ._orthogonal_functions import OrthogonalFunctions
+from ._orthogonal_functions import coeffs_closed_form
+from ._orthogonal_functions import Profiler
 
-__all__ = ['OrthogonalFunctions']
+__all__ = ['OrthogonalFunctions', 'coeffs_closed_form', 'Profiler']
 
 from .__version__ import __version__                               # noqa: F401
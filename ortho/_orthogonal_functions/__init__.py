@@ -7,5 +7,7 @@
 # of this source tree.
 
 from .orthogonal_functions import OrthogonalFunctions
+from .rational_utilities import coeffs_closed_form
+from .profile_utilities import Profiler
 
-__all__ = ['OrthogonalFunctions']
+__all__ = ['OrthogonalFunctions', 'coeffs_closed_form', 'Profiler']
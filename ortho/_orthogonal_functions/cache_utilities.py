@@ -0,0 +1,266 @@
+# SPDX-FileCopyrightText: Copyright 2021, Siavash Ameli <sameli@berkeley.edu>
+# SPDX-License-Identifier: BSD-3-Clause
+# SPDX-FileType: SOURCE
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the license found in the LICENSE.txt file in the root directory
+# of this source tree.
+
+
+# =======
+# Imports
+# =======
+
+import os
+import json
+import hashlib
+import tempfile
+from fractions import Fraction
+from ..__version__ import __version__
+from .profile_utilities import profiled
+
+__all__ = ['get_cache_dir', 'get_cache_key', 'load_cache_entry',
+           'save_cache_entry', 'serialize_rational', 'deserialize_rational']
+
+# Default bound on the total size of the cache directory in bytes. This can
+# be changed by the environment variable ORTHO_CACHE_MAX_SIZE.
+_DEFAULT_MAX_SIZE = 2**28
+
+# Suffix of the files of the cache entries
+_SUFFIX = '.json'
+
+
+# =============
+# Get cache dir
+# =============
+
+def get_cache_dir(cache_dir=None):
+    """
+    Determines the directory of the cache.
+
+    :param cache_dir: The cache directory. If `None`, the environment
+        variable ``ORTHO_CACHE_DIR`` is used, if it is set.
+    :type cache_dir: str
+
+    :return: The absolute path of the cache directory, or `None` if the cache
+        is disabled.
+    :rtype: str
+    """
+
+    if cache_dir is None:
+        cache_dir = os.environ.get('ORTHO_CACHE_DIR', '')
+
+    if not cache_dir:
+        return None
+
+    return os.path.abspath(os.path.expanduser(cache_dir))
+
+
+# ============
+# Get max size
+# ============
+
+def get_max_size():
+    """
+    Bound on the total size of the cache directory in bytes.
+    """
+
+    max_size = os.environ.get('ORTHO_CACHE_MAX_SIZE', '')
+    if not max_size:
+        return _DEFAULT_MAX_SIZE
+
+    try:
+        return int(max_size)
+    except ValueError:
+        raise ValueError('"ORTHO_CACHE_MAX_SIZE" should be an integer.')
+
+
+# =============
+# Get cache key
+# =============
+
+def get_cache_key(parameters):
+    """
+    Content address of a cache entry.
+
+    :param parameters: The parameters that determine the functions, such as
+        ``start_index``, ``num_func`` and ``method``.
+    :type parameters: dict
+
+    :return: The SHA-256 hash of the parameters and the package version.
+    :rtype: str
+    """
+
+    content = json.dumps({'parameters': parameters, 'version': __version__},
+                         sort_keys=True)
+
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+# =============
+# Get file name
+# =============
+
+def _get_filename(cache_dir, key):
+    """
+    Path of the file of a cache entry.
+    """
+
+    return os.path.join(cache_dir, key + _SUFFIX)
+
+
+# ================
+# Load cache entry
+# ================
+
+@profiled('load_cache_entry')
+def load_cache_entry(cache_dir, key):
+    """
+    Loads an entry from the cache.
+
+    The modification time of the file of the entry is updated, which marks
+    the entry as recently used for the eviction.
+
+    :param cache_dir: The cache directory.
+    :type cache_dir: str
+
+    :param key: The content address of the entry.
+    :type key: str
+
+    :return: The content of the entry, or `None` if the entry does not exist
+        or cannot be read.
+    :rtype: dict
+    """
+
+    filename = _get_filename(cache_dir, key)
+
+    try:
+        with open(filename, 'r') as file:
+            entry = json.load(file)
+        os.utime(filename)
+    except (OSError, ValueError):
+        return None
+
+    if (not isinstance(entry, dict)) or (entry.get('key') != key):
+        return None
+
+    return entry
+
+
+# ================
+# Save cache entry
+# ================
+
+@profiled('save_cache_entry')
+def save_cache_entry(cache_dir, key, entry, max_size=None):
+    """
+    Writes an entry to the cache and evicts the least recently used entries.
+
+    The entry is written to a temporary file that is atomically renamed to
+    the file of the entry, so that concurrent processes never read a
+    partially written entry.
+
+    :param cache_dir: The cache directory. It is created if it does not
+        exist.
+    :type cache_dir: str
+
+    :param key: The content address of the entry.
+    :type key: str
+
+    :param entry: The JSON-serializable content of the entry.
+    :type entry: dict
+
+    :param max_size: Bound on the total size of the cache directory in bytes.
+        If `None`, :func:`get_max_size` is used.
+    :type max_size: int
+    """
+
+    if max_size is None:
+        max_size = get_max_size()
+
+    os.makedirs(cache_dir, exist_ok=True)
+    filename = _get_filename(cache_dir, key)
+    entry = dict(entry, key=key, version=__version__)
+
+    descriptor, temp_filename = tempfile.mkstemp(dir=cache_dir,
+                                                 suffix='.tmp')
+    try:
+        with os.fdopen(descriptor, 'w') as file:
+            json.dump(entry, file, separators=(',', ':'))
+        os.replace(temp_filename, filename)
+    except BaseException:
+        if os.path.exists(temp_filename):
+            os.remove(temp_filename)
+        raise
+
+    _evict(cache_dir, max_size, keep=filename)
+
+
+# =====
+# Evict
+# =====
+
+def _evict(cache_dir, max_size, keep=None):
+    """
+    Removes the least recently used entries until the total size of the cache
+    is at most ``max_size``. The file ``keep`` is never removed.
+    """
+
+    entries = []
+    total_size = 0
+    for name in os.listdir(cache_dir):
+        if not name.endswith(_SUFFIX):
+            continue
+        filename = os.path.join(cache_dir, name)
+        try:
+            status = os.stat(filename)
+        except OSError:
+            continue
+        entries.append((status.st_mtime, status.st_size, filename))
+        total_size += status.st_size
+
+    for _, size, filename in sorted(entries):
+        if total_size <= max_size:
+            break
+        if filename == keep:
+            continue
+        try:
+            os.remove(filename)
+        except OSError:
+            # The entry is removed by another process
+            pass
+        total_size -= size
+
+
+# ==================
+# Serialize rational
+# ==================
+
+def serialize_rational(alpha_squared, alpha_sign, coeffs):
+    """
+    Converts the exact rational coefficients to a JSON-serializable entry.
+    """
+
+    return {
+        'format': 'rational',
+        'alpha_squared': [str(value) for value in alpha_squared],
+        'alpha_sign': list(alpha_sign),
+        'coeffs': [[str(coeff) for coeff in row] for row in coeffs],
+    }
+
+
+# ====================
+# Deserialize rational
+# ====================
+
+def deserialize_rational(entry):
+    """
+    Converts an entry of :func:`serialize_rational` to exact rational
+    coefficients.
+    """
+
+    alpha_squared = [Fraction(value) for value in entry['alpha_squared']]
+    alpha_sign = list(entry['alpha_sign'])
+    coeffs = [[Fraction(coeff) for coeff in row] for row in entry['coeffs']]
+
+    return alpha_squared, alpha_sign, coeffs
@@ -0,0 +1,281 @@
+# SPDX-FileCopyrightText: Copyright 2021, Siavash Ameli <sameli@berkeley.edu>
+# SPDX-License-Identifier: BSD-3-Clause
+# SPDX-FileType: SOURCE
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the license found in the LICENSE.txt file in the root directory
+# of this source tree.
+
+
+# =======
+# Imports
+# =======
+
+import math
+import numpy
+from .multiprecision_utilities import get_integer_coeffs
+from .multiprecision_utilities import get_working_precision
+from .multiprecision_utilities import sum_powers
+from .profile_utilities import profiled
+
+__all__ = ['fit_chebyshev_expansions', 'evaluate_chebyshev_expansions']
+
+# Number of Chebyshev nodes on each interval that are tried first. The number
+# of nodes is doubled until the expansions are resolved.
+_MIN_NUM_NODES = 16
+_MAX_NUM_NODES = 1024
+
+# The Chebyshev coefficients below this tolerance relative to the maximum of
+# a function on an interval are truncated. This is above the round-off of the
+# discrete cosine transform in float64, which is a few tens of eps.
+_TOLERANCE = 64.0 * numpy.finfo(numpy.float64).eps
+
+
+# =========
+# Get Edges
+# =========
+
+def get_edges(interval):
+    """
+    Edges of the dyadic intervals :math:`[0, 1], [1, 2], [2, 4], \\dots` of
+    the variable :math:`s = -\\log(t/L)` that cover all positive ``float64``
+    numbers :math:`t \\leq L`.
+
+    :param interval: The interval of the domain of the functions in the form
+        ``[Start, End]``.
+    :type interval: list
+
+    :return: The edges of the intervals.
+    :rtype: numpy.ndarray
+    """
+
+    log_end = math.log(float(interval[1]))
+    smallest = float(numpy.nextafter(0.0, 1.0))
+    max_s = max(log_end - math.log(smallest), 1.0)
+
+    num_intervals = int(math.ceil(math.log2(max_s))) + 1
+
+    return numpy.r_[0.0, 2.0**numpy.arange(num_intervals)]
+
+
+# ===============
+# Get Node Values
+# ===============
+
+def _get_node_values(nodes, exponents, alpha, numerators, offsets, prec):
+    """
+    Values of the scaled functions :math:`\\psi_i(s) = \\phi_i(L e^{-s}) /
+    w_i(s)` at the nodes :math:`s_k`, rounded to ``float64``. See
+    :func:`fit_chebyshev_expansions` for the envelopes :math:`w_i`.
+
+    The powers :math:`e^{-\\lambda_j s}` are computed with ``prec`` bits and
+    the sums with the integer coefficients are exact. See
+    :func:`sum_powers`.
+    """
+
+    import mpmath
+
+    num_func = len(numerators)
+    values = numpy.empty((num_func, nodes.size), dtype=float)
+
+    with mpmath.workprec(prec):
+
+        for k, node in enumerate(nodes):
+
+            s = mpmath.mpf(float(node))
+            powers = [mpmath.exp(-exponent * s) for exponent in exponents]
+            sums = sum_powers(numerators, powers)
+
+            for i in range(num_func):
+                envelope = powers[i] / (powers[i] + offsets[i])
+                values[i, k] = float(alpha[i] * sums[i] / envelope)
+
+    return values
+
+
+# ========================
+# Fit Chebyshev Expansions
+# ========================
+
+@profiled('fit_chebyshev_expansions')
+def fit_chebyshev_expansions(
+        exponents,
+        alpha_squared,
+        alpha_sign,
+        coeffs,
+        interval):
+    """
+    Piecewise Chebyshev expansions of the orthonormal functions in the
+    variable :math:`s = -\\log(t/L)`.
+
+    The functions are written as :math:`\\phi_i(t) = \\psi_i(s) w_i(s)`
+    with the envelopes
+
+    .. math::
+
+        w_i(s) = \\frac{p_i}{p_i + \\epsilon_i}, \\qquad
+        p_i = (t/L)^{\\lambda_i} = e^{-\\lambda_i s}, \\qquad
+        \\epsilon_i = \\frac{1}{\\vert \\alpha_i a_{ii} \\vert}.
+
+    The functions are of the order of one until the leading term
+    :math:`\\alpha_i a_{ii} p_i` dominates the alternating sum, after which
+    they decay as :math:`p_i`. Hence, :math:`\\psi_i` is of the order of one
+    on the whole half-line and the relative accuracy of the decaying tail
+    is kept. On each interval of :func:`get_edges`, :math:`\\psi_i` is
+    interpolated at the Chebyshev nodes whose number is doubled until the
+    trailing coefficients are negligible.
+    The values at the nodes are computed from the exact coefficients with
+    enough precision to absorb the cancellation of the alternating sums,
+    hence the expansions are accurate to the ``float64`` round-off of each
+    :math:`\\psi_i` regardless of the size of the coefficients.
+
+    :param exponents: The exponents :math:`\\lambda_i` as exact fractions.
+    :type exponents: list
+
+    :param alpha_squared: The exact squares of :math:`\\alpha_i`.
+    :type alpha_squared: list
+
+    :param alpha_sign: The signs of :math:`\\alpha_i`.
+    :type alpha_sign: list
+
+    :param coeffs: The exact coefficients :math:`a_{ij}` on the interval
+        :math:`[0, 1]`.
+    :type coeffs: list
+
+    :param interval: The interval of the domain of the functions in the form
+        ``[Start, End]``.
+    :type interval: list
+
+    :return: The expansions as a dictionary with the keys ``'end'`` for
+        :math:`L`, ``'exponents'`` for the array of :math:`\\lambda_i`,
+        ``'offsets'`` for the array of :math:`\\epsilon_i`, ``'edges'`` for
+        the edges of the intervals, and ``'coeffs'`` for the
+        list of the arrays of the Chebyshev coefficients of the shape
+        ``(num_func, degree+1)`` on each interval.
+    :rtype: dict
+    """
+
+    import mpmath
+
+    num_func = len(coeffs)
+    edges = get_edges(interval)
+
+    numerators, denominators = get_integer_coeffs(coeffs)
+    prec = get_working_precision(numerators, 53)
+
+    with mpmath.workprec(prec):
+        exponents_mp = [mpmath.mpf(exponent.numerator) / exponent.denominator
+                        for exponent in exponents]
+        alpha = [sign * mpmath.sqrt(mpmath.mpf(square.numerator) /
+                                    square.denominator) / denominator
+                 for square, sign, denominator in
+                 zip(alpha_squared, alpha_sign, denominators)]
+        offsets = [1 / abs(alpha[i] * numerators[i][-1])
+                   for i in range(num_func)]
+
+    chebyshev_coeffs = []
+    for a, b in zip(edges[:-1], edges[1:]):
+
+        num_nodes = _MIN_NUM_NODES
+        while True:
+
+            # Chebyshev nodes of the first kind
+            theta = numpy.pi * (numpy.arange(num_nodes) + 0.5) / num_nodes
+            nodes = 0.5 * (a + b) + 0.5 * (b - a) * numpy.cos(theta)
+
+            values = _get_node_values(nodes, exponents_mp, alpha, numerators,
+                                      offsets, prec)
+
+            # Discrete cosine transform of the values
+            cosines = numpy.cos(numpy.outer(numpy.arange(num_nodes), theta))
+            interpolant = (2.0 / num_nodes) * (values @ cosines.T)
+            interpolant[:, 0] *= 0.5
+
+            # Degree where the coefficients of all rows are negligible
+            scales = numpy.max(numpy.abs(values), axis=1, keepdims=True)
+            resolved = numpy.abs(interpolant) > _TOLERANCE * scales
+            degree = int(numpy.max(numpy.nonzero(resolved.any(axis=0))[0],
+                                   initial=0))
+
+            if (degree < (3 * num_nodes) // 4) or \
+                    (num_nodes >= _MAX_NUM_NODES):
+                break
+            num_nodes *= 2
+
+        chebyshev_coeffs.append(numpy.ascontiguousarray(
+            interpolant[:, :degree+1]))
+
+    expansions = {
+        'end': float(interval[1]),
+        'exponents': numpy.array([float(exponent) for exponent in exponents]),
+        'offsets': numpy.array([float(offset) for offset in offsets]),
+        'edges': edges,
+        'coeffs': chebyshev_coeffs,
+    }
+
+    return expansions
+
+
+# =============================
+# Evaluate Chebyshev Expansions
+# =============================
+
+def evaluate_chebyshev_expansions(t, expansions, out):
+    """
+    Evaluates the functions on a one-dimensional array of points by the
+    expansions of :func:`fit_chebyshev_expansions`.
+
+    :param t: One-dimensional array of points in :math:`[0, L]`.
+    :type t: numpy.ndarray
+
+    :param expansions: The expansions of :func:`fit_chebyshev_expansions`.
+    :type expansions: dict
+
+    :param out: Output array of the shape ``(num_func, t.size)``.
+    :type out: numpy.ndarray
+    """
+
+    end = expansions['end']
+    edges = expansions['edges']
+    exponents = expansions['exponents']
+    offsets = expansions['offsets']
+
+    t = numpy.asarray(t, dtype=numpy.float64)
+    if numpy.any(numpy.isnan(t)) or numpy.any(t < 0.0) or \
+            numpy.any(t > end):
+        raise ValueError('The points should be in the interval [0, %g] ' %
+                         end + 'for the "stable" method.')
+
+    ratio = t / end
+    with numpy.errstate(divide='ignore'):
+        s = -numpy.log(ratio)
+
+    # Index of the dyadic interval of each point, where s in [2^(q-1), 2^q)
+    # is in the interval q, and s in [0, 1) is in the interval 0.
+    _, binary_exponents = numpy.frexp(s)
+    index = numpy.clip(binary_exponents, 0, edges.size - 2)
+    index[numpy.isinf(s)] = 0
+
+    for q in numpy.unique(index):
+
+        points = numpy.flatnonzero(index == q)
+        coeffs = expansions['coeffs'][q]
+        a, b = edges[q], edges[q+1]
+        x = (2.0 * s[points] - (a + b)) / (b - a)
+        x[numpy.isinf(x)] = 1.0
+
+        # Chebyshev polynomials by the three-term recurrence
+        polynomials = numpy.empty((coeffs.shape[1], points.size))
+        polynomials[0] = 1.0
+        if coeffs.shape[1] > 1:
+            polynomials[1] = x
+        for j in range(2, coeffs.shape[1]):
+            numpy.multiply(2.0 * x, polynomials[j-1], out=polynomials[j])
+            polynomials[j] -= polynomials[j-2]
+
+        out[:, points] = coeffs @ polynomials
+
+    # Multiply the scaled functions by the envelopes
+    for i, (exponent, offset) in enumerate(zip(exponents, offsets)):
+        power = numpy.power(ratio, exponent)
+        out[i] *= power / (power + offset)
@@ -0,0 +1,997 @@
+# SPDX-FileCopyrightText: Copyright 2021, Siavash Ameli <sameli@berkeley.edu>
+# SPDX-License-Identifier: BSD-3-Clause
+# SPDX-FileType: SOURCE
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the license found in the LICENSE.txt file in the root directory
+# of this source tree.
+
+
+# =======
+# Imports
+# =======
+
+import math
+from fractions import Fraction
+import numpy
+from .chebyshev_utilities import evaluate_chebyshev_expansions
+from .triangular_utilities import TriangularCoeffs
+from .profile_utilities import profiled
+
+__all__ = ['evaluate_functions', 'integrate_functions',
+           'synthesize_functions', 'evaluate_function_chunks']
+
+# Number of points that are evaluated at once. This bounds the memory of the
+# intermediate array of the powers of t.
+_BLOCK_SIZE = 2**15
+
+# Methods of the evaluation. Except "stable", the methods differ in how the
+# powers of t are computed.
+_METHODS = ('power', 'log', 'horner', 'stable')
+
+# Bound on the largest integer power of s = t^(1/M) in the "horner" method.
+# The relative error of the powers grows by this factor, which is about 5e-10
+# in double precision.
+_MAX_HORNER_POWER = 2**22
+
+
+# =========
+# Get dtype
+# =========
+
+def get_dtype(t, out=None):
+    """
+    Determines the floating point type of the evaluation.
+
+    :param t: The points to evaluate the functions.
+    :type t: numpy.ndarray
+
+    :param out: The output array, if given.
+    :type out: numpy.ndarray
+
+    :return: Either ``numpy.float32`` or ``numpy.float64``.
+    :rtype: numpy.dtype
+    """
+
+    if out is not None:
+        dtype = out.dtype
+    elif t.dtype == numpy.float32:
+        dtype = t.dtype
+    else:
+        dtype = numpy.dtype(numpy.float64)
+
+    return check_dtype(dtype)
+
+
+# ===========
+# Check dtype
+# ===========
+
+def check_dtype(dtype):
+    """
+    Checks the floating point type of the evaluation.
+    """
+
+    dtype = numpy.dtype(dtype)
+    if dtype not in (numpy.float32, numpy.float64):
+        raise ValueError('"dtype" should be either "float32" or "float64".')
+
+    return dtype
+
+
+# =====================
+# Get evaluation matrix
+# =====================
+
+def get_evaluation_matrix(alpha, coeffs, dtype, scales=None):
+    """
+    Lower triangular matrix of the products :math:`\\alpha_i a_{ij}`.
+
+    :param alpha: The coefficients :math:`\\alpha_i`.
+    :type alpha: list
+
+    :param coeffs: The packed coefficients :math:`a_{ij}`, or the ragged list
+        of lists of the coefficients.
+    :type coeffs: TriangularCoeffs or list
+
+    :param dtype: The data type of the matrix.
+    :type dtype: numpy.dtype
+
+    :param scales: The factors of the columns :math:`j`, such as those of
+        :func:`get_derivative_scales`. If `None`, the columns are not scaled.
+    :type scales: list
+
+    :return: The square matrix of size ``num_func``.
+    :rtype: numpy.ndarray
+    """
+
+    if not isinstance(coeffs, TriangularCoeffs):
+        coeffs = TriangularCoeffs(coeffs)
+
+    matrix = coeffs.to_matrix()
+    matrix *= numpy.asarray(alpha, dtype=float)[:, numpy.newaxis]
+
+    if scales is not None:
+        matrix *= numpy.asarray(scales, dtype=float)[numpy.newaxis, :]
+
+    return matrix.astype(dtype)
+
+
+# ================
+# Check derivative
+# ================
+
+def check_derivative(derivative):
+    """
+    Checks the order of the derivative.
+
+    :param derivative: The order :math:`k` of the derivative.
+    :type derivative: int
+
+    :return: The order of the derivative.
+    :rtype: int
+
+    :raises ValueError: If the order is not a non-negative integer.
+    """
+
+    if isinstance(derivative, bool) or \
+            (not isinstance(derivative, (int, numpy.integer))) or \
+            (derivative < 0):
+        raise ValueError('"derivative" should be a non-negative integer.')
+
+    return int(derivative)
+
+
+# =====================
+# Get Derivative Scales
+# =====================
+
+def get_derivative_scales(exponents, derivative):
+    """
+    Factors of the powers :math:`t^{\\lambda_j}` in the derivatives of the
+    functions.
+
+    The derivative of the order :math:`k` of :math:`t^{\\lambda_j}` is
+    :math:`(\\lambda_j)_k t^{\\lambda_j - k}`, where
+    :math:`(\\lambda_j)_k = \\lambda_j (\\lambda_j - 1) \\cdots
+    (\\lambda_j - k + 1)` is the falling factorial. Hence, the derivative of
+    the functions is the matrix of :math:`\\alpha_i a_{ij} (\\lambda_j)_k`
+    applied to the powers :math:`t^{\\lambda_j}`, times :math:`t^{-k}`.
+    Likewise, the antiderivative of :math:`t^{\\lambda_j}/t` that vanishes
+    at zero is :math:`t^{\\lambda_j} / \\lambda_j`.
+
+    :param exponents: The exponents :math:`\\lambda_j` as exact fractions.
+    :type exponents: list
+
+    :param derivative: The order :math:`k` of the derivative, or ``-1`` for
+        the antiderivative with respect to :math:`\\mathrm{d}t/t`.
+    :type derivative: int
+
+    :return: The factors of the columns, or `None` if ``derivative`` is zero.
+    :rtype: list
+    """
+
+    if derivative == 0:
+        return None
+
+    if derivative == -1:
+        return [float(1 / Fraction(exponent)) for exponent in exponents]
+
+    # The falling factorials are computed exactly before the rounding
+    scales = []
+    for exponent in exponents:
+        scale = Fraction(1)
+        for m in range(derivative):
+            scale *= Fraction(exponent) - m
+        scales.append(float(scale))
+
+    return scales
+
+
+# ============
+# Check output
+# ============
+
+def check_output(out, shape, dtype):
+    """
+    Checks the shape and type of a preallocated output array.
+    """
+
+    if not isinstance(out, numpy.ndarray):
+        raise TypeError('"out" should be a numpy array.')
+    if out.shape != shape:
+        raise ValueError('"out" should have the shape %s.' % str(shape))
+    if out.dtype != dtype:
+        raise ValueError('"out" should have the dtype "%s".' % dtype)
+    if not out.flags.c_contiguous:
+        raise ValueError('"out" should be a C-contiguous array.')
+
+
+# ===============
+# Evaluate Powers
+# ===============
+
+def evaluate_powers(t, exponents, powers):
+    """
+    Computes the powers :math:`t^{\\lambda_j}` of a block of points.
+
+    :param t: One-dimensional array of points.
+    :type t: numpy.ndarray
+
+    :param exponents: The exponents :math:`\\lambda_j`.
+    :type exponents: list
+
+    :param powers: Output array of the shape ``(num_func, t.size)``.
+    :type powers: numpy.ndarray
+    """
+
+    for j, exponent in enumerate(exponents):
+        numpy.power(t, exponent, out=powers[j])
+
+
+# ===================
+# Evaluate Log Powers
+# ===================
+
+def evaluate_log_powers(t, exponents, powers):
+    """
+    Computes the powers :math:`t^{\\lambda_j} = e^{\\lambda_j \\log t}` of a
+    block of points from one logarithm of the points.
+
+    :param t: One-dimensional array of points.
+    :type t: numpy.ndarray
+
+    :param exponents: The exponents :math:`\\lambda_j`.
+    :type exponents: list
+
+    :param powers: Output array of the shape ``(num_func, t.size)``.
+    :type powers: numpy.ndarray
+    """
+
+    # The logarithm is stored in the last row, which is overwritten last
+    log_t = powers[-1]
+    with numpy.errstate(divide='ignore'):
+        numpy.log(t, out=log_t)
+
+    for j, exponent in enumerate(exponents):
+        numpy.multiply(log_t, exponent, out=powers[j])
+        numpy.exp(powers[j], out=powers[j])
+
+
+# ===============
+# Get Horner Plan
+# ===============
+
+def get_horner_plan(exponents):
+    """
+    Plan of the multiplications that compute the powers
+    :math:`t^{\\lambda_j}` as integer powers of :math:`s = t^{1/M}`.
+
+    Here, :math:`M` is the least common multiple of the denominators of the
+    exponents, so that :math:`t^{\\lambda_j} = s^{k_j}` with the integers
+    :math:`k_j = M \\lambda_j`. The powers are computed in the ascending
+    order of :math:`k_j`. Each power is either the product of a computed
+    power and the repeated squares :math:`s^{2^b}` of :math:`s`, or a
+    repeated square of a computed power, whichever needs fewer
+    multiplications.
+
+    :param exponents: The exponents :math:`\\lambda_j` as exact fractions.
+    :type exponents: list
+
+    :return: The integer :math:`M`, the number of repeated squares of
+        :math:`s` that are used, and the list of steps. Each step is a tuple
+        ``(j, source, bits, num_squares)``, where the power ``j`` is the
+        power ``source`` (or one if `None`) times :math:`s^{2^b}` for ``b``
+        in ``bits``, squared ``num_squares`` times.
+    :rtype: tuple (int, int, list)
+    """
+
+    exponents = [Fraction(exponent) for exponent in exponents]
+    lcm = math.lcm(*[exponent.denominator for exponent in exponents])
+    integer_powers = [int(exponent * lcm) for exponent in exponents]
+
+    if max(integer_powers) > _MAX_HORNER_POWER:
+        raise ValueError('The "horner" method is not accurate for this ' +
+                         'number of functions, since the powers of ' +
+                         't^(1/%d) are too large. ' % lcm +
+                         'Use the "power" or "log" method.')
+
+    computed = {}
+    steps = []
+    num_bits = 0
+
+    order = sorted(range(len(exponents)), key=lambda j: integer_powers[j])
+    for j in order:
+        power = integer_powers[j]
+
+        # Product of one of the computed powers and the squares of s
+        best = (bin(power).count('1'), (j, None, _get_bits(power), 0))
+        for computed_power, source in computed.items():
+            difference = power - computed_power
+            if difference > 0:
+                cost = bin(difference).count('1') + 1
+                if cost < best[0]:
+                    best = (cost, (j, source, _get_bits(difference), 0))
+
+            # Repeated squares of one of the computed powers
+            ratio, remainder = divmod(power, computed_power)
+            if (remainder == 0) and (ratio & (ratio - 1) == 0):
+                cost = ratio.bit_length()
+                if cost < best[0]:
+                    best = (cost, (j, source, [], ratio.bit_length() - 1))
+
+        step = best[1]
+        if step[2]:
+            num_bits = max(num_bits, step[2][-1] + 1)
+        steps.append(step)
+        computed[power] = j
+
+    return lcm, num_bits, steps
+
+
+# ========
+# Get Bits
+# ========
+
+def _get_bits(integer):
+    """
+    Positions of the nonzero bits of a positive integer.
+    """
+
+    return [b for b in range(integer.bit_length()) if (integer >> b) & 1]
+
+
+# ======================
+# Evaluate Horner Powers
+# ======================
+
+def evaluate_horner_powers(t, plan, powers, squares):
+    """
+    Computes the powers :math:`t^{\\lambda_j} = s^{k_j}` of a block of points
+    by one fractional power :math:`s = t^{1/M}` and multiplications.
+
+    :param t: One-dimensional array of points.
+    :type t: numpy.ndarray
+
+    :param plan: The plan of :func:`get_horner_plan`.
+    :type plan: tuple
+
+    :param powers: Output array of the shape ``(num_func, t.size)``.
+    :type powers: numpy.ndarray
+
+    :param squares: Work array of the shape ``(num_bits, t.size)`` for the
+        repeated squares of :math:`s`.
+    :type squares: numpy.ndarray
+    """
+
+    lcm, num_bits, steps = plan
+
+    if num_bits > 0:
+        numpy.power(t, 1.0 / lcm, out=squares[0])
+        for b in range(1, num_bits):
+            numpy.multiply(squares[b-1], squares[b-1], out=squares[b])
+
+    for j, source, bits, num_squares in steps:
+        power = powers[j]
+
+        if source is None:
+            power[:] = squares[bits[0]]
+            bits = bits[1:]
+        elif bits:
+            numpy.multiply(powers[source], squares[bits[0]], out=power)
+            bits = bits[1:]
+        else:
+            numpy.multiply(powers[source], powers[source], out=power)
+            num_squares -= 1
+
+        for b in bits:
+            numpy.multiply(power, squares[b], out=power)
+        for _ in range(num_squares):
+            numpy.multiply(power, power, out=power)
+
+
+# ===================
+# Get Power Evaluator
+# ===================
+
+def get_power_evaluator(exponents, method, dtype):
+    """
+    Function that computes the powers :math:`t^{\\lambda_j}` of a block of
+    points by a given method.
+
+    :param exponents: The exponents :math:`\\lambda_j` as exact fractions.
+    :type exponents: list
+
+    :param method: The method to compute the powers, which is either
+        ``'power'``, ``'log'``, or ``'horner'``.
+    :type method: str
+
+    :param dtype: The data type of the evaluation.
+    :type dtype: numpy.dtype
+
+    :return: A function with the signature ``(t, powers)`` that writes the
+        powers of the one-dimensional array ``t`` to ``powers``.
+    :rtype: callable
+    """
+
+    if method not in ('power', 'log', 'horner'):
+        raise ValueError('"method" should be either "power", "log", or ' +
+                         '"horner".')
+
+    if method == 'horner':
+        plan = get_horner_plan(exponents)
+        workspace = []
+
+        def evaluator(t, powers):
+            # The work array of the largest block is reused by all blocks
+            if (not workspace) or (workspace[0].shape[1] < t.size):
+                workspace[:] = [numpy.empty((plan[1], t.size), dtype=dtype)]
+            evaluate_horner_powers(t, plan, powers,
+                                   workspace[0][:, :t.size])
+
+        return evaluator
+
+    exponents = [float(exponent) for exponent in exponents]
+
+    if method == 'log':
+        def evaluator(t, powers):
+            evaluate_log_powers(t, exponents, powers)
+    else:
+        def evaluator(t, powers):
+            evaluate_powers(t, exponents, powers)
+
+    return evaluator
+
+
+# ==================
+# Evaluate Functions
+# ==================
+
+@profiled('evaluate_functions')
+def evaluate_functions(
+        t,
+        exponents,
+        alpha,
+        coeffs,
+        out=None,
+        method='power',
+        expansions=None,
+        derivative=0):
+    """
+    Evaluates the orthonormal functions or their derivatives on an array of
+    points.
+
+    The powers :math:`t^{\\lambda_j}` are computed once for all functions and
+    then the functions are obtained by a single matrix product with the
+    matrix of :math:`\\alpha_i a_{ij}`. The points are processed in blocks, so
+    that the intermediate array of the powers does not grow with the number
+    of points. The ``'stable'`` method instead evaluates the Chebyshev
+    expansions of :func:`fit_chebyshev_expansions` on each block.
+
+    :param t: The points to evaluate the functions.
+    :type t: float or numpy.ndarray
+
+    :param exponents: The exponents :math:`\\lambda_j`.
+    :type exponents: list
+
+    :param alpha: The coefficients :math:`\\alpha_i`.
+    :type alpha: list
+
+    :param coeffs: The packed coefficients :math:`a_{ij}`, or the ragged list
+        of lists of the coefficients.
+    :type coeffs: TriangularCoeffs or list
+
+    :param out: Preallocated output array of the shape
+        ``(num_func, ) + t.shape``.
+    :type out: numpy.ndarray
+
+    :param method: The method of the evaluation, which is either
+        ``'power'``, ``'log'``, ``'horner'`` (see :func:`get_power_evaluator`),
+        or ``'stable'``.
+    :type method: str
+
+    :param expansions: The expansions of :func:`fit_chebyshev_expansions`,
+        which are required by the ``'stable'`` method.
+    :type expansions: dict
+
+    :param derivative: The order of the derivative of the functions.
+    :type derivative: int
+
+    :return: Values of the functions with the shape
+        ``(num_func, ) + t.shape``.
+    :rtype: numpy.ndarray
+    """
+
+    derivative = check_derivative(derivative)
+    t = numpy.asarray(t)
+    dtype = get_dtype(t, out)
+    num_func = len(coeffs)
+    shape = (num_func, ) + t.shape
+
+    if out is None:
+        out = numpy.empty(shape, dtype=dtype)
+    else:
+        check_output(out, shape, dtype)
+
+    t_flat = t.astype(dtype, copy=False).ravel()
+    out_flat = out.reshape(num_func, t_flat.size)
+    block_size = max(min(_BLOCK_SIZE, t_flat.size), 1)
+
+    evaluator = get_block_evaluator(exponents, alpha, coeffs, method, dtype,
+                                    block_size, expansions, derivative)
+    _evaluate_flat(t_flat, evaluator, block_size, out_flat)
+
+    return out
+
+
+# ===================
+# Integrate Functions
+# ===================
+
+@profiled('integrate_functions')
+def integrate_functions(
+        a,
+        b,
+        exponents,
+        alpha,
+        coeffs,
+        out=None,
+        method='power'):
+    """
+    Integrates the orthonormal functions with respect to
+    :math:`\\mathrm{d}t/t` on arrays of intervals.
+
+    The integral is the difference of the antiderivatives
+    :math:`\\sum_j \\alpha_i a_{ij} t^{\\lambda_j} / \\lambda_j` at the
+    ends of the intervals, which are evaluated as in
+    :func:`evaluate_functions` in blocks of points.
+
+    :param a: The lower ends of the intervals.
+    :type a: float or numpy.ndarray
+
+    :param b: The upper ends of the intervals. The arrays ``a`` and ``b`` are
+        broadcast against each other.
+    :type b: float or numpy.ndarray
+
+    :param exponents: The exponents :math:`\\lambda_j`.
+    :type exponents: list
+
+    :param alpha: The coefficients :math:`\\alpha_i`.
+    :type alpha: list
+
+    :param coeffs: The packed coefficients :math:`a_{ij}`, or the ragged list
+        of lists of the coefficients.
+    :type coeffs: TriangularCoeffs or list
+
+    :param out: Preallocated output array of the shape
+        ``(num_func, ) + shape``, where ``shape`` is the broadcast shape of
+        ``a`` and ``b``.
+    :type out: numpy.ndarray
+
+    :param method: The method of the evaluation of the powers, which is
+        either ``'power'``, ``'log'``, or ``'horner'``.
+    :type method: str
+
+    :return: The integrals with the shape ``(num_func, ) + shape``.
+    :rtype: numpy.ndarray
+    """
+
+    a, b = numpy.broadcast_arrays(numpy.asarray(a), numpy.asarray(b))
+    if out is not None:
+        dtype = check_dtype(out.dtype)
+    elif (a.dtype == numpy.float32) and (b.dtype == numpy.float32):
+        dtype = numpy.dtype(numpy.float32)
+    else:
+        dtype = numpy.dtype(numpy.float64)
+    num_func = len(coeffs)
+    shape = (num_func, ) + b.shape
+
+    if out is None:
+        out = numpy.empty(shape, dtype=dtype)
+    else:
+        check_output(out, shape, dtype)
+
+    a_flat = a.astype(dtype).ravel()
+    b_flat = b.astype(dtype).ravel()
+    out_flat = out.reshape(num_func, b_flat.size)
+    block_size = max(min(_BLOCK_SIZE, b_flat.size), 1)
+
+    evaluator = get_block_evaluator(exponents, alpha, coeffs, method, dtype,
+                                    block_size, derivative=-1)
+
+    # The antiderivatives at the lower ends are subtracted block by block
+    lower = numpy.empty((num_func, block_size), dtype=dtype)
+    for start in range(0, b_flat.size, block_size):
+        stop = min(start + block_size, b_flat.size)
+        block_lower = lower[:, :stop-start]
+        evaluator(b_flat[start:stop], out_flat[:, start:stop])
+        evaluator(a_flat[start:stop], block_lower)
+        numpy.subtract(out_flat[:, start:stop], block_lower,
+                       out=out_flat[:, start:stop])
+
+    return out
+
+
+# ====================
+# Synthesize Functions
+# ====================
+
+@profiled('synthesize_functions')
+def synthesize_functions(
+        c,
+        t,
+        exponents,
+        alpha,
+        coeffs,
+        out=None,
+        method='power',
+        expansions=None):
+    """
+    Evaluates the expansions :math:`\\sum_i c_i \\phi_i^{\\perp}(t)` on an
+    array of points.
+
+    The coefficients :math:`c_i` are first folded into the coefficients
+    :math:`b_j = \\sum_i c_i \\alpha_i a_{ij}` of the powers
+    :math:`t^{\\lambda_j}`, so that the values of the functions are never
+    formed. On each block of points, the powers are computed once for all
+    expansions, and the expansions are obtained by one matrix product of the
+    folded coefficients and the powers. The ``'stable'`` method instead
+    multiplies the coefficients by the values of the functions from the
+    Chebyshev expansions, since the folded coefficients cancel for many
+    functions.
+
+    :param c: The coefficients of one expansion of the shape
+        ``(num_func, )``, or of a batch of expansions of the shape
+        ``(num_expansions, num_func)``.
+    :type c: numpy.ndarray
+
+    :param t: The points to evaluate the expansions.
+    :type t: float or numpy.ndarray
+
+    :param exponents: The exponents :math:`\\lambda_j`.
+    :type exponents: list
+
+    :param alpha: The coefficients :math:`\\alpha_i`.
+    :type alpha: list
+
+    :param coeffs: The packed coefficients :math:`a_{ij}`, or the ragged list
+        of lists of the coefficients.
+    :type coeffs: TriangularCoeffs or list
+
+    :param out: Preallocated output array of the shape ``t.shape`` for one
+        expansion, or ``(num_expansions, ) + t.shape`` for a batch.
+    :type out: numpy.ndarray
+
+    :param method: The method of the evaluation. See
+        :func:`evaluate_functions`.
+    :type method: str
+
+    :param expansions: The expansions of :func:`fit_chebyshev_expansions`,
+        which are required by the ``'stable'`` method.
+    :type expansions: dict
+
+    :return: The values of the expansions.
+    :rtype: numpy.ndarray
+    """
+
+    num_func = len(coeffs)
+    c = numpy.asarray(c, dtype=numpy.float64)
+    if (c.ndim not in (1, 2)) or (c.shape[-1] != num_func):
+        raise ValueError('"c" should have the shape (%d, ) or ' % num_func +
+                         '(num_expansions, %d).' % num_func)
+
+    t = numpy.asarray(t)
+    dtype = get_dtype(t, out)
+    batch = c if c.ndim == 2 else c[numpy.newaxis, :]
+    num_expansions = batch.shape[0]
+    shape = (num_expansions, ) + t.shape if c.ndim == 2 else t.shape
+
+    if out is None:
+        out = numpy.empty(shape, dtype=dtype)
+    else:
+        check_output(out, shape, dtype)
+
+    t_flat = t.astype(dtype, copy=False).ravel()
+    out_flat = out.reshape(num_expansions, t_flat.size)
+    block_size = max(min(_BLOCK_SIZE, t_flat.size), 1)
+
+    if method == 'stable':
+        basis_evaluator = get_block_evaluator(exponents, alpha, coeffs,
+                                              method, dtype, block_size,
+                                              expansions)
+        folded = batch.astype(dtype)
+    else:
+        basis_evaluator = get_power_evaluator(exponents, method, dtype)
+        matrix = get_evaluation_matrix(alpha, coeffs, numpy.float64)
+        folded = (batch @ matrix).astype(dtype)
+
+    # The array of the powers (or of the functions) is reused by all blocks
+    basis = numpy.empty((num_func, block_size), dtype=dtype)
+
+    for start in range(0, t_flat.size, block_size):
+        stop = min(start + block_size, t_flat.size)
+        block_basis = basis[:, :stop-start]
+        basis_evaluator(t_flat[start:stop], block_basis)
+        numpy.matmul(folded, block_basis, out=out_flat[:, start:stop])
+
+    return out
+
+
+# ===================
+# Get Block Evaluator
+# ===================
+
+def get_block_evaluator(
+        exponents,
+        alpha,
+        coeffs,
+        method,
+        dtype,
+        block_size,
+        expansions=None,
+        derivative=0):
+    """
+    Function that evaluates the orthonormal functions or their derivatives on
+    a block of points.
+
+    :param exponents: The exponents :math:`\\lambda_j`.
+    :type exponents: list
+
+    :param alpha: The coefficients :math:`\\alpha_i`.
+    :type alpha: list
+
+    :param coeffs: The packed coefficients :math:`a_{ij}`, or the ragged list
+        of lists of the coefficients.
+    :type coeffs: TriangularCoeffs or list
+
+    :param method: The method of the evaluation. See
+        :func:`evaluate_functions`.
+    :type method: str
+
+    :param dtype: The data type of the evaluation.
+    :type dtype: numpy.dtype
+
+    :param block_size: The maximum number of points in a block.
+    :type block_size: int
+
+    :param expansions: The expansions of :func:`fit_chebyshev_expansions`,
+        which are required by the ``'stable'`` method.
+    :type expansions: dict
+
+    :param derivative: The order of the derivative, or ``-1`` for the
+        antiderivative with respect to :math:`\\mathrm{d}t/t` that vanishes at
+        zero (see :func:`get_derivative_scales`).
+    :type derivative: int
+
+    :return: A function with the signature ``(t, out)`` that writes the
+        values of the functions on the one-dimensional array ``t`` to the
+        array ``out`` of the shape ``(num_func, t.size)``.
+    :rtype: callable
+    """
+
+    if method not in _METHODS:
+        raise ValueError('"method" should be either "power", "log", ' +
+                         '"horner", or "stable".')
+
+    if method == 'stable':
+        if derivative != 0:
+            raise ValueError('The "stable" method does not evaluate the ' +
+                             'derivatives or the integrals of the functions.')
+        if expansions is None:
+            raise ValueError('The "stable" method requires the Chebyshev ' +
+                             'expansions of the functions.')
+
+        def evaluator(t, out):
+            evaluate_chebyshev_expansions(t, expansions, out)
+
+        return evaluator
+
+    matrix = get_evaluation_matrix(
+            alpha, coeffs, dtype,
+            scales=get_derivative_scales(exponents, derivative))
+    power_evaluator = get_power_evaluator(exponents, method, dtype)
+
+    # The array of the powers is reused by all blocks
+    powers = numpy.empty((matrix.shape[0], block_size), dtype=dtype)
+
+    if derivative <= 0:
+        def evaluator(t, out):
+            block_powers = powers[:, :t.size]
+            power_evaluator(t, block_powers)
+            numpy.matmul(matrix, block_powers, out=out)
+
+        return evaluator
+
+    # The factor t^(-k) of the derivatives is common to all functions
+    factors = numpy.empty((block_size, ), dtype=dtype)
+
+    def evaluator(t, out):
+        block_powers = powers[:, :t.size]
+        block_factors = factors[:t.size]
+        power_evaluator(t, block_powers)
+        numpy.matmul(matrix, block_powers, out=out)
+        with numpy.errstate(divide='ignore'):
+            numpy.power(t, -derivative, out=block_factors)
+        with numpy.errstate(invalid='ignore'):
+            numpy.multiply(out, block_factors, out=out)
+
+    return evaluator
+
+
+# =============
+# Evaluate Flat
+# =============
+
+def _evaluate_flat(t, evaluator, block_size, out):
+    """
+    Evaluates the functions on a one-dimensional array of points in blocks
+    of at most ``block_size`` points.
+    """
+
+    for start in range(0, t.size, block_size):
+        stop = min(start + block_size, t.size)
+        evaluator(t[start:stop], out[:, start:stop])
+
+
+# ==============
+# Iterate Chunks
+# ==============
+
+def _iterate_chunks(t, buffer):
+    """
+    Generates consecutive chunks of points with at most ``buffer.size``
+    points.
+
+    If ``t`` is a contiguous array (such as a memory-mapped array) of the
+    same dtype as the buffer, the chunks are views of the array. Otherwise,
+    the points are copied to the buffer, which is reused for all chunks,
+    without allocating an array for each chunk.
+    """
+
+    chunk_size = buffer.size
+
+    if isinstance(t, numpy.ndarray):
+
+        if t.flags.c_contiguous:
+            t_flat = t.reshape(-1)
+            for start in range(0, t.size, chunk_size):
+                if t.dtype == buffer.dtype:
+                    yield t_flat[start:start+chunk_size]
+                else:
+                    size = min(chunk_size, t.size - start)
+                    buffer[:size] = t_flat[start:start+size]
+                    yield buffer[:size]
+
+        else:
+            # The buffered iterator of numpy gathers the strided points in
+            # the C order to its own buffer, which is allocated once, and
+            # the gathered blocks are copied to the buffer.
+            with numpy.nditer(t, flags=['external_loop', 'buffered',
+                                        'zerosize_ok'],
+                              op_dtypes=[buffer.dtype], casting='unsafe',
+                              buffersize=chunk_size, order='C') as blocks:
+                yield from _iterate_chunks(blocks, buffer)
+
+    else:
+
+        # Fill the buffer from an iterable of scalars or arrays of points
+        size = 0
+        for item in t:
+
+            if numpy.isscalar(item):
+                buffer[size] = item
+                size += 1
+                if size == chunk_size:
+                    yield buffer
+                    size = 0
+                continue
+
+            item = numpy.asarray(item).reshape(-1)
+            start = 0
+            while start < item.size:
+                stop = min(start + chunk_size - size, item.size)
+                buffer[size:size+stop-start] = item[start:stop]
+                size += stop - start
+                start = stop
+                if size == chunk_size:
+                    yield buffer
+                    size = 0
+
+        if size > 0:
+            yield buffer[:size]
+
+
+# ========================
+# Evaluate Function Chunks
+# ========================
+
+def evaluate_function_chunks(
+        t,
+        exponents,
+        alpha,
+        coeffs,
+        chunk_size,
+        dtype=numpy.float64,
+        method='power',
+        expansions=None,
+        derivative=0):
+    """
+    Generates the values of the orthonormal functions or their derivatives
+    over consecutive chunks of points.
+
+    All arrays are allocated once before the first chunk and are reused for
+    all chunks, hence the memory is bounded by ``chunk_size`` regardless of
+    the total number of points.
+
+    :param t: The points to evaluate the functions. This can be an array
+        (such as a memory-mapped array) or an iterable of scalars or arrays.
+    :type t: numpy.ndarray or iterable
+
+    :param exponents: The exponents :math:`\\lambda_j`.
+    :type exponents: list
+
+    :param alpha: The coefficients :math:`\\alpha_i`.
+    :type alpha: list
+
+    :param coeffs: The packed coefficients :math:`a_{ij}`, or the ragged list
+        of lists of the coefficients.
+    :type coeffs: TriangularCoeffs or list
+
+    :param chunk_size: Maximum number of points in each chunk.
+    :type chunk_size: int
+
+    :param dtype: The data type of the evaluation.
+    :type dtype: numpy.dtype
+
+    :param method: The method of the evaluation. See
+        :func:`evaluate_functions`.
+    :type method: str
+
+    :param expansions: The expansions of :func:`fit_chebyshev_expansions`,
+        which are required by the ``'stable'`` method.
+    :type expansions: dict
+
+    :param derivative: The order of the derivative. See
+        :func:`evaluate_functions`.
+    :type derivative: int
+
+    :return: Generator of arrays of the shape ``(num_func, size)``, where
+        ``size`` is the number of points in each chunk. The arrays are views
+        of an internal buffer that is overwritten by the next chunk.
+    :rtype: generator
+    """
+
+    if (not isinstance(chunk_size, (int, numpy.integer))) or \
+            (chunk_size < 1):
+        raise ValueError('"chunk_size" should be a positive integer.')
+
+    dtype = check_dtype(dtype)
+    derivative = check_derivative(derivative)
+    evaluator = get_block_evaluator(exponents, alpha, coeffs, method, dtype,
+                                    min(_BLOCK_SIZE, chunk_size), expansions,
+                                    derivative)
+
+    return _generate_chunks(t, evaluator, len(coeffs), chunk_size, dtype)
+
+
+# ===============
+# Generate Chunks
+# ===============
+
+def _generate_chunks(t, evaluator, num_func, chunk_size, dtype):
+    """
+    Generator of :func:`evaluate_function_chunks`.
+    """
+
+    # Buffers that are reused for all chunks. The evaluator also reuses its
+    # array of the powers.
+    t_buffer = numpy.empty((chunk_size, ), dtype=dtype)
+    out_buffer = numpy.empty((num_func * chunk_size, ), dtype=dtype)
+    block_size = min(_BLOCK_SIZE, chunk_size)
+
+    for t_chunk in _iterate_chunks(t, t_buffer):
+        out = out_buffer[:num_func*t_chunk.size].reshape(num_func,
+                                                          t_chunk.size)
+        _evaluate_flat(t_chunk, evaluator, block_size, out)
+
+        yield out
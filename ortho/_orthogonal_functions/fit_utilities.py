@@ -0,0 +1,416 @@
+# SPDX-FileCopyrightText: Copyright 2021, Siavash Ameli <sameli@berkeley.edu>
+# SPDX-License-Identifier: BSD-3-Clause
+# SPDX-FileType: SOURCE
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the license found in the LICENSE.txt file in the root directory
+# of this source tree.
+
+
+# =======
+# Imports
+# =======
+
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import wait
+import numpy
+from .evaluation_utilities import evaluate_functions
+from .profile_utilities import profiled
+
+__all__ = ['TallSkinnyQR', 'get_batch', 'fit_samples']
+
+
+# ========
+# Reduce R
+# ========
+
+def _reduce_r(matrix):
+    """
+    Triangular factor :math:`\\mathbf{R}` of the QR factorization of a
+    matrix, padded with zero rows to a square matrix.
+    """
+
+    r = numpy.linalg.qr(matrix, mode='r')
+
+    if r.shape[0] < r.shape[1]:
+        r = numpy.vstack([r, numpy.zeros((r.shape[1] - r.shape[0],
+                                          r.shape[1]))])
+
+    return r
+
+
+# ==============
+# Tall Skinny QR
+# ==============
+
+class TallSkinnyQR(object):
+    """
+    Streaming least-squares by the tall-skinny QR factorization.
+
+    The rows of the design matrix :math:`\\mathbf{A}` and of the targets
+    :math:`\\mathbf{Y}` arrive in blocks. Only the triangular factor of the
+    QR factorization of the augmented matrix :math:`[\\mathbf{A} \\,
+    \\mathbf{Y}]` is kept, which is updated with each block by the QR
+    factorization of the factor stacked on the block.
+
+    Parameters
+    ----------
+
+        num_func : int
+            Number of the columns of the design matrix.
+
+        num_signals : int
+            Number of the columns of the targets.
+
+    Attributes
+    ----------
+
+        r : numpy.ndarray
+            The square upper triangular factor of the size ``num_func +
+            num_signals``.
+
+        num_points : int
+            Number of the rows that are accumulated.
+
+    Methods
+    -------
+    update
+    merge
+    solve
+
+    Notes
+    -----
+
+    With the factor
+
+    .. math::
+
+        \\mathbf{R} = \\begin{bmatrix} \\mathbf{R}_{11} & \\mathbf{R}_{12}
+        \\\\ \\mathbf{0} & \\mathbf{R}_{22} \\end{bmatrix},
+
+    the least-squares solution is :math:`\\mathbf{R}_{11}^{-1}
+    \\mathbf{R}_{12}`, and the residual sum of squares of the column
+    :math:`k` of the targets is the squared norm of the column :math:`k` of
+    :math:`\\mathbf{R}_{22}`. The factors of disjoint sets of rows are merged
+    by the QR factorization of the stacked factors, so the rows can be
+    factored in any order and on separate processes.
+    """
+
+    # ----
+    # Init
+    # ----
+
+    def __init__(self, num_func, num_signals):
+        """
+        Initializes an empty factor.
+        """
+
+        self.num_func = num_func
+        self.num_signals = num_signals
+        size = num_func + num_signals
+        self.r = numpy.zeros((size, size), dtype=numpy.float64)
+        self.num_points = 0
+
+    # ------
+    # Update
+    # ------
+
+    def update(self, design, targets):
+        """
+        Accumulates a block of rows.
+
+        Parameters
+        ----------
+
+            design : numpy.ndarray
+                The block of the design matrix of the shape ``(num_func,
+                size)``, where each column is one row of the design matrix.
+
+            targets : numpy.ndarray
+                The block of the targets of the shape ``(num_signals,
+                size)``.
+        """
+
+        block = numpy.hstack([design.T, targets.T])
+        self.r = _reduce_r(numpy.vstack([self.r, block]))
+        self.num_points += design.shape[1]
+
+    # -----
+    # Merge
+    # -----
+
+    def merge(self, r, num_points):
+        """
+        Merges the factor of another set of rows.
+
+        Parameters
+        ----------
+
+            r : numpy.ndarray
+                The factor of the other rows, such as the attribute ``r`` of
+                another :class:`TallSkinnyQR`.
+
+            num_points : int
+                The number of the other rows.
+        """
+
+        if r.shape != self.r.shape:
+            raise ValueError('The factors should have the same shape.')
+
+        self.r = _reduce_r(numpy.vstack([self.r, r]))
+        self.num_points += num_points
+
+    # -----
+    # Solve
+    # -----
+
+    def solve(self):
+        """
+        Least-squares solution of the accumulated rows.
+
+        Returns
+        -------
+
+            solution : numpy.ndarray
+                The solution of the shape ``(num_signals, num_func)``.
+
+            residuals : numpy.ndarray
+                The residual sum of squares of each signal.
+
+        Raises
+        ------
+
+            ValueError
+                If fewer rows than ``num_func`` are accumulated, or the
+                design matrix is rank deficient.
+        """
+
+        n = self.num_func
+        if self.num_points < n:
+            raise ValueError('At least %d points are required to fit ' % n +
+                             '%d functions.' % n)
+
+        r11 = self.r[:n, :n]
+        diagonal = numpy.abs(numpy.diag(r11))
+        if numpy.min(diagonal) <= \
+                n * numpy.finfo(numpy.float64).eps * numpy.max(diagonal):
+            raise ValueError('The design matrix is rank deficient. Use ' +
+                             'more distinct points or fewer functions.')
+
+        solution = numpy.linalg.solve(r11, self.r[:n, n:]).T
+        residuals = numpy.sum(self.r[n:, n:]**2, axis=0)
+
+        return solution, residuals
+
+
+# =========
+# Get Batch
+# =========
+
+def get_batch(samples, t):
+    """
+    Checks the samples and the points, and views one signal as a batch of one
+    signal.
+
+    :param samples: One signal of the shape ``(num_points, )`` or a batch of
+        signals of the shape ``(num_signals, num_points)``.
+    :type samples: numpy.ndarray
+
+    :param t: The points of the shape ``(num_points, )``.
+    :type t: numpy.ndarray
+
+    :return: The samples of the shape ``(num_signals, num_points)`` and the
+        points.
+    :rtype: tuple (numpy.ndarray, numpy.ndarray)
+
+    :raises ValueError: If the shapes do not match.
+    """
+
+    if not isinstance(samples, numpy.ndarray):
+        samples = numpy.asarray(samples, dtype=numpy.float64)
+    if not isinstance(t, numpy.ndarray):
+        t = numpy.asarray(t, dtype=numpy.float64)
+
+    if t.ndim != 1:
+        raise ValueError('"t" should be a one-dimensional array.')
+    if samples.ndim not in (1, 2):
+        raise ValueError('"samples" should be a one-dimensional or a ' +
+                         'two-dimensional array.')
+    if samples.shape[-1] != t.size:
+        raise ValueError('The last axis of "samples" should have the size ' +
+                         'of "t".')
+
+    if samples.ndim == 1:
+        samples = samples[numpy.newaxis, :]
+
+    return samples, t
+
+
+# ============
+# Worker State
+# ============
+
+# The functions that the blocks are fitted in, which are set once on each
+# process of the pool by :func:`_init_worker`.
+_worker_state = {}
+
+
+# ===========
+# Init Worker
+# ===========
+
+def _init_worker(exponents, alpha, coeffs, method, expansions):
+    """
+    Initializer of the processes of the pool, which keeps the functions on
+    the process, so that they are sent once per process rather than with
+    each block.
+    """
+
+    _worker_state['exponents'] = exponents
+    _worker_state['alpha'] = alpha
+    _worker_state['coeffs'] = coeffs
+    _worker_state['method'] = method
+    _worker_state['expansions'] = expansions
+
+
+# =========
+# Fit Block
+# =========
+
+def fit_block(t, samples):
+    """
+    Factor of the tall-skinny QR factorization of one block of points in the
+    functions that are set by :func:`_init_worker`. This is a module-level
+    function, so that it can run on a process pool.
+
+    :param t: The points of the block.
+    :type t: numpy.ndarray
+
+    :param samples: The samples of the shape ``(num_signals, size)``.
+    :type samples: numpy.ndarray
+
+    :return: The factor and the number of points.
+    :rtype: tuple (numpy.ndarray, int)
+    """
+
+    coeffs = _worker_state['coeffs']
+    design = evaluate_functions(t, _worker_state['exponents'],
+                                _worker_state['alpha'], coeffs,
+                                method=_worker_state['method'],
+                                expansions=_worker_state['expansions'])
+
+    factor = TallSkinnyQR(len(coeffs), samples.shape[0])
+    factor.update(design, samples)
+
+    return factor.r, factor.num_points
+
+
+# ==============
+# Iterate Blocks
+# ==============
+
+def _iterate_blocks(t, samples, chunk_size):
+    """
+    Generates the blocks of the points and of the samples as ``float64``
+    arrays. Only one block of a memory-mapped array is read at a time.
+    """
+
+    for start in range(0, t.size, chunk_size):
+        stop = min(start + chunk_size, t.size)
+        yield (numpy.asarray(t[start:stop], dtype=numpy.float64),
+               numpy.asarray(samples[:, start:stop], dtype=numpy.float64))
+
+
+# ===========
+# Fit Samples
+# ===========
+
+@profiled('fit_samples')
+def fit_samples(
+        factor,
+        t,
+        samples,
+        exponents,
+        alpha,
+        coeffs,
+        chunk_size=65536,
+        workers=None,
+        method='power',
+        expansions=None):
+    """
+    Accumulates the samples to the least-squares fit in the functions.
+
+    :param factor: The factor that accumulates the fit.
+    :type factor: TallSkinnyQR
+
+    :param t: The one-dimensional array of the points.
+    :type t: numpy.ndarray
+
+    :param samples: The samples of the shape ``(num_signals, t.size)``.
+    :type samples: numpy.ndarray
+
+    :param exponents: The exponents :math:`\\lambda_j`.
+    :type exponents: list
+
+    :param alpha: The coefficients :math:`\\alpha_i`.
+    :type alpha: list
+
+    :param coeffs: The packed coefficients :math:`a_{ij}`.
+    :type coeffs: TriangularCoeffs or list
+
+    :param chunk_size: Maximum number of points in each block.
+    :type chunk_size: int
+
+    :param workers: Number of processes to factor the blocks. If `None` or
+        one, the blocks are factored on the current process. Otherwise, at
+        most twice this number of blocks are in flight, and the factors are
+        merged as they complete.
+    :type workers: int
+
+    :param method: The method of the evaluation. See
+        :func:`evaluate_functions`.
+    :type method: str
+
+    :param expansions: The expansions of :func:`fit_chebyshev_expansions`,
+        which are required by the ``'stable'`` method.
+    :type expansions: dict
+
+    :raises ValueError: If ``chunk_size`` or ``workers`` is not a positive
+        integer.
+    """
+
+    if (not isinstance(chunk_size, (int, numpy.integer))) or \
+            (chunk_size < 1):
+        raise ValueError('"chunk_size" should be a positive integer.')
+
+    if workers is None:
+        workers = 1
+    if (not isinstance(workers, int)) or (workers < 1):
+        raise ValueError('"workers" should be a positive integer.')
+
+    blocks = _iterate_blocks(t, samples, chunk_size)
+
+    if workers == 1:
+        for t_block, samples_block in blocks:
+            design = evaluate_functions(t_block, exponents, alpha, coeffs,
+                                        method=method, expansions=expansions)
+            factor.update(design, samples_block)
+        return
+
+    # The number of pending blocks is bounded, so that the memory does not
+    # grow with the number of points. The functions are sent to each process
+    # once by the initializer, and only the blocks are sent with the tasks.
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(exponents, alpha, coeffs, method,
+                                       expansions)) as executor:
+        pending = set()
+        for t_block, samples_block in blocks:
+            if len(pending) >= 2 * workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    factor.merge(*future.result())
+            pending.add(executor.submit(fit_block, t_block, samples_block))
+
+        for future in pending:
+            factor.merge(*future.result())
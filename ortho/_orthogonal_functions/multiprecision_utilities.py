@@ -0,0 +1,227 @@
+# SPDX-FileCopyrightText: Copyright 2021, Siavash Ameli <sameli@berkeley.edu>
+# SPDX-License-Identifier: BSD-3-Clause
+# SPDX-FileType: SOURCE
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the license found in the LICENSE.txt file in the root directory
+# of this source tree.
+
+
+# =======
+# Imports
+# =======
+
+import math
+import numpy
+from .profile_utilities import profiled
+
+# mpmath is imported in the functions that use it, so that "import ortho"
+# does not load it.
+
+__all__ = ['get_integer_coeffs', 'get_working_precision', 'sum_powers',
+           'evaluate_multiprecision']
+
+# Extra bits of the working precision on top of the requested precision and
+# the bits that are lost by the cancellation of the sums.
+_GUARD_BITS = 64
+
+
+# ==================
+# Get Integer Coeffs
+# ==================
+
+def get_integer_coeffs(coeffs):
+    """
+    Integer numerators of the rows of the exact coefficients with a common
+    denominator for each row.
+
+    :param coeffs: The ragged list of lists of exact coefficients
+        :math:`a_{ij}`.
+    :type coeffs: list
+
+    :return: The ragged list of lists of the integer numerators and the list
+        of the denominators of the rows.
+    :rtype: tuple (list, list)
+    """
+
+    numerators = []
+    denominators = []
+
+    for row in coeffs:
+        denominator = math.lcm(*[coeff.denominator for coeff in row])
+        numerators.append([int(coeff * denominator) for coeff in row])
+        denominators.append(denominator)
+
+    return numerators, denominators
+
+
+# =====================
+# Get Working Precision
+# =====================
+
+def get_working_precision(numerators, bits):
+    """
+    Binary precision of the powers, so that the sums with the integer
+    coefficients are accurate to a given number of bits.
+
+    :param numerators: The ragged list of lists of integer coefficients.
+    :type numerators: list
+
+    :param bits: The number of accurate bits of the sums.
+    :type bits: int
+
+    :return: The working precision in bits.
+    :rtype: int
+    """
+
+    # The sums lose at most the bits of the sum of the absolute coefficients
+    max_bits = max(sum(abs(numerator) for numerator in row).bit_length()
+                   for row in numerators)
+
+    return bits + max_bits + _GUARD_BITS
+
+
+# ==========
+# Sum Powers
+# ==========
+
+def sum_powers(numerators, powers):
+    """
+    Sums :math:`\\sum_j n_{ij} p_j` of positive ``mpmath`` numbers
+    :math:`p_j` with the integer coefficients :math:`n_{ij}`.
+
+    The mantissas of the numbers are aligned to their smallest binary
+    exponent, so that the alternating sums are computed exactly by the
+    integers of Python, and the powers are shared by all rows.
+
+    :param numerators: The ragged list of lists of integer coefficients.
+    :type numerators: list
+
+    :param powers: The positive numbers :math:`p_j`.
+    :type powers: list
+
+    :return: The sums as ``mpmath.mpf`` numbers, rounded to the current
+        precision of ``mpmath``.
+    :rtype: list
+    """
+
+    import mpmath
+
+    common = min(int(power.exp) for power in powers)
+    aligned = [int(power.man) << (int(power.exp) - common)
+               for power in powers]
+
+    sums = []
+    for row in numerators:
+        total = sum(numerator * aligned_power
+                    for numerator, aligned_power in zip(row, aligned))
+        sums.append(mpmath.ldexp(mpmath.mpf(total), common))
+
+    return sums
+
+
+# =======================
+# Evaluate Multiprecision
+# =======================
+
+@profiled('evaluate_multiprecision')
+def evaluate_multiprecision(
+        t,
+        exponents,
+        alpha_squared,
+        alpha_sign,
+        coeffs,
+        interval,
+        precision):
+    """
+    Evaluates the orthonormal functions in arbitrary precision.
+
+    The functions :math:`\\phi_i(t) = \\alpha_i \\sum_j a_{ij}
+    (t/L)^{\\lambda_j}` are evaluated from the exact coefficients, where the
+    coefficients :math:`a_{ij}` are on the interval :math:`[0, 1]`. At each
+    point, the powers are computed once for all functions in a working
+    precision that absorbs the cancellation of the alternating sums, and the
+    sums are exact. Repeated points are evaluated once.
+
+    :param t: The points to evaluate the functions. Each point can be a
+        float, an integer, a string, or an ``mpmath.mpf`` number.
+    :type t: float or numpy.ndarray
+
+    :param exponents: The exponents :math:`\\lambda_j` as exact fractions.
+    :type exponents: list
+
+    :param alpha_squared: The exact squares of :math:`\\alpha_i`.
+    :type alpha_squared: list
+
+    :param alpha_sign: The signs of :math:`\\alpha_i`.
+    :type alpha_sign: list
+
+    :param coeffs: The exact coefficients :math:`a_{ij}` on the interval
+        :math:`[0, 1]`.
+    :type coeffs: list
+
+    :param interval: The interval of the domain of the functions in the form
+        ``[Start, End]``.
+    :type interval: list
+
+    :param precision: The number of significant decimal digits.
+    :type precision: int
+
+    :return: Array of ``mpmath.mpf`` numbers with the shape
+        ``(num_func, ) + t.shape``.
+    :rtype: numpy.ndarray
+    """
+
+    import mpmath
+
+    if (not isinstance(precision, (int, numpy.integer))) or (precision < 1):
+        raise ValueError('"precision" should be a positive integer.')
+
+    t = numpy.asarray(t, dtype=object)
+    num_func = len(coeffs)
+    out = numpy.empty((num_func, ) + t.shape, dtype=object)
+    out_flat = out.reshape(num_func, t.size)
+
+    numerators, denominators = get_integer_coeffs(coeffs)
+    bits = int(math.ceil(precision * math.log2(10)))
+    prec = get_working_precision(numerators, bits)
+
+    with mpmath.workprec(prec):
+
+        end = mpmath.mpf(interval[1])
+        exponents = [mpmath.mpf(exponent.numerator) / exponent.denominator
+                     for exponent in exponents]
+        alpha = [sign * mpmath.sqrt(mpmath.mpf(square.numerator) /
+                                    square.denominator) / denominator
+                 for square, sign, denominator in
+                 zip(alpha_squared, alpha_sign, denominators)]
+
+        values = {}
+        for k, point in enumerate(t.ravel()):
+
+            # Scalars of numpy are not accepted by mpmath
+            if isinstance(point, numpy.generic):
+                point = point.item()
+
+            if point not in values:
+                point_mp = mpmath.mpf(point)
+                if point_mp < 0:
+                    raise ValueError('The points should be non-negative.')
+
+                if point_mp == 0:
+                    values[point] = [mpmath.mpf(0)] * num_func
+                else:
+                    # The powers are shared by all functions
+                    log_ratio = mpmath.log(point_mp / end)
+                    powers = [mpmath.exp(exponent * log_ratio)
+                              for exponent in exponents]
+                    sums = sum_powers(numerators, powers)
+
+                    # Round the values to the requested precision
+                    with mpmath.workprec(bits):
+                        values[point] = [+(a * total) for a, total in
+                                         zip(alpha, sums)]
+
+            out_flat[:, k] = values[point]
+
+    return out
@@ -11,12 +11,59 @@
 # Imports
 # =======
 
-from .orthogonalization_utilities import gram_schmidt_process
-from .orthogonalization_utilities import print_coeffs_of_functions
-from .orthogonalization_utilities import check_mutual_orthonormality
-from .orthogonalization_utilities import get_symbolic_coeffs
-from .orthogonalization_utilities import get_numeric_coeffs
-from .plot_functions import plot_functions
+import contextlib
+import functools
+from concurrent.futures import ProcessPoolExecutor
+import numpy
+from .rational_utilities import get_exponents
+from .rational_utilities import get_muntz_exponents
+from .rational_utilities import gram_matrix
+from .rational_utilities import rational_gram_schmidt_process
+from .rational_utilities import rational_cholesky_process
+from .rational_utilities import rational_product_process
+from .rational_utilities import get_rational_coeffs
+from .rational_utilities import get_rational_vectors
+from .rational_utilities import get_rational_symbolic_functions
+from .rational_utilities import get_rational_numeric_coeffs
+from .rational_utilities import get_rational_coeffs_from_symbolic
+from .cache_utilities import get_cache_dir
+from .cache_utilities import get_cache_key
+from .cache_utilities import load_cache_entry
+from .cache_utilities import save_cache_entry
+from .cache_utilities import serialize_rational
+from .cache_utilities import deserialize_rational
+from .quadrature_utilities import check_numeric_orthonormality
+from .chebyshev_utilities import fit_chebyshev_expansions
+from .multiprecision_utilities import evaluate_multiprecision
+from .table_utilities import save_table
+from .table_utilities import load_table
+from .table_utilities import decode_rational
+from .triangular_utilities import TriangularCoeffs
+from .profile_utilities import Profiler
+from .evaluation_utilities import evaluate_functions
+from .evaluation_utilities import integrate_functions
+from .evaluation_utilities import synthesize_functions
+from .evaluation_utilities import evaluate_function_chunks
+from .projection_utilities import project_samples
+from .fit_utilities import TallSkinnyQR
+from .fit_utilities import get_batch
+from .fit_utilities import fit_samples
+
+# The modules that depend on sympy and matplotlib, namely
+# orthogonalization_utilities and plot_functions, are imported in the methods
+# that use them, so that "import ortho" and the numeric evaluation do not load
+# these packages.
+
+# Methods to generate the functions
+_METHODS = ['gram-schmidt', 'cholesky', 'product', 'symbolic']
+
+# Default parameters of the sets of functions of OrthogonalFunctions.batch
+_BATCH_DEFAULTS = {
+    'start_index': 1,
+    'num_func': 9,
+    'end_interval': 1,
+    'method': 'gram-schmidt',
+}
 
 
 # ====================
@@ -48,6 +95,57 @@ class OrthogonalFunctions(object):
                 phi_2(t) =  sqrt(6)*(5*x**(1/3) - 6*sqrt(x))/3
                 phi_3(t) =  sqrt(2)*(21*x**(1/4) - 40*x**(1/3) + 20*sqrt(x))/2
 
+        method : {'gram-schmidt', 'cholesky', 'product', 'symbolic'}, \
+                default='gram-schmidt'
+            The method to generate the orthonormal functions:
+
+            * ``'gram-schmidt'``: Gram-Schmidt process on the exact rational
+              coefficients of the functions. The inner products are computed
+              from the closed-form Gram matrix, hence no symbolic integration
+              is performed.
+            * ``'cholesky'``: Exact rational
+              :math:`\\mathbf{L} \\mathbf{D} \\mathbf{L}^{\\intercal}`
+              factorization of the closed-form Gram matrix. This method gives
+              the same functions as ``'gram-schmidt'``.
+            * ``'product'``: Exact rational coefficients by the product
+              formula of the orthogonal functions, where each coefficient is
+              obtained from the coefficient of the previous function by one
+              product. This method gives the same functions as
+              ``'gram-schmidt'`` and is the fastest for a large number of
+              functions.
+            * ``'symbolic'``: Gram-Schmidt process on ``sympy`` expressions
+              with symbolic integration. This method is much slower and is
+              mainly used as a reference. The integrals are computed on
+              :math:`[0, 1]`, and the functions on :math:`[0, L]` are
+              obtained by the substitution of :math:`t/L`.
+
+        cache_dir : str, default=None
+            Directory of a persistent cache of the functions. If the cache
+            contains the functions with the same ``start_index``,
+            ``num_func``, ``method`` and package version, they are loaded
+            instead of being computed. Otherwise, they are computed and
+            stored in the cache. The cache holds the functions on
+            :math:`[0, 1]`, which are rescaled to any ``end_interval``. If
+            `None`, the environment variable ``ORTHO_CACHE_DIR`` is used if
+            it is set, and the cache is disabled otherwise. The total size
+            of the cache is bounded by the environment variable
+            ``ORTHO_CACHE_MAX_SIZE`` in bytes (256 MB by default) by evicting
+            the least recently used entries.
+
+        workers : int, default=None
+            Number of processes to compute the symbolic integrals of the
+            ``'symbolic'`` method in parallel. If `None`, the integrals are
+            computed in the current process. This option does not affect the
+            other methods, which do not integrate.
+
+        profile : bool, default=False
+            If `True`, the wall time and the number of calls of each phase of
+            the computations (such as ``inner_product``, ``simplify``,
+            ``normalize``, ``get_symbolic_coeffs`` and
+            ``get_numeric_coeffs``) are recorded in :attr:`profiler` during
+            the construction and the calls of :meth:`extend` and
+            :meth:`check`.
+
     Attributes
     ----------
 
@@ -60,11 +158,36 @@ class OrthogonalFunctions(object):
         sym_coeffs : sympy obj
             Coefficients :math:`a_{i,j}`
 
-        alpha : list
-            Coefficients :math:`\\alpha_i`
+            .. note::
 
-        coeffs : list of lists
-            Coefficients :math:`a_{i,j}`
+                Except for the ``'symbolic'`` method, the symbolic attributes
+                ``sym_phi``, ``sym_alpha`` and ``sym_coeffs`` are built on
+                their first access, and ``sympy`` is not imported until then.
+
+        alpha : list
+            Coefficients :math:`\\alpha_i`. For the functions of
+            :meth:`load`, this is the read-only array of the table until the
+            functions are extended.
+
+        coeffs : TriangularCoeffs
+            Coefficients :math:`a_{i,j}`. The rows are packed in a
+            contiguous ``float64`` array, ``coeffs.numeric``, and an array of
+            the exact rational values on :math:`[0, 1]`, ``coeffs.exact``,
+            whose columns are scaled by the exact factors
+            :math:`L^{-\\lambda_j}` on :math:`[0, L]`. The object behaves as
+            a list of the rows, and ``coeffs.tolist()`` gives the exact rows.
+
+        beta : int or fractions.Fraction
+            The exponent :math:`\\beta` of the weight function
+            :math:`t^{\\beta - 1}`, which is zero except for the functions
+            of :meth:`from_exponents`.
+
+        profiler : ortho.Profiler
+            The records of the phases of the computations if ``profile`` is
+            `True`, and `None` otherwise. Use ``profiler.report()`` for a
+            structured report or ``profiler.print()`` to print it. See also
+            :class:`ortho.Profiler` to profile the computations in a context
+            manager, including with :mod:`cProfile`.
 
     Notes
     -----
@@ -99,9 +222,55 @@ class OrthogonalFunctions(object):
     functions are generated by `Gram-Schmidt orthogonalization process
     <https://en.wikipedia.org/wiki/Gram%E2%80%93Schmidt_process>`__.
 
+    With the exponents :math:`\\lambda_j = 1/(j+1)`, the functions are
+    Muntz-Legendre type functions with the product formula
+
+    .. math::
+
+        \\phi_i^{\\perp}(t) = \\frac{\\alpha_i}{2 \\pi \\mathrm{i}} \\oint
+        \\frac{\\prod_{j=i_0}^{i-1} (z + \\lambda_j)}{\\prod_{j=i_0}^{i}
+        (z - \\lambda_j)} \\left(\\frac{t}{L}\\right)^z \\mathrm{d}z,
+
+    where the contour encloses the exponents, and :math:`\\alpha_i^2 = 2
+    \\lambda_i`. The residues are the coefficients :math:`a_{ij}`, which
+    gives the recurrence
+    :math:`(\\lambda_j - \\lambda_i) a_{ij} = (\\lambda_j + \\lambda_{i-1})
+    a_{i-1,j}` of the ``'product'`` method, or equivalently,
+
+    .. math::
+
+        \\left(t \\frac{\\mathrm{d}}{\\mathrm{d}t} - \\lambda_i \\right)
+        \\frac{\\phi_i^{\\perp}}{\\alpha_i} = \\left(t
+        \\frac{\\mathrm{d}}{\\mathrm{d}t} + \\lambda_{i-1} \\right)
+        \\frac{\\phi_{i-1}^{\\perp}}{\\alpha_{i-1}}.
+
+    Also, :math:`\\phi_i^{\\perp}(L) = \\alpha_i`. There is no three-term
+    recurrence of the values of the functions at a point, since the product
+    of a function with :math:`t^{\\lambda_1 - \\lambda_0}` is not in the span
+    of the next functions. Hence, :meth:`evaluate` computes the powers
+    :math:`t^{\\lambda_j}` once per point and combines them with a matrix
+    product.
+
+    The functions of arbitrary exponents :math:`\\lambda_j` that are
+    orthonormal with respect to the weight :math:`t^{\\beta - 1}` are
+    generated by :meth:`from_exponents`.
+
     Methods
     -------
+    extend
+    save
+    load
+    batch
+    from_exponents
+    evaluate
+    evaluate_chunks
+    integrate
+    synthesize
+    project
+    fit
+    partial_fit
     check
+    check_numeric
     print
     plot
     """
@@ -115,7 +284,11 @@ class OrthogonalFunctions(object):
             start_index=1,
             num_func=9,
             end_interval=1,
-            verbose=False):
+            verbose=False,
+            method='gram-schmidt',
+            cache_dir=None,
+            workers=None,
+            profile=False):
         """
         Parses the user inputs and sets the member data of the object.
         """
@@ -125,6 +298,9 @@ class OrthogonalFunctions(object):
         self.start_index = start_index
         self.end_interval = end_interval
         self.verbose = verbose
+        self.method = method
+        self.workers = workers
+        self.profiler = Profiler() if profile else None
 
         # Check arguments
         if self.num_func < 1:
@@ -136,21 +312,315 @@ class OrthogonalFunctions(object):
         if end_interval <= 0.0:
             print('"end_interval" should be greater than zero.')
             exit(1)
+        if method not in _METHODS:
+            raise ValueError('"method" should be either "gram-schmidt", ' +
+                             '"cholesky", "product", or "symbolic".')
 
         # interval
         self._interval = [0, end_interval]
 
-        # Generate list of functions
-        self._phi_orthonormalized_list = self._process()
-        self.sym_phi = self._phi_orthonormalized_list
+        # Exponents of the non-orthogonal functions and of the weight
+        self._exponents = get_exponents(self.num_func, self.start_index)
+        self._shifted_exponents = self._exponents
+        self._custom_exponents = False
+        self.beta = 0
+
+        # Load the functions from the cache, or compute and cache them
+        self._cache_dir = get_cache_dir(cache_dir)
+        with self._profiling():
+            if not self._load_cache():
+                self._reset()
+                self._compute()
+                self._save_cache()
+
+    # -------
+    # Sym phi
+    # -------
+
+    @property
+    def sym_phi(self):
+        """
+        Symbolic orthonormal functions. For the exact rational methods, the
+        symbolic functions are built on the first access.
+        """
+
+        self._build_symbolic()
+        return self._sym_phi
+
+    # ---------
+    # Sym alpha
+    # ---------
+
+    @property
+    def sym_alpha(self):
+        """
+        Symbolic coefficients :math:`\\alpha_i`.
+        """
+
+        self._build_symbolic()
+        return self._sym_alpha
+
+    # ----------
+    # Sym coeffs
+    # ----------
+
+    @property
+    def sym_coeffs(self):
+        """
+        Symbolic coefficients :math:`a_{ij}`.
+        """
+
+        self._build_symbolic()
+        return self._sym_coeffs
+
+    # --------------
+    # Build symbolic
+    # --------------
+
+    def _build_symbolic(self):
+        """
+        Builds the symbolic functions and coefficients from the exact
+        rational coefficients, if they are not built yet.
+        """
+
+        if self._sym_phi is not None:
+            return
+
+        self._decode_table()
+        with self._profiling():
+            self._sym_alpha, self._sym_coeffs, self._sym_phi = \
+                get_rational_symbolic_functions(
+                    self._shifted_exponents, self._alpha_squared,
+                    self._alpha_sign, self._rational_coeffs, self._interval,
+                    powers=self._exponents)
+
+    # ---------
+    # Profiling
+    # ---------
+
+    def _profiling(self):
+        """
+        Context manager that records the phases of the computations in the
+        profiler, if profiling is enabled.
+        """
+
+        if self.profiler is None:
+            return contextlib.nullcontext()
+
+        return self.profiler
+
+    # -------
+    # Compute
+    # -------
+
+    def _compute(self):
+        """
+        Computes the orthonormal functions and their coefficients that are
+        not computed yet.
+        """
+
+        start = len(self.alpha)
+
+        if self.method == 'symbolic':
+
+            from .orthogonalization_utilities import get_symbolic_coeffs
+            from .orthogonalization_utilities import get_numeric_coeffs
+
+            # Generate list of functions on [0, 1]
+            unit = (self.end_interval == 1)
+            sym_phi = self._process(verbose=(self.verbose and unit))
+
+            # Get coeffs of symbolic functions
+            sym_alpha, sym_coeffs = get_symbolic_coeffs(
+                    sym_phi, self.start_index, start=start)
+
+            if unit:
+
+                # Get numeric values of coefficients
+                alpha, coeffs = get_numeric_coeffs(sym_alpha, sym_coeffs)
+
+                self._sym_alpha = self.sym_alpha + sym_alpha
+                self._sym_coeffs = self.sym_coeffs + sym_coeffs
+                self._sym_phi = sym_phi
+                self.alpha = list(self.alpha) + alpha
+                self.coeffs.extend(
+                        coeffs, exponents=self._shifted_exponents[start:])
 
-        # Get coeffs of symbolic functions
-        self.sym_alpha, self.sym_coeffs = get_symbolic_coeffs(
-                self._phi_orthonormalized_list, self.start_index)
+            else:
+
+                # Since the weight dt/t is invariant under scaling, the
+                # functions on [0, L] are the functions on [0, 1] at t/L.
+                # The coefficients on [0, 1] are rational, and are scaled to
+                # [0, L] without a further integration.
+                self._append_rational_functions(
+                        *get_rational_coeffs_from_symbolic(sym_alpha,
+                                                           sym_coeffs))
+
+        else:
+
+            # Exact rational coefficients of the functions
+            self._append_rational_functions(*self._rational_process(start))
+
+    # -------------------------
+    # Append rational functions
+    # -------------------------
+
+    def _append_rational_functions(self, alpha_squared, alpha_sign, coeffs):
+        """
+        Appends the numeric functions of the given exact rational
+        coefficients. The symbolic functions are appended only if they are
+        already built, otherwise, they are built on their first access.
+        """
+
+        start = len(self.alpha)
+
+        self._alpha_squared += alpha_squared
+        self._alpha_sign += alpha_sign
+        self._rational_coeffs += coeffs
 
         # Get numeric values of coefficients
-        self.alpha, self.coeffs = get_numeric_coeffs(
-                self.sym_alpha, self.sym_coeffs)
+        alpha, numeric_coeffs = get_rational_numeric_coeffs(
+                self._shifted_exponents, alpha_squared, alpha_sign, coeffs,
+                self._interval)
+
+        # The exact coefficients are kept on [0, 1], and only the numeric
+        # coefficients are scaled to the interval
+        self.alpha = list(self.alpha) + alpha
+        self.coeffs.extend(coeffs, numeric=numeric_coeffs,
+                           exponents=self._shifted_exponents[start:])
+
+        # Get symbolic functions and coeffs
+        if self._sym_phi is not None:
+            sym_alpha, sym_coeffs, sym_phi = get_rational_symbolic_functions(
+                    self._shifted_exponents, alpha_squared, alpha_sign,
+                    coeffs, self._interval, powers=self._exponents)
+
+            self._sym_alpha += sym_alpha
+            self._sym_coeffs += sym_coeffs
+            self._sym_phi += sym_phi
+
+        if self.verbose:
+            self._print_functions(start=start)
+
+    # -----------
+    # Reset lists
+    # -----------
+
+    def _reset(self):
+        """
+        Empties the lists of the functions and their coefficients. The
+        symbolic functions are not built until they are accessed.
+        """
+
+        self._sym_phi = None
+        self._sym_alpha = None
+        self._sym_coeffs = None
+        self.alpha = []
+        self.coeffs = TriangularCoeffs(end=self.end_interval)
+        self._alpha_squared = []
+        self._alpha_sign = []
+        self._rational_coeffs = []
+        self._expansions = None
+        self._least_squares = None
+        self._table = None
+
+    # ------------
+    # Decode table
+    # ------------
+
+    def _decode_table(self):
+        """
+        Decodes the exact rational coefficients of the functions that are
+        loaded from a table, on their first use.
+        """
+
+        if self._table is None:
+            return
+
+        self._alpha_squared, self._rational_coeffs = \
+            decode_rational(self._table)
+        self._table = None
+
+    # --------------
+    # Get parameters
+    # --------------
+
+    def _get_parameters(self):
+        """
+        The parameters that determine the functions.
+        """
+
+        return {
+            'start_index': int(self.start_index),
+            'num_func': int(self.num_func),
+            'end_interval': float(self.end_interval),
+            'method': self.method,
+        }
+
+    # -------------
+    # Get cache key
+    # -------------
+
+    def _get_cache_key(self):
+        """
+        Content address of the functions in the cache. The entries hold the
+        exact coefficients on the interval :math:`[0, 1]`, which are scaled
+        to the interval of the functions, hence the address does not depend
+        on ``end_interval``.
+        """
+
+        parameters = self._get_parameters()
+        del parameters['end_interval']
+
+        return get_cache_key(parameters)
+
+    # ----------
+    # Load cache
+    # ----------
+
+    def _load_cache(self):
+        """
+        Loads the functions from the cache. Returns `False` if the cache is
+        disabled or does not contain the functions.
+        """
+
+        if self._cache_dir is None:
+            return False
+
+        entry = load_cache_entry(self._cache_dir, self._get_cache_key())
+        if entry is None:
+            return False
+
+        # The functions are rebuilt from the exact coefficients on [0, 1],
+        # which are scaled to the interval of the functions.
+        self._reset()
+        self._append_rational_functions(*deserialize_rational(entry))
+
+        return True
+
+    # ----------
+    # Save cache
+    # ----------
+
+    def _save_cache(self):
+        """
+        Saves the functions to the cache, if the cache is enabled.
+        """
+
+        if self._cache_dir is None:
+            return
+
+        if len(self._rational_coeffs) == self.num_func:
+            entry = serialize_rational(self._alpha_squared, self._alpha_sign,
+                                       self._rational_coeffs)
+
+        else:
+            # The symbolic coefficients on [0, 1] are rational, and the
+            # functions are the same as the functions of the other methods.
+            entry = serialize_rational(*get_rational_coeffs_from_symbolic(
+                self.sym_alpha, self.sym_coeffs))
+
+        save_cache_entry(self._cache_dir, self._get_cache_key(), entry)
 
     # -------
     # Process
@@ -158,23 +628,1372 @@ class OrthogonalFunctions(object):
 
     def _process(self, verbose=False):
         """
-        Computes the set of orthonormalized functions.
+        Computes the set of orthonormalized functions on the interval
+        :math:`[0, 1]`.
         """
 
-        # Generate a list of symbolic orthonormal functions
+        from .orthogonalization_utilities import gram_schmidt_process
+
+        # Functions on [0, 1] that are already generated
+        if self.end_interval == 1:
+            phi_orthonormalized_list = self.sym_phi
+        else:
+            _, _, phi_orthonormalized_list = get_rational_symbolic_functions(
+                    self._exponents, self._alpha_squared, self._alpha_sign,
+                    self._rational_coeffs, [0, 1])
+
+        # Generate a list of symbolic orthonormal functions, continued from
+        # the functions that are already generated
         phi_orthonormalized_list = gram_schmidt_process(
                 self.num_func,
                 self.start_index,
-                self._interval,
-                verbose=verbose)
+                [0, 1],
+                verbose=verbose,
+                phi_orthonormalized_list=phi_orthonormalized_list,
+                workers=self.workers)
 
         return phi_orthonormalized_list
 
+    # ----------------
+    # Rational Process
+    # ----------------
+
+    def _rational_process(self, start=0):
+        """
+        Computes the exact rational coefficients of the orthonormalized
+        functions from the index ``start``. The process is continued from the
+        coefficients of the functions before ``start``. With the weight
+        :math:`t^{\\beta - 1}`, the Gram matrix is the Gram matrix of the
+        weight :math:`t^{-1}` in the shifted exponents, which are used by
+        the processes that do not form the matrix.
+        """
+
+        # Orthogonal vectors of the functions that are already computed
+        vectors, norms = get_rational_vectors(
+                self._shifted_exponents, self._rational_coeffs[:start])
+
+        if self.method == 'cholesky':
+
+            # Factorize the Gram matrix of the functions on [0, 1]
+            vectors, norms = rational_cholesky_process(
+                    self._shifted_exponents, vectors, norms)
+
+        elif self.method == 'product':
+
+            # Recurrence of the product formula of the functions on [0, 1]
+            vectors, norms = rational_product_process(
+                    self._shifted_exponents, vectors, norms)
+
+        else:
+
+            # Exact Gram matrix of the non-orthogonal functions on [0, 1]
+            gram = gram_matrix(self._exponents, beta=self.beta)
+
+            # Orthogonalize the coefficient vectors of the functions
+            vectors, norms = rational_gram_schmidt_process(
+                    gram, vectors, norms)
+
+        return get_rational_coeffs(self._shifted_exponents, vectors, norms,
+                                   start=start)
+
+    # ----------------------
+    # Get Rational Functions
+    # ----------------------
+
+    def _get_rational_functions(self):
+        """
+        Exact rational coefficients of all functions on the interval
+        :math:`[0, 1]`, namely, the squares and the signs of
+        :math:`\\alpha_i` and the coefficients :math:`a_{ij}`.
+        """
+
+        self._decode_table()
+        if len(self._rational_coeffs) == self.num_func:
+            return self._alpha_squared, self._alpha_sign, \
+                self._rational_coeffs
+
+        # The symbolic method does not keep the exact rational coefficients,
+        # which are computed by the product formula.
+        vectors, norms = rational_product_process(self._shifted_exponents)
+        return get_rational_coeffs(self._shifted_exponents, vectors, norms)
+
+    # ------------------------
+    # Get Chebyshev Expansions
+    # ------------------------
+
+    def _get_chebyshev_expansions(self):
+        """
+        Chebyshev expansions of the functions for the stable evaluation. The
+        expansions are fitted on the first call and are kept until the
+        functions are extended.
+        """
+
+        # The expansions assume that the leading power of each function is
+        # the smallest power, which holds for the default exponents only.
+        if self._custom_exponents:
+            raise ValueError('The "stable" method is not available for ' +
+                             'custom exponents.')
+
+        if self._expansions is None:
+            self._expansions = fit_chebyshev_expansions(
+                    self._exponents, *self._get_rational_functions(),
+                    self._interval)
+
+        return self._expansions
+
+    # ---------------
+    # Print Functions
+    # ---------------
+
+    def _print_functions(self, start=0):
+        """
+        Prints the orthonormalized functions from the index ``start``.
+        """
+
+        print('---------------------')
+        print('Orthogonal functions:')
+        print('---------------------')
+        print('')
+
+        for i in range(start, self.num_func):
+            print('phi_%d(t) = ' % (i+self.start_index))
+            print(self.sym_phi[i])
+            print('')
+
+    # ------
+    # Extend
+    # ------
+
+    def extend(self, num_func=1):
+        """
+        Appends orthonormal functions to the set of functions.
+
+        Parameters
+        ----------
+
+            num_func : int, default=1
+                Number of functions to append.
+
+        Notes
+        -----
+
+        The orthonormalization is continued from the existing functions,
+        which are not recomputed. Hence, extending a set of :math:`n`
+        functions by :math:`k` functions only computes the :math:`k` new
+        functions, and gives the same functions as constructing :math:`n+k`
+        functions from the start. ``start_index``, ``end_interval`` and
+        ``method`` remain the same.
+
+        If a cache is enabled, the extended set of functions is loaded from
+        the cache if it exists, and is stored in the cache otherwise.
+
+        Examples
+        --------
+
+        .. code-block:: python
+
+            >>> from ortho import OrthogonalFunctions
+            >>> OF = OrthogonalFunctions(num_func=9)
+            >>> OF.extend(3)
+            >>> OF.num_func
+            12
+        """
+
+        if (not isinstance(num_func, int)) or (num_func < 1):
+            raise ValueError('"num_func" should be a positive integer.')
+        if self._custom_exponents:
+            raise ValueError('The functions of custom exponents cannot be ' +
+                             'extended. Use "from_exponents" with all ' +
+                             'exponents.')
+
+        self._decode_table()
+        self.num_func += num_func
+        self._exponents = get_exponents(self.num_func, self.start_index)
+        self._shifted_exponents = self._exponents
+        self._expansions = None
+        self._least_squares = None
+
+        with self._profiling():
+            if not self._load_cache():
+                self._compute()
+                self._save_cache()
+
+    # ----
+    # Save
+    # ----
+
+    def save(self, path):
+        """
+        Saves the coefficients of the functions to a binary table.
+
+        Parameters
+        ----------
+
+            path : str
+                The path of the file. The file is an uncompressed ``.npz``
+                file that can also be read by :func:`numpy.load`.
+
+        See Also
+        --------
+
+        load
+
+        Notes
+        -----
+
+        The table contains :math:`\\alpha_i` and the coefficients
+        :math:`a_{ij}` as ``float64`` arrays, where the rows of
+        :math:`a_{ij}` are packed contiguously, the exact rational
+        coefficients as the bytes of their integer numerators and
+        denominators, and the parameters of the functions with the version
+        of the format.
+
+        Examples
+        --------
+
+        .. code-block:: python
+
+            >>> from ortho import OrthogonalFunctions
+            >>> OF = OrthogonalFunctions(num_func=9)
+            >>> OF.save('ortho.npz')
+        """
+
+        if self._custom_exponents:
+            raise ValueError('The functions of custom exponents cannot be ' +
+                             'saved.')
+
+        # An integer interval is kept as integer, so that the loaded symbolic
+        # functions remain exact
+        parameters = self._get_parameters()
+        if isinstance(self.end_interval, (int, numpy.integer)):
+            parameters['end_interval'] = int(self.end_interval)
+
+        # The exact coefficients also determine the numeric coefficients of
+        # the symbolic method
+        alpha_squared, alpha_sign, coeffs = self._get_rational_functions()
+        alpha, numeric_coeffs = get_rational_numeric_coeffs(
+                self._exponents, alpha_squared, alpha_sign, coeffs,
+                self._interval)
+
+        with self._profiling():
+            save_table(path, parameters, alpha_squared,
+                       alpha_sign, coeffs, alpha, numeric_coeffs)
+
+    # ----
+    # Load
+    # ----
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        """
+        Loads the functions from a binary table of :meth:`save`.
+
+        Parameters
+        ----------
+
+            path : str
+                The path of the file.
+
+            mmap : bool, default=True
+                If `True`, the arrays of the table are memory-mapped
+                read-only rather than read into memory, so that the processes
+                that load the same table share its pages.
+
+        Returns
+        -------
+
+            OF : ortho.OrthogonalFunctions
+                The functions with the parameters of the table.
+
+        Raises
+        ------
+
+            ValueError
+                If the file is not a table of the functions or its format
+                version is not supported.
+
+        See Also
+        --------
+
+        save
+
+        Notes
+        -----
+
+        The numeric coefficients :attr:`alpha` and :attr:`coeffs` are used
+        from the arrays of the table without a copy. The exact rational
+        coefficients are only decoded on their first use, such as by the
+        symbolic attributes, ``coeffs.exact``, :meth:`extend` or the
+        ``precision`` of :meth:`evaluate`. Hence, neither ``sympy`` nor the
+        orthogonalization is used, and the processes that memory-map the
+        same table share its pages. The loaded functions do not use the
+        cache.
+
+        Examples
+        --------
+
+        .. code-block:: python
+
+            >>> from ortho import OrthogonalFunctions
+            >>> OF = OrthogonalFunctions.load('ortho.npz')
+            >>> OF.num_func
+            9
+        """
+
+        table = load_table(path, mmap=mmap)
+        OF = cls._from_parameters(table['parameters'])
+
+        # The numeric coefficients are used from the table without a copy,
+        # and the exact coefficients are decoded on their first use.
+        OF.alpha = table['alpha']
+        OF._alpha_sign = table['alpha_sign'].tolist()
+        OF._table = table
+        OF.coeffs = TriangularCoeffs(
+                numeric=table['coeffs'], end=OF.end_interval,
+                exponents=OF._shifted_exponents,
+                decode=functools.partial(_decode_table_coeffs, table))
+
+        return OF
+
+    # -------------
+    # From Rational
+    # -------------
+
+    @classmethod
+    def _from_rational(cls, parameters, alpha_squared, alpha_sign, coeffs):
+        """
+        Functions of the given parameters that are built from their exact
+        rational coefficients on the interval :math:`[0, 1]`. Neither the
+        orthogonalization nor the cache is used.
+        """
+
+        OF = cls._from_parameters(parameters)
+        OF._append_rational_functions(alpha_squared, alpha_sign, coeffs)
+
+        return OF
+
+    # ---------------
+    # From Parameters
+    # ---------------
+
+    @classmethod
+    def _from_parameters(cls, parameters):
+        """
+        An empty set of functions of the given parameters, without the
+        orthogonalization and the cache.
+        """
+
+        OF = cls.__new__(cls)
+        OF.num_func = parameters['num_func']
+        OF.start_index = parameters['start_index']
+        OF.end_interval = parameters['end_interval']
+        OF.verbose = False
+        OF.method = parameters['method']
+        OF.workers = None
+        OF.profiler = None
+        OF._interval = [0, OF.end_interval]
+        OF._exponents = get_exponents(OF.num_func, OF.start_index)
+        OF._shifted_exponents = OF._exponents
+        OF._custom_exponents = False
+        OF.beta = 0
+        OF._cache_dir = None
+        OF._reset()
+
+        return OF
+
+    # --------------
+    # From Exponents
+    # --------------
+
+    @classmethod
+    def from_exponents(
+            cls,
+            exponents,
+            beta=0,
+            end_interval=1,
+            method='gram-schmidt',
+            verbose=False,
+            profile=False):
+        """
+        Generates the orthonormal functions of arbitrary exponents and
+        weight.
+
+        Parameters
+        ----------
+
+            exponents : list
+                The distinct positive exponents :math:`\\lambda_j` of the
+                non-orthogonal functions :math:`\\phi_j(t) =
+                t^{\\lambda_j}`, in the order of the orthogonalization. The
+                exponents can be integers, fractions, strings such as
+                ``'1/3'``, or floats, which are converted to the fractions of
+                their exact binary values.
+
+            beta : int, float, fractions.Fraction or str, default=0
+                The exponent :math:`\\beta` of the weight function
+                :math:`w(t) = t^{\\beta - 1}`. The default is the weight
+                :math:`t^{-1}` of :class:`ortho.OrthogonalFunctions`.
+
+            end_interval : float, default=1
+                The end of the interval :math:`[0, L]`.
+
+            method : {'gram-schmidt', 'cholesky', 'product'}
+                The exact rational process to orthonormalize the functions,
+                which is ``'gram-schmidt'`` by default. The ``'symbolic'``
+                method is not available.
+
+            verbose : bool, default=False
+                If `True`, prints the functions.
+
+            profile : bool, default=False
+                If `True`, the phases of the computations are recorded in
+                :attr:`profiler`.
+
+        Returns
+        -------
+
+            OF : ortho.OrthogonalFunctions
+                The functions :math:`\\phi_i^{\\perp}`, which are indexed
+                from zero. The attribute ``beta`` is the exponent of the
+                weight as a fraction.
+
+        Raises
+        ------
+
+            ValueError
+                If the exponents are not distinct and positive, if
+                :math:`2 \\lambda_j + \\beta \\leq 0`, or if the method is
+                not valid.
+
+        Notes
+        -----
+
+        The Gram matrix has the closed form
+
+        .. math::
+
+            \\int_0^L t^{\\lambda_i} t^{\\lambda_j} t^{\\beta - 1}
+            \\mathrm{d}t = \\frac{L^{\\lambda_i + \\lambda_j +
+            \\beta}}{\\lambda_i + \\lambda_j + \\beta},
+
+        hence the functions are computed in exact rational arithmetic
+        without ``sympy``. The matrix is a Cauchy matrix in the shifted
+        exponents :math:`x_j = \\lambda_j + \\beta/2`, and the functions
+        are the Muntz-Legendre functions of the shifted exponents times
+        :math:`t^{-\\beta/2}`. Thus, :math:`\\alpha_i^2 = 2 x_i`, and the
+        ``'cholesky'`` and ``'product'`` methods also apply.
+
+        The functions are evaluated, integrated, projected and fitted as the
+        functions of the default exponents, where :meth:`project` uses the
+        weight :math:`t^{\\beta - 1}` and :meth:`integrate` the measure
+        :math:`\\mathrm{d}t/t`. The functions cannot be extended, saved or
+        cached, the ``'stable'`` method of the evaluation is not available,
+        and ``precision`` is only available for :math:`\\beta = 0`.
+
+        Examples
+        --------
+
+        The orthonormal polynomials with the weight :math:`w(t) = 1` on
+        :math:`[0, 1]` are the shifted Legendre polynomials, here without
+        the constant:
+
+        .. code-block:: python
+
+            >>> from ortho import OrthogonalFunctions
+            >>> OF = OrthogonalFunctions.from_exponents([1, 2, 3], beta=1)
+            >>> OF.sym_phi[1]
+            sqrt(5)*(4*t**2 - 3*t)
+            >>> OF.check(mode='numeric')
+            True
+        """
+
+        if method not in _METHODS[:-1]:
+            raise ValueError('"method" should be either "gram-schmidt", ' +
+                             '"cholesky", or "product".')
+        if end_interval <= 0.0:
+            raise ValueError('"end_interval" should be greater than zero.')
+
+        exponents, beta, shifted_exponents = \
+            get_muntz_exponents(exponents, beta=beta)
+
+        OF = cls.__new__(cls)
+        OF.num_func = len(exponents)
+        OF.start_index = 0
+        OF.end_interval = end_interval
+        OF.verbose = verbose
+        OF.method = method
+        OF.workers = None
+        OF.profiler = Profiler() if profile else None
+        OF._interval = [0, end_interval]
+        OF._exponents = exponents
+        OF._shifted_exponents = shifted_exponents
+        OF._custom_exponents = True
+        OF.beta = beta
+        OF._cache_dir = None
+
+        with OF._profiling():
+            OF._reset()
+            OF._compute()
+
+        return OF
+
+    # -----
+    # Batch
+    # -----
+
+    @classmethod
+    def batch(cls, params_list, workers=None):
+        """
+        Generates the functions of many sets of parameters.
+
+        Parameters
+        ----------
+
+            params_list : list of dict
+                The parameters of each set of functions. The keys of each
+                dictionary are ``start_index``, ``num_func``,
+                ``end_interval`` and ``method`` with the same meaning and
+                default values as the parameters of
+                :class:`ortho.OrthogonalFunctions`.
+
+            workers : int, default=None
+                Number of processes to generate the distinct sets of
+                functions in parallel. If `None`, they are generated in the
+                current process.
+
+        Returns
+        -------
+
+            OFs : list of ortho.OrthogonalFunctions
+                The functions of each set of parameters in the order of
+                ``params_list``.
+
+        Raises
+        ------
+
+            ValueError
+                If a dictionary has an unknown key or an invalid parameter.
+
+        Notes
+        -----
+
+        Since the weight :math:`\\mathrm{d}t/t` is invariant under scaling,
+        the functions on :math:`[0, L]` are the functions on :math:`[0, 1]`
+        at :math:`t/L`, and the first :math:`n` functions of a larger set
+        are the functions of :math:`n`. Hence, the exact coefficients are
+        computed once for each pair of ``start_index`` and ``method`` on
+        :math:`[0, 1]` for the largest ``num_func`` of the pair, and each set
+        of functions is built from them by scaling, without a further
+        orthogonalization. The cache is used to compute each pair, but the
+        returned sets are not stored in the cache.
+
+        Examples
+        --------
+
+        .. code-block:: python
+
+            >>> from ortho import OrthogonalFunctions
+            >>> OFs = OrthogonalFunctions.batch([
+            ...     {'num_func': 9, 'end_interval': 1},
+            ...     {'num_func': 12, 'end_interval': 2},
+            ...     {'num_func': 6, 'start_index': 0}])
+            >>> [OF.num_func for OF in OFs]
+            [9, 12, 6]
+        """
+
+        if workers is None:
+            workers = 1
+        if (not isinstance(workers, int)) or (workers < 1):
+            raise ValueError('"workers" should be a positive integer.')
+
+        params_list = [_get_batch_parameters(params) for params in params_list]
+
+        # Largest number of functions of each start index and method
+        groups = {}
+        for params in params_list:
+            key = (params['start_index'], params['method'])
+            groups[key] = max(groups.get(key, 0), params['num_func'])
+        groups = list(groups.items())
+
+        if workers == 1:
+            results = [_compute_rational_functions(group) for group in groups]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(_compute_rational_functions,
+                                            groups))
+        results = dict(zip([key for key, _ in groups], results))
+
+        OFs = []
+        for params in params_list:
+            alpha_squared, alpha_sign, coeffs = \
+                results[(params['start_index'], params['method'])]
+            num_func = params['num_func']
+            OFs.append(cls._from_rational(
+                params, alpha_squared[:num_func], alpha_sign[:num_func],
+                coeffs[:num_func]))
+
+        return OFs
+
+    # --------
+    # Evaluate
+    # --------
+
+    def evaluate(self, t, out=None, method='power', precision=None,
+                 derivative=0):
+        """
+        Evaluates the orthonormal functions or their derivatives.
+
+        Parameters
+        ----------
+
+            t : float or numpy.ndarray
+                Points :math:`t \\geq 0` where the functions are evaluated.
+                The array can have any shape.
+
+            out : numpy.ndarray, default=None
+                Preallocated C-contiguous array of the shape
+                ``(num_func, ) + t.shape`` to store the output. Its dtype
+                should be either ``float32`` or ``float64`` and determines
+                the precision of the evaluation. If `None`, a new array is
+                allocated with the dtype of ``t`` if ``t`` is ``float32``,
+                or ``float64`` otherwise.
+
+            method : {'power', 'log', 'horner', 'stable'}, default='power'
+                The method of the evaluation. The first three methods differ
+                in how the powers :math:`t^{\\lambda_j}`, where
+                :math:`\\lambda_j = \\frac{1}{j+1}`, are computed:
+
+                * ``'power'``: one power of ``t`` for each exponent.
+                * ``'log'``: one logarithm of ``t`` and one exponential
+                  :math:`e^{\\lambda_j \\log t}` for each exponent.
+                * ``'horner'``: one fractional power :math:`s = t^{1/M}`,
+                  where :math:`M` is the least common multiple of the
+                  denominators of the exponents, and the integer powers
+                  :math:`t^{\\lambda_j} = s^{M \\lambda_j}` by repeated
+                  multiplications.
+
+                The ``'stable'`` method does not sum the powers. Rather, it
+                evaluates the piecewise Chebyshev expansions of the
+                functions in :math:`\\log t`, which are fitted to the exact
+                coefficients on the first call. This method is accurate to
+                near the machine precision for a large number of functions,
+                but ``t`` should be in the interval :math:`[0, L]`.
+
+            precision : int, default=None
+                If given, the functions are evaluated with ``mpmath`` to this
+                number of significant decimal digits from the exact
+                coefficients, and ``out`` and ``method`` are not used. The
+                points can also be strings or ``mpmath.mpf`` numbers to pass
+                them in more than double precision. This is much slower than
+                the other methods and is meant as a reference.
+
+            derivative : int, default=0
+                The order :math:`k` of the derivative
+                :math:`\\mathrm{d}^k \\phi_i^{\\perp} / \\mathrm{d} t^k`
+                to evaluate. The derivatives are computed in closed form from
+                the numeric coefficients by the ``'power'``, ``'log'`` and
+                ``'horner'`` methods, and are not finite at :math:`t = 0`.
+
+        Returns
+        -------
+
+            out : numpy.ndarray
+                Array of the shape ``(num_func, ) + t.shape``, where
+                ``out[i]`` is the function :math:`\\phi_{i_0+i}^{\\perp}`
+                (or its derivative) evaluated at ``t``. If ``precision`` is
+                given, the array has the ``object`` dtype with ``mpmath.mpf``
+                elements.
+
+        Notes
+        -----
+
+        The powers :math:`t^{\\frac{1}{j+1}}` are computed once for all
+        functions and the functions are obtained by one matrix product with
+        the numeric coefficients :math:`\\alpha_i a_{ij}`. As the
+        coefficients :math:`a_{ij}` alternate in sign and grow with the
+        number of functions, ``float32`` is only accurate for a few
+        functions.
+
+        The methods differ in the relative error :math:`\\delta` of the
+        powers. With the unit round-off :math:`u`, the error of
+        :math:`\\phi_i(t)` is bounded by
+        :math:`\\delta \\sum_j |\\alpha_i a_{ij}| t^{\\lambda_j}`, which is
+        mostly due to the cancellation in the sum rather than the powers:
+
+        * ``'power'``: :math:`\\delta \\approx u`.
+        * ``'log'``: :math:`\\delta \\approx (1 + \\lambda_j |\\log t|) u`,
+          which is at most a few hundred :math:`u` near the smallest
+          ``float64`` numbers.
+        * ``'horner'``: :math:`\\delta \\approx M \\lambda_j u`, where
+          :math:`M \\lambda_j` is at most :math:`M / (i_0 + 1)`. Since
+          :math:`M` grows exponentially with the number of functions, this
+          method raises an error if the largest power exceeds
+          :math:`2^{22}`, which is for more than 15 functions with
+          :math:`i_0 = 1`. Also, this method is not accurate in
+          ``float32``.
+
+        The following are the wall times relative to ``'power'`` (larger is
+        faster) and the maximum absolute errors against the exact
+        coefficients in 60-digit arithmetic, measured with ``float64`` on
+        :math:`10^6` points in :math:`[0, 1]` with :math:`i_0 = 1`.
+
+        =========  ================  ================  ================
+        num_func   ``'power'``       ``'log'``         ``'horner'``
+        =========  ================  ================  ================
+        5          1.00, 8.6e-14     1.35, 9.2e-14     1.18, 1.8e-13
+        9          1.00, 8.0e-11     1.38, 7.5e-11     0.94, 1.3e-10
+        12         1.00, 1.7e-08     1.43, 1.7e-08     0.81, 4.1e-08
+        15         1.00, 2.1e-06     1.39, 2.2e-06     0.93, 6.6e-06
+        =========  ================  ================  ================
+
+        The ``'log'`` method benefits from the vectorized exponential of
+        numpy. The ``'horner'`` method trades the powers for about three
+        multiplications per function, which only pays off for a few
+        functions.
+
+        The round-off of the above methods grows with the coefficients
+        :math:`a_{ij}`, and the functions are not accurate for more than
+        about 15 functions. The ``'stable'`` method avoids the cancellation
+        as follows. In the variable :math:`s = -\\log(t/L)`, each function
+        is written as :math:`\\phi_i(t) = \\psi_i(s) p_i / (p_i +
+        \\epsilon_i)`, where :math:`p_i = (t/L)^{\\lambda_i}` and
+        :math:`\\epsilon_i = 1 / \\vert \\alpha_i a_{ii} \\vert`. The
+        function :math:`\\psi_i` is of the order of one and is smooth on the
+        dyadic intervals :math:`[0, 1], [1, 2], [2, 4], \\dots` of
+        :math:`s`, on which it is interpolated at Chebyshev nodes with the
+        exact values that are computed from the exact coefficients in
+        multi-precision arithmetic. The following are measured as above,
+        where the fit is the one-time cost of the first call.
+
+        =========  ================  ================  ==========
+        num_func   ``'power'``       ``'stable'``      fit (s)
+        =========  ================  ================  ==========
+        9          1.00, 9.3e-11     0.31, 1.5e-15     0.17
+        15         1.00, 2.7e-06     0.41, 1.4e-15     0.42
+        20         1.00, 1.2e-02     0.54, 7.8e-16     0.53
+        30         1.00, 3.3e+05     0.48, 6.7e-16     0.87
+        50         1.00, 4.5e+20     0.40, 1.9e-15     1.84
+        =========  ================  ================  ==========
+
+        With ``precision``, the powers :math:`(t/L)^{\\lambda_j}` of each
+        point are computed once for all functions in a working precision
+        that adds the number of bits of :math:`\\sum_j \\vert a_{ij}
+        \\vert` to the requested precision, and the alternating sums are
+        exact sums of integers. No ``sympy`` expression is evaluated, which
+        is several times faster than evaluating :attr:`sym_phi` with
+        ``mpmath``.
+
+        The derivative of the order :math:`k` is
+
+        .. math::
+
+            \\frac{\\mathrm{d}^k \\phi_i^{\\perp}}{\\mathrm{d} t^k}(t) =
+            t^{-k} \\alpha_i \\sum_j a_{ij} (\\lambda_j)_k t^{\\lambda_j},
+
+        where :math:`(\\lambda_j)_k = \\lambda_j (\\lambda_j - 1) \\cdots
+        (\\lambda_j - k + 1)`. Hence, the derivatives use the same powers
+        and one matrix product as the functions, with no ``sympy``
+        expression.
+
+        Examples
+        --------
+
+        .. code-block:: python
+
+            >>> import numpy
+            >>> from ortho import OrthogonalFunctions
+            >>> OF = OrthogonalFunctions(num_func=9)
+            >>> t = numpy.linspace(0, 1, 10**6)
+            >>> phi = OF.evaluate(t)
+            >>> phi.shape
+            (9, 1000000)
+
+        Evaluate the functions with 50 significant digits:
+
+        .. code-block:: python
+
+            >>> import mpmath
+            >>> phi = OF.evaluate(['0.1', '0.5'], precision=50)
+            >>> mpmath.nstr(phi[8, 0], 50)
+            '0.047304009618126531043301143230321120351267547305939'
+
+        Evaluate the first derivatives of the functions:
+
+        .. code-block:: python
+
+            >>> dphi = OF.evaluate(t[1:], derivative=1)
+        """
+
+        if precision is not None:
+            if derivative != 0:
+                raise ValueError('"derivative" cannot be used with ' +
+                                 '"precision".')
+            if out is not None:
+                raise ValueError('"out" cannot be used with "precision".')
+            if self.beta != 0:
+                raise ValueError('"precision" is not available for a ' +
+                                 'weight other than 1/t.')
+            return evaluate_multiprecision(
+                    t, self._exponents, *self._get_rational_functions(),
+                    self._interval, precision)
+
+        if method == 'stable':
+            expansions = self._get_chebyshev_expansions()
+        else:
+            expansions = None
+
+        return evaluate_functions(t, self._exponents, self.alpha,
+                                  self.coeffs, out=out, method=method,
+                                  expansions=expansions,
+                                  derivative=derivative)
+
+    # ---------------
+    # Evaluate Chunks
+    # ---------------
+
+    def evaluate_chunks(self, t, chunk_size=65536, dtype=numpy.float64,
+                        method='power', derivative=0):
+        """
+        Evaluates the orthonormal functions or their derivatives over
+        consecutive chunks of points.
+
+        Parameters
+        ----------
+
+            t : numpy.ndarray or iterable
+                Points :math:`t \\geq 0` where the functions are evaluated.
+                This can be an array of any shape, including a memory-mapped
+                array, or an iterable (such as a generator) of scalars or
+                arrays of points. Arrays are flattened in C order.
+
+            chunk_size : int, default=65536
+                Maximum number of points in each chunk.
+
+            dtype : {numpy.float32, numpy.float64}, default=numpy.float64
+                The precision of the evaluation.
+
+            method : {'power', 'log', 'horner', 'stable'}, default='power'
+                The method of the evaluation. See :meth:`evaluate`.
+
+            derivative : int, default=0
+                The order of the derivative. See :meth:`evaluate`.
+
+        Returns
+        -------
+
+            chunks : generator
+                Generator of arrays of the shape ``(num_func, size)``, where
+                ``size`` is the number of points in the chunk and is equal to
+                ``chunk_size`` except for the last chunk.
+
+        See Also
+        --------
+
+        evaluate
+
+        Notes
+        -----
+
+        The buffers of the points, the powers of the points, and the output
+        are allocated once and are reused for all chunks. Hence, the memory
+        is bounded by ``chunk_size`` and does not depend on the total number
+        of points.
+
+        .. warning::
+
+            Each generated array is a view of an internal buffer that is
+            overwritten by the next chunk. Copy the array if it should be
+            kept.
+
+        Examples
+        --------
+
+        .. code-block:: python
+
+            >>> import numpy
+            >>> from ortho import OrthogonalFunctions
+            >>> OF = OrthogonalFunctions(num_func=9)
+            >>> t = numpy.memmap('t.dat', dtype=numpy.float64, mode='r')
+            >>> total = numpy.zeros(9)
+            >>> for phi in OF.evaluate_chunks(t, chunk_size=10**6):
+            ...     total += phi.sum(axis=1)
+        """
+
+        if method == 'stable':
+            expansions = self._get_chebyshev_expansions()
+        else:
+            expansions = None
+
+        return evaluate_function_chunks(t, self._exponents, self.alpha,
+                                        self.coeffs, chunk_size, dtype=dtype,
+                                        method=method, expansions=expansions,
+                                        derivative=derivative)
+
+    # ---------
+    # Integrate
+    # ---------
+
+    def integrate(self, a, b, out=None, method='power'):
+        """
+        Integrates the orthonormal functions with respect to the weight
+        :math:`\\mathrm{d}t/t`.
+
+        Parameters
+        ----------
+
+            a : float or numpy.ndarray
+                Lower ends :math:`a \\geq 0` of the intervals.
+
+            b : float or numpy.ndarray
+                Upper ends :math:`b \\geq 0` of the intervals. The arrays
+                ``a`` and ``b`` are broadcast against each other and can
+                have any shape.
+
+            out : numpy.ndarray, default=None
+                Preallocated C-contiguous array of the shape
+                ``(num_func, ) + shape`` to store the output, where ``shape``
+                is the broadcast shape of ``a`` and ``b``. Its dtype should
+                be either ``float32`` or ``float64``. If `None`, a new array
+                is allocated with the dtype ``float32`` if both ``a`` and
+                ``b`` are ``float32``, or ``float64`` otherwise.
+
+            method : {'power', 'log', 'horner'}, default='power'
+                The method to compute the powers. See :meth:`evaluate`.
+
+        Returns
+        -------
+
+            out : numpy.ndarray
+                Array of the shape ``(num_func, ) + shape``, where
+                ``out[i]`` is the integral of
+                :math:`\\phi_{i_0+i}^{\\perp}(t) / t` from ``a`` to ``b``.
+
+        See Also
+        --------
+
+        evaluate
+
+        Notes
+        -----
+
+        The integrals are computed in closed form from the numeric
+        coefficients by
+
+        .. math::
+
+            \\int_a^b \\phi_i^{\\perp}(t) \\frac{\\mathrm{d}t}{t} =
+            \\alpha_i \\sum_j \\frac{a_{ij}}{\\lambda_j}
+            \\left( b^{\\lambda_j} - a^{\\lambda_j} \\right),
+
+        where the powers of the ends of the intervals are computed once for
+        all functions. The integrals from :math:`0` to :math:`L` are the
+        inner products of the functions with :math:`1`.
+
+        Examples
+        --------
+
+        .. code-block:: python
+
+            >>> import numpy
+            >>> from ortho import OrthogonalFunctions
+            >>> OF = OrthogonalFunctions(num_func=9)
+            >>> t = numpy.linspace(0, 1, 11)
+            >>> integrals = OF.integrate(t[:-1], t[1:])
+            >>> integrals.shape
+            (9, 10)
+        """
+
+        return integrate_functions(a, b, self._exponents, self.alpha,
+                                   self.coeffs, out=out, method=method)
+
+    # ----------
+    # Synthesize
+    # ----------
+
+    def synthesize(self, c, t, out=None, method='power'):
+        """
+        Evaluates expansions in the orthonormal functions.
+
+        Parameters
+        ----------
+
+            c : numpy.ndarray
+                The coefficients :math:`c_i` of one expansion of the shape
+                ``(num_func, )``, or of a batch of expansions of the shape
+                ``(num_expansions, num_func)``, such as the output of
+                :meth:`project` or :meth:`fit`.
+
+            t : float or numpy.ndarray
+                Points :math:`t \\geq 0` where the expansions are
+                evaluated. The array can have any shape.
+
+            out : numpy.ndarray, default=None
+                Preallocated C-contiguous array of the shape ``t.shape`` for
+                one expansion, or ``(num_expansions, ) + t.shape`` for a
+                batch. Its dtype should be either ``float32`` or ``float64``.
+                If `None`, a new array is allocated as in :meth:`evaluate`.
+
+            method : {'power', 'log', 'horner', 'stable'}, default='power'
+                The method of the evaluation. See :meth:`evaluate`.
+
+        Returns
+        -------
+
+            out : numpy.ndarray
+                The values :math:`\\sum_i c_i \\phi_{i_0+i}^{\\perp}(t)` of
+                the shape ``t.shape`` for one expansion, or
+                ``(num_expansions, ) + t.shape`` for a batch.
+
+        See Also
+        --------
+
+        evaluate
+        project
+        fit
+
+        Notes
+        -----
+
+        The coefficients are first folded through the triangular table of
+        :math:`\\alpha_i a_{ij}` into the coefficients of the powers,
+
+        .. math::
+
+            \\sum_i c_i \\phi_i^{\\perp}(t) = \\sum_j b_j t^{\\lambda_j},
+            \\qquad b_j = \\sum_{i \\geq j} c_i \\alpha_i a_{ij}.
+
+        Hence, each point needs only the powers :math:`t^{\\lambda_j}`,
+        which are computed once for all expansions, and the values of the
+        functions are never formed. For a batch, the expansions on each
+        block of points are one matrix product of the folded coefficients
+        and the powers. With the ``'stable'`` method, the coefficients are
+        not folded, and the functions are evaluated instead.
+
+        Examples
+        --------
+
+        .. code-block:: python
+
+            >>> import numpy
+            >>> from ortho import OrthogonalFunctions
+            >>> OF = OrthogonalFunctions(num_func=9)
+            >>> t = numpy.logspace(-300, 0, 10**5)
+            >>> c = OF.project(numpy.sqrt(t), t)
+            >>> f = OF.synthesize(c, t)
+            >>> f.shape
+            (100000,)
+        """
+
+        if method == 'stable':
+            expansions = self._get_chebyshev_expansions()
+        else:
+            expansions = None
+
+        return synthesize_functions(c, t, self._exponents, self.alpha,
+                                    self.coeffs, out=out, method=method,
+                                    expansions=expansions)
+
+    # -------
+    # Project
+    # -------
+
+    def project(self, samples, t_grid, method='power'):
+        """
+        Projects sampled signals onto the orthonormal functions.
+
+        Parameters
+        ----------
+
+            samples : numpy.ndarray
+                One signal of the shape ``(num_points, )``, or a batch of
+                signals of the shape ``(num_signals, num_points)``, where
+                each row is a signal sampled on ``t_grid``. This can be a
+                memory-mapped array.
+
+            t_grid : numpy.ndarray
+                One-dimensional grid of ``num_points`` points in
+                :math:`(0, L]`, which is strictly increasing. A grid that is
+                uniform in :math:`\\log t`, such as ``numpy.logspace``,
+                gives the most accurate projections.
+
+            method : {'power', 'log', 'horner', 'stable'}, default='power'
+                The method of the evaluation of the functions on the grid.
+                See :meth:`evaluate`.
+
+        Returns
+        -------
+
+            projections : numpy.ndarray
+                The inner products :math:`\\langle f,
+                \\phi_{i_0+i}^{\\perp} \\rangle` of the shape
+                ``(num_func, )`` for one signal, or ``(num_signals,
+                num_func)`` for a batch of signals.
+
+        See Also
+        --------
+
+        evaluate
+        integrate
+
+        Notes
+        -----
+
+        The inner products with the weight :math:`1/t` are integrals in
+        :math:`s = \\log t`,
+
+        .. math::
+
+            \\langle f, \\phi_i^{\\perp} \\rangle = \\int_0^L f(t)
+            \\phi_i^{\\perp}(t) \\frac{\\mathrm{d}t}{t} =
+            \\int_{-\\infty}^{\\log L} f(e^s) \\phi_i^{\\perp}(e^s)
+            \\mathrm{d}s,
+
+        which are computed by the trapezoidal rule in :math:`s` on the grid.
+        The integral on :math:`[0, t_0]` below the first point of the grid
+        is added in closed form with :math:`f` held at :math:`f(t_0)`.
+
+        Since the functions decay as :math:`t^{\\lambda_i}` near zero,
+        where :math:`\\lambda_i = 1/(i+1)`, the grid should start at a
+        point :math:`t_0` where :math:`\\phi_i^{\\perp}(t_0)` is
+        negligible, such as ``numpy.logspace(-300, 0, num_points)``. Even
+        then, the functions beyond about 20 do not decay within the range of
+        ``float64``, and their projections are not accurate.
+
+        The grid is processed in blocks of a fixed number of points. The
+        functions on a block are evaluated once for all signals, are scaled
+        by the weights of the quadrature, and are accumulated to the
+        projections by one matrix product over the batch of signals. Hence,
+        the memory does not depend on the number of points, and the
+        ``(num_func, num_points)`` matrix of the functions is never formed.
+
+        Examples
+        --------
+
+        .. code-block:: python
+
+            >>> import numpy
+            >>> from ortho import OrthogonalFunctions
+            >>> OF = OrthogonalFunctions(num_func=9)
+            >>> t = numpy.logspace(-12, 0, 10**5)
+            >>> samples = numpy.vstack([numpy.sqrt(t), t**2])
+            >>> projections = OF.project(samples, t)
+            >>> projections.shape
+            (2, 9)
+        """
+
+        if method == 'stable':
+            expansions = self._get_chebyshev_expansions()
+        else:
+            expansions = None
+
+        # The quadrature is in dt/t, hence the factor t**beta of the weight
+        # is folded into the powers of the functions.
+        exponents = [exponent + self.beta for exponent in self._exponents]
+
+        return project_samples(samples, t_grid, exponents, self.alpha,
+                               self.coeffs, method=method,
+                               expansions=expansions)
+
+    # ---
+    # Fit
+    # ---
+
+    def fit(self, samples, t, chunk_size=65536, workers=None,
+            method='power'):
+        """
+        Least-squares fit of sampled signals in the orthonormal functions.
+
+        Parameters
+        ----------
+
+            samples : numpy.ndarray
+                One signal of the shape ``(num_points, )``, or a batch of
+                signals of the shape ``(num_signals, num_points)``, where
+                each row is a signal sampled at ``t``. This can be a
+                memory-mapped array.
+
+            t : numpy.ndarray
+                One-dimensional array of ``num_points`` points
+                :math:`t \\geq 0` in any order, such as irregular or
+                repeated points. This can be a memory-mapped array.
+
+            chunk_size : int, default=65536
+                Maximum number of points in each block of the design matrix.
+
+            workers : int, default=None
+                Number of processes to factor the blocks. If `None`, the
+                blocks are factored on the current process.
+
+            method : {'power', 'log', 'horner', 'stable'}, default='power'
+                The method of the evaluation of the functions. See
+                :meth:`evaluate`.
+
+        Returns
+        -------
+
+            fit_coeffs : numpy.ndarray
+                The coefficients :math:`c_i` that minimize
+                :math:`\\sum_k (f(t_k) - \\sum_i c_i
+                \\phi_{i_0+i}^{\\perp}(t_k))^2`, of the shape
+                ``(num_func, )`` for one signal, or ``(num_signals,
+                num_func)`` for a batch of signals.
+
+        Raises
+        ------
+
+            ValueError
+                If there are fewer points than functions, the points do not
+                determine the coefficients, or ``chunk_size`` or ``workers``
+                is not a positive integer.
+
+        See Also
+        --------
+
+        partial_fit
+        project
+
+        Notes
+        -----
+
+        The design matrix of the functions at the points is never formed.
+        Rather, the points are processed in blocks of ``chunk_size``, and
+        only the triangular factor :math:`\\mathbf{R}` of the QR
+        factorization of the design matrix augmented by the samples is kept
+        (the tall-skinny QR factorization). Each block is factored on the
+        factor of the previous blocks, or with ``workers``, the blocks are
+        factored on a process pool and their factors are merged by the QR
+        factorization of the stacked factors. Hence, the memory does not
+        depend on the number of points. Unlike the normal equations, the
+        QR factorization does not square the condition number of the
+        design matrix.
+
+        This method discards the points of the previous calls of
+        :meth:`partial_fit`.
+
+        Examples
+        --------
+
+        .. code-block:: python
+
+            >>> import numpy
+            >>> from ortho import OrthogonalFunctions
+            >>> OF = OrthogonalFunctions(num_func=9)
+            >>> t = numpy.random.rand(10**6)
+            >>> samples = numpy.sqrt(t) + 0.01 * numpy.random.randn(t.size)
+            >>> fit_coeffs = OF.fit(samples, t, workers=4)
+            >>> fit_coeffs.shape
+            (9,)
+        """
+
+        self._least_squares = None
+
+        return self.partial_fit(samples, t, chunk_size=chunk_size,
+                                workers=workers, method=method)
+
+    # -----------
+    # Partial Fit
+    # -----------
+
+    def partial_fit(self, samples, t, chunk_size=65536, workers=None,
+                    method='power'):
+        """
+        Updates the least-squares fit with more samples of the signals.
+
+        Parameters
+        ----------
+
+            samples : numpy.ndarray
+                The samples at ``t`` of the same number of signals as the
+                previous calls. See :meth:`fit`.
+
+            t : numpy.ndarray
+                One-dimensional array of the points. See :meth:`fit`.
+
+            chunk_size : int, default=65536
+                Maximum number of points in each block of the design matrix.
+
+            workers : int, default=None
+                Number of processes to factor the blocks. See :meth:`fit`.
+
+            method : {'power', 'log', 'horner', 'stable'}, default='power'
+                The method of the evaluation of the functions. See
+                :meth:`evaluate`.
+
+        Returns
+        -------
+
+            fit_coeffs : numpy.ndarray
+                The coefficients of the fit to all samples of this and the
+                previous calls since the last call of :meth:`fit`. See
+                :meth:`fit`.
+
+        Raises
+        ------
+
+            ValueError
+                If the number of signals differs from the previous calls, or
+                the samples so far do not determine the coefficients. In the
+                latter case, the samples are kept, and the coefficients are
+                given by the next calls.
+
+        See Also
+        --------
+
+        fit
+
+        Notes
+        -----
+
+        The samples are accumulated to the triangular factor of the fit, of
+        the size ``num_func + num_signals``, which is all that is kept
+        between the calls. Hence, the fit can be updated as the data arrives
+        over time. The factor is discarded by :meth:`fit` and
+        :meth:`extend`.
+
+        Examples
+        --------
+
+        .. code-block:: python
+
+            >>> import numpy
+            >>> from ortho import OrthogonalFunctions
+            >>> OF = OrthogonalFunctions(num_func=9)
+            >>> for _ in range(10):
+            ...     t = numpy.random.rand(10**5)
+            ...     samples = numpy.sqrt(t)
+            ...     fit_coeffs = OF.partial_fit(samples, t)
+        """
+
+        batch, t = get_batch(samples, t)
+
+        if self._least_squares is None:
+            self._least_squares = TallSkinnyQR(self.num_func, batch.shape[0])
+        elif self._least_squares.num_signals != batch.shape[0]:
+            raise ValueError('The number of signals should be %d, '
+                             % self._least_squares.num_signals +
+                             'as in the previous calls.')
+
+        if method == 'stable':
+            expansions = self._get_chebyshev_expansions()
+        else:
+            expansions = None
+
+        fit_samples(self._least_squares, t, batch, self._exponents,
+                    self.alpha, self.coeffs, chunk_size=chunk_size,
+                    workers=workers, method=method, expansions=expansions)
+
+        fit_coeffs, _ = self._least_squares.solve()
+
+        if numpy.ndim(samples) == 1:
+            return fit_coeffs[0]
+
+        return fit_coeffs
+
     # -----
     # Check
     # -----
 
-    def check(self, verbose=False):
+    def check(self, verbose=False, workers=None, mode='symbolic', tol=1e-8):
         """
         Check the mutual orthogonality of the functions.
 
@@ -197,25 +2016,147 @@ class OrthogonalFunctions(object):
                      [0 0 0 0 0 0 0 1 0]
                      [0 0 0 0 0 0 0 0 1]]
 
+            workers : int, default=None
+                Number of processes to compute the mutual inner products in
+                parallel. The inner products are symbolic integrals that are
+                independent of each other. If `None`, the inner products are
+                computed in the current process. This option is only used
+                with ``mode='symbolic'``.
+
+            mode : {'symbolic', 'numeric'}, default='symbolic'
+                The method to compute the mutual inner products:
+
+                * ``'symbolic'``: exact symbolic integration of the symbolic
+                  functions :attr:`sym_phi`.
+                * ``'numeric'``: quadrature of the functions evaluated in
+                  ``float64`` by the numeric coefficients :attr:`alpha` and
+                  :attr:`coeffs`. This takes a few milliseconds. See
+                  :meth:`check_numeric`.
+
+            tol : float, default=1e-8
+                Tolerance of the maximum absolute deviation of the matrix of
+                the inner products from the identity matrix. This option is
+                only used with ``mode='numeric'``.
+
         Returns
         -------
 
             status : boolean
                 If `True`, the generated functions are all mutually
                 orthonormal. Otherwise returns `False`.
+
+        See Also
+        --------
+
+        check_numeric : the matrix of the inner products and its error.
+
+        Examples
+        --------
+
+        .. code-block:: python
+
+            >>> from ortho import OrthogonalFunctions
+            >>> OF = OrthogonalFunctions(num_func=9)
+            >>> OF.check(mode='numeric')
+            True
         """
 
-        if self._phi_orthonormalized_list is None:
-            raise RuntimeError('Call Process() first.')
+        if mode not in ['symbolic', 'numeric']:
+            raise ValueError('"mode" should be either "symbolic" or ' +
+                             '"numeric".')
 
-        # Check orthonormality of functions
-        status = check_mutual_orthonormality(
-                self._phi_orthonormalized_list,
-                self._interval,
-                verbose=verbose)
+        if mode == 'numeric':
+            status, _, _ = self.check_numeric(verbose=verbose, tol=tol)
+            return status
+
+        with self._profiling():
+
+            from .orthogonalization_utilities import \
+                check_mutual_orthonormality
+
+            # Check orthonormality of functions
+            status = check_mutual_orthonormality(
+                    self.sym_phi,
+                    self._interval,
+                    verbose=verbose,
+                    workers=workers,
+                    beta=self.beta)
 
         return status
 
+    # -------------
+    # Check Numeric
+    # -------------
+
+    def check_numeric(self, verbose=False, tol=1e-8):
+        """
+        Check the mutual orthogonality of the numeric functions by
+        quadrature.
+
+        Parameters
+        ----------
+
+            verbose : boolean, default=False
+                If `True`, prints the matrix of mutual inner product of
+                functions.
+
+            tol : float, default=1e-8
+                Tolerance of the maximum absolute deviation of the matrix of
+                the inner products from the identity matrix.
+
+        Returns
+        -------
+
+            status : boolean
+                If `True`, the functions are mutually orthonormal within
+                ``tol``. Otherwise returns `False`.
+
+            gram : numpy.ndarray
+                The matrix of the mutual inner products.
+
+            max_error : float
+                The maximum absolute deviation of ``gram`` from the identity
+                matrix.
+
+        Notes
+        -----
+
+        The functions are evaluated in ``float64`` by the numeric
+        coefficients :attr:`alpha` and :attr:`coeffs`. The substitution
+        :math:`t = L e^{-s}` transforms the inner products to integrals of
+        sums of exponentials on :math:`s \\in [0, \\infty)`, which are
+        computed by the Gauss-Legendre quadrature on the dyadic intervals of
+        :math:`s`. The quadrature error is at the level of the machine
+        precision, hence ``max_error`` measures the round-off error of
+        evaluating the functions by their numeric coefficients. Since the
+        coefficients :math:`a_{ij}` alternate in sign and grow rapidly, this
+        error grows with the number of functions.
+
+        Examples
+        --------
+
+        .. code-block:: python
+
+            >>> from ortho import OrthogonalFunctions
+            >>> OF = OrthogonalFunctions(num_func=9)
+            >>> status, gram, max_error = OF.check_numeric()
+            >>> status
+            True
+        """
+
+        with self._profiling():
+
+            # Check orthonormality of the numeric functions by quadrature
+            status, gram, max_error = check_numeric_orthonormality(
+                    self._shifted_exponents,
+                    self.alpha,
+                    self.coeffs,
+                    self._interval,
+                    tol=tol,
+                    verbose=verbose)
+
+        return status, gram, max_error
+
     # -----
     # Print
     # -----
@@ -238,12 +2179,15 @@ class OrthogonalFunctions(object):
             i = 6:  -sqrt(2/7)   [196, -1470,  4410,  -6468,   4620,   -1287 ]
         """
 
-        if self._phi_orthonormalized_list is None:
-            raise RuntimeError('Call Process() first.')
+        from .orthogonalization_utilities import print_coeffs_of_functions
+
+        # The coefficients alpha of custom exponents have no simple form
+        alpha = self.sym_alpha if self._custom_exponents else None
 
         print_coeffs_of_functions(
                 self.sym_coeffs,
-                self.start_index)
+                self.start_index,
+                alpha=alpha)
 
     # ----
     # Plot
@@ -254,12 +2198,79 @@ class OrthogonalFunctions(object):
         Plot the generated functions.
         """
 
-        if self._phi_orthonormalized_list is None:
-            raise RuntimeError('Call Process() first.')
+        # matplotlib is loaded on the first plot
+        from .plot_functions import plot_functions
 
         # Plot Functions
         plot_functions(
-                self._phi_orthonormalized_list,
+                self.sym_phi,
                 self.start_index,
                 self._interval,
                 filename=filename)
+
+
+# ===================
+# Decode Table Coeffs
+# ===================
+
+def _decode_table_coeffs(table):
+    """
+    The exact rows of the coefficients of a table, which are decoded on the
+    first access of the exact coefficients of the loaded functions.
+    """
+
+    return decode_rational(table)[1]
+
+
+# ====================
+# Get Batch Parameters
+# ====================
+
+def _get_batch_parameters(params):
+    """
+    Checks the parameters of a set of functions of
+    :meth:`OrthogonalFunctions.batch` and fills in the default values.
+    """
+
+    unknown = set(params) - set(_BATCH_DEFAULTS)
+    if unknown:
+        raise ValueError('Unknown parameters: %s.' %
+                         ', '.join(sorted(unknown)))
+
+    params = dict(_BATCH_DEFAULTS, **params)
+
+    if (not isinstance(params['num_func'], int)) or (params['num_func'] < 1):
+        raise ValueError('"num_func" should be a positive integer.')
+    if (not isinstance(params['start_index'], int)) or \
+            (params['start_index'] < 0):
+        raise ValueError('"start_index" should be a non-negative integer.')
+    if params['end_interval'] <= 0:
+        raise ValueError('"end_interval" should be greater than zero.')
+    if params['method'] not in _METHODS:
+        raise ValueError('"method" should be either "gram-schmidt", ' +
+                         '"cholesky", "product", or "symbolic".')
+
+    return params
+
+
+# ==========================
+# Compute Rational Functions
+# ==========================
+
+def _compute_rational_functions(group):
+    """
+    Exact rational coefficients of the functions on the interval
+    :math:`[0, 1]` of a pair of start index and method, and a number of
+    functions. This function runs on the processes of
+    :meth:`OrthogonalFunctions.batch`.
+    """
+
+    (start_index, method), num_func = group
+    OF = OrthogonalFunctions(start_index=start_index, num_func=num_func,
+                             method=method)
+
+    # The symbolic coefficients on [0, 1] are rational
+    if method == 'symbolic':
+        return get_rational_coeffs_from_symbolic(OF.sym_alpha, OF.sym_coeffs)
+
+    return OF._alpha_squared, OF._alpha_sign, OF._rational_coeffs
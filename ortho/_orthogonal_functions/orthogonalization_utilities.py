@@ -11,15 +11,23 @@
 # Imports
 # =======
 
+import itertools
+import contextlib
+from concurrent.futures import ProcessPoolExecutor
 import sympy
 import numpy
 from .declarations import t
+from .profile_utilities import profiled
+
+# Simplification of the sympy expressions, recorded as a phase of the profiler
+simplify = profiled('simplify')(sympy.simplify)
 
 
 # ===
 # phi
 # ===
 
+@profiled('phi')
 def phi(i):
     """
     Generates a list of non-orthogonal functions defined by
@@ -39,9 +47,10 @@ def phi(i):
 # Inner Product
 # =============
 
-def inner_product(f, g, interval):
+@profiled('inner_product')
+def inner_product(f, g, interval, beta=0):
     """
-    Inner product of two functions with weight :math:`t^{-1}`.
+    Inner product of two functions with weight :math:`t^{\\beta - 1}`.
 
     :param f: A ``sympy`` function.
     :type f: sympy object
@@ -53,22 +62,107 @@ def inner_product(f, g, interval):
     ``[Start, end]``.
     :type interval: list
 
+    :param beta: The exponent :math:`\\beta` of the weight. The default
+        weight is :math:`t^{-1}`.
+    :type beta: int or fractions.Fraction
+
     :return: The inner product of the functions.
     :rtype: float
     """
 
     # The two stage sympy.expand below is needed so sympy.integrate can perform
     # properly
-    h = sympy.expand(sympy.expand(f*g)/t)
+    if beta == 0:
+        h = sympy.expand(sympy.expand(f*g)/t)
+    else:
+        weight = t**(sympy.Rational(beta.numerator, beta.denominator) - 1)
+        h = sympy.expand(sympy.expand(f*g)*weight)
 
     # Integrate function f between 0 and 1
     return sympy.integrate(h, (t, sympy.S(interval[0]), sympy.S(interval[1])))
 
 
+# ============
+# Get executor
+# ============
+
+def get_executor(workers=None):
+    """
+    Process pool to compute the inner products in parallel.
+
+    :param workers: Number of processes. If `None` or ``1``, the inner
+        products are computed in the current process.
+    :type workers: int
+
+    :return: A context manager of a process pool executor, or of `None` if
+        the inner products are computed in the current process.
+    :rtype: context manager
+    """
+
+    if workers is None:
+        workers = 1
+
+    if (not isinstance(workers, int)) or (workers < 1):
+        raise ValueError('"workers" should be a positive integer.')
+
+    if workers == 1:
+        return contextlib.nullcontext(None)
+
+    return ProcessPoolExecutor(max_workers=workers)
+
+
+# ==================
+# Map Inner Products
+# ==================
+
+@profiled('map_inner_products')
+def map_inner_products(functions_f, functions_g, interval, executor=None,
+                       beta=0):
+    """
+    Inner products of pairs of functions.
+
+    The inner products are independent, hence they are distributed over the
+    processes of ``executor``. The ``sympy`` functions are pickled to the
+    processes, and the results are returned in the order of the pairs.
+
+    :param functions_f: List of ``sympy`` functions.
+    :type functions_f: list
+
+    :param functions_g: List of ``sympy`` functions of the same size as
+        ``functions_f``.
+    :type functions_g: list
+
+    :param interval: The interval of the domain of the functions in the form
+        ``[Start, end]``.
+    :type interval: list
+
+    :param executor: Process pool executor. If `None`, the inner products are
+        computed in the current process.
+    :type executor: concurrent.futures.ProcessPoolExecutor
+
+    :param beta: The exponent :math:`\\beta` of the weight
+        :math:`t^{\\beta - 1}`.
+    :type beta: int or fractions.Fraction
+
+    :return: The list of inner products of ``functions_f[i]`` and
+        ``functions_g[i]``.
+    :rtype: list
+    """
+
+    if executor is None:
+        return [inner_product(f, g, interval, beta=beta)
+                for f, g in zip(functions_f, functions_g)]
+
+    return list(executor.map(inner_product, functions_f, functions_g,
+                             itertools.repeat(interval),
+                             itertools.repeat(beta)))
+
+
 # =========
 # Normalize
 # =========
 
+@profiled('normalize')
 def normalize(f, interval):
     """
     Normalize a function with respect to inner product.
@@ -91,11 +185,14 @@ def normalize(f, interval):
 # Gram-Schmidt Process
 # ====================
 
+@profiled('gram_schmidt_process')
 def gram_schmidt_process(
         num_func,
         start_index,
         interval,
-        verbose=False):
+        verbose=False,
+        phi_orthonormalized_list=None,
+        workers=None):
     """
     Generates a list of orthonormalized symbolic functions.
 
@@ -109,6 +206,16 @@ def gram_schmidt_process(
         ``[Start, End]``.
     :type interval: list
 
+    :param phi_orthonormalized_list: The leading orthonormalized functions
+        that are already generated. If given, the process is continued from
+        these functions and only the remaining functions are generated.
+    :type phi_orthonormalized_list: list
+
+    :param workers: Number of processes to compute the projections of each
+        function on the previous functions in parallel. If `None`, the
+        projections are computed in the current process.
+    :type workers: int
+
     :return: list of sympy functions.
     :rtype: list
     """
@@ -119,40 +226,47 @@ def gram_schmidt_process(
         print('---------------------')
         print('')
 
-    # Create an empty list of orthnormalized functions
-    phi_orthonormalized_list = []
+    # Create a list of orthnormalized functions
+    if phi_orthonormalized_list is None:
+        phi_orthonormalized_list = []
+    else:
+        phi_orthonormalized_list = list(phi_orthonormalized_list)
+
+    with get_executor(workers) as executor:
 
-    # Gram-Schmidt orthogonalization process
-    for i in range(num_func):
+        # Gram-Schmidt orthogonalization process
+        for i in range(len(phi_orthonormalized_list), num_func):
 
-        # Initialize Gram-Schmidt process
-        phi_non_orthogonal = phi(i+sympy.S(start_index))
-        phi_orthogonalized = phi_non_orthogonal
-        if i > 0:
+            # Initialize Gram-Schmidt process
+            phi_non_orthogonal = phi(i+sympy.S(start_index))
+            phi_orthogonalized = phi_non_orthogonal
+            if i > 0:
 
-            # Subtract a new function from each of previous orthonormalized
-            # functions
-            for j in range(i):
+                # Projections of the new non-orthogonal function on each of
+                # previous orthonormalized functions
+                projections = map_inner_products(
+                        [phi_non_orthogonal] * i, phi_orthonormalized_list,
+                        interval, executor=executor)
 
                 # Subtract new non-orthogomal function from the projection of
                 # the previous orthonormalized function
-                phi_orthogonalized -= inner_product(
-                        phi_non_orthogonal, phi_orthonormalized_list[j],
-                        interval) * phi_orthonormalized_list[j]
+                for j in range(i):
+                    phi_orthogonalized -= projections[j] * \
+                        phi_orthonormalized_list[j]
 
-        # Normalize an orthogonalized function
-        phi_orthogonalized = sympy.simplify(phi_orthogonalized)
-        phi_orthonormalized = normalize(phi_orthogonalized, interval)
-        phi_orthonormalized = sympy.simplify(phi_orthonormalized)
+            # Normalize an orthogonalized function
+            phi_orthogonalized = simplify(phi_orthogonalized)
+            phi_orthonormalized = normalize(phi_orthogonalized, interval)
+            phi_orthonormalized = simplify(phi_orthonormalized)
 
-        # Store result to the list
-        phi_orthonormalized_list.append(phi_orthonormalized)
+            # Store result to the list
+            phi_orthonormalized_list.append(phi_orthonormalized)
 
-        # Print progress
-        if verbose:
-            print('phi_%d(t) = ' % (i+start_index))
-            print(phi_orthonormalized_list[i])
-            print('')
+            # Print progress
+            if verbose:
+                print('phi_%d(t) = ' % (i+start_index))
+                print(phi_orthonormalized_list[i])
+                print('')
 
     return phi_orthonormalized_list
 
@@ -161,10 +275,13 @@ def gram_schmidt_process(
 # Check Mutual Orthonormality
 # ===========================
 
+@profiled('check_mutual_orthonormality')
 def check_mutual_orthonormality(
         phi_orthonormalized_list,
         interval,
-        verbose=False):
+        verbose=False,
+        workers=None,
+        beta=0):
     """
     Checks the inner orthonormality of each of two functions from a list of
     symbolic functions.
@@ -183,6 +300,15 @@ def check_mutual_orthonormality(
         ``[Start, End]``.
     :type interval: list
 
+    :param workers: Number of processes to compute the inner products in
+        parallel. If `None`, the inner products are computed in the current
+        process.
+    :type workers: int
+
+    :param beta: The exponent :math:`\\beta` of the weight
+        :math:`t^{\\beta - 1}`.
+    :type beta: int or fractions.Fraction
+
     :return: The mutual orthogonality matrix.
     :rtype: ndarray
     """
@@ -192,23 +318,28 @@ def check_mutual_orthonormality(
     mutual_inner_products = -1 * numpy.ones((num_func, num_func),
                                             dtype=int)
 
-    # Mutual inner products
-    for i in range(num_func):
-        for j in range(i+1):
+    # Pairs of functions of the lower triangle of the matrix
+    pairs = [(i, j) for i in range(num_func) for j in range(i+1)]
 
-            # Inner product as symbolic number
-            inner_prod = inner_product(phi_orthonormalized_list[i],
-                                       phi_orthonormalized_list[j], interval)
+    # Inner products as symbolic numbers
+    with get_executor(workers) as executor:
+        inner_prods = map_inner_products(
+                [phi_orthonormalized_list[i] for i, _ in pairs],
+                [phi_orthonormalized_list[j] for _, j in pairs],
+                interval, executor=executor, beta=beta)
 
-            # Convert symbolic number to -1, 0, 1 numpy integer
-            if inner_prod == sympy.S(1):
-                mutual_inner_products[i, j] = 1
-            elif inner_prod == sympy.S(0):
-                mutual_inner_products[i, j] = 0
+    # Mutual inner products
+    for (i, j), inner_prod in zip(pairs, inner_prods):
 
-            # Symmetric matrix
-            if i != j:
-                mutual_inner_products[j, i] = mutual_inner_products[i, j]
+        # Convert symbolic number to -1, 0, 1 numpy integer
+        if inner_prod == sympy.S(1):
+            mutual_inner_products[i, j] = 1
+        elif inner_prod == sympy.S(0):
+            mutual_inner_products[i, j] = 0
+
+        # Symmetric matrix
+        if i != j:
+            mutual_inner_products[j, i] = mutual_inner_products[i, j]
 
     # Print results
     if verbose:
@@ -227,24 +358,27 @@ def check_mutual_orthonormality(
 # get symbolic coeffs
 # ===================
 
+@profiled('get_symbolic_coeffs')
 def get_symbolic_coeffs(
         phi_orthonormalized_list,
-        start_index):
+        start_index,
+        start=0):
     """
-    Gets symbolic coefficients of alpha[i] and a[ij].
+    Gets symbolic coefficients of alpha[i] and a[ij] of the functions from
+    the index ``start`` of the list.
     """
 
     num_func = len(phi_orthonormalized_list)
     sym_alpha = [None] * num_func
     sym_coeffs = [None] * num_func
 
-    for j in range(num_func):
+    for j in range(start, num_func):
 
         # Multiply each function with sqrt(2/i+1) to have integer coeffs
         sym_alpha[j] = (sympy.S(-1)**(sympy.S(j))) * \
                  sympy.sqrt(sympy.Rational(2, j+start_index+1))
         function = phi_orthonormalized_list[j] / sym_alpha[j]
-        function = sympy.simplify(function)
+        function = simplify(function)
 
         # Convert the function to a polynomial
         polynomial = sympy.Poly(function)
@@ -256,13 +390,14 @@ def get_symbolic_coeffs(
                     t**(sympy.Rational(1, i+1+start_index)))
             sym_coeffs[j].append(coeff)
 
-    return sym_alpha, sym_coeffs
+    return sym_alpha[start:], sym_coeffs[start:]
 
 
 # ==================
 # Get numeric coeffs
 # ==================
 
+@profiled('get_numeric_coeffs')
 def get_numeric_coeffs(
         sym_alpha,
         sym_coeffs):
@@ -290,7 +425,8 @@ def get_numeric_coeffs(
 
 def print_coeffs_of_functions(
         coeffs,
-        start_index):
+        start_index,
+        alpha=None):
     """
     Prints the coeffs of orthonormalized functions as
 
@@ -307,6 +443,10 @@ def print_coeffs_of_functions(
 
     :param start_index: The start index of the functions.
     :type start_index: int
+
+    :param alpha: The symbolic coefficients :math:`\\alpha_j`. If `None`,
+        these are the coefficients of the default exponents above.
+    :type alpha: list
     """
 
     print('-------------------------')
@@ -326,6 +466,8 @@ def print_coeffs_of_functions(
             sign_as_string = '+'
         alpha_as_string = sign_as_string + \
             'sqrt(2/%d)' % (j+start_index+1)
+        if alpha is not None:
+            alpha_as_string = str(alpha[j])
         print('i = %d:  %11s  %s'
               % (j+start_index, alpha_as_string, coeffs[j]))
 
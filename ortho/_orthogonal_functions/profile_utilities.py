@@ -0,0 +1,278 @@
+# SPDX-FileCopyrightText: Copyright 2021, Siavash Ameli <sameli@berkeley.edu>
+# SPDX-License-Identifier: BSD-3-Clause
+# SPDX-FileType: SOURCE
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the license found in the LICENSE.txt file in the root directory
+# of this source tree.
+
+
+# =======
+# Imports
+# =======
+
+import time
+import functools
+import cProfile
+import pstats
+
+__all__ = ['Profiler', 'profiled']
+
+# Stack of the profilers that are currently recording
+_active_profilers = []
+
+
+# ========
+# Profiled
+# ========
+
+def profiled(phase):
+    """
+    Decorator that records the wall time and the number of calls of a
+    function as a phase in the active profilers.
+
+    If no profiler is active, the function is called directly.
+
+    :param phase: The name of the phase.
+    :type phase: str
+
+    :return: The decorator.
+    :rtype: callable
+    """
+
+    def decorator(function):
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+
+            if not _active_profilers:
+                return function(*args, **kwargs)
+
+            for profiler in _active_profilers:
+                profiler.register(phase)
+
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                for profiler in _active_profilers:
+                    profiler.record(phase, elapsed)
+
+        return wrapper
+
+    return decorator
+
+
+# ========
+# Profiler
+# ========
+
+class Profiler(object):
+    """
+    Records the wall time and the number of calls of the phases of the
+    computations.
+
+    Parameters
+    ----------
+
+        cprofile : bool, default=False
+            If `True`, the computations are also profiled by
+            :mod:`cProfile`, which can be accessed by :meth:`stats` and
+            :meth:`dump_stats`.
+
+    Methods
+    -------
+    report
+    print
+    stats
+    dump_stats
+
+    Notes
+    -----
+
+    The profiler records while it is used as a context manager. The time of
+    a phase includes the time of the phases that are called inside of it.
+    For instance, ``normalize`` includes an ``inner_product``. The phases
+    that run in the worker processes of a process pool are not recorded,
+    rather, their total time is recorded by the phase
+    ``map_inner_products``.
+
+    Examples
+    --------
+
+    .. code-block:: python
+
+        >>> from ortho import OrthogonalFunctions, Profiler
+        >>> with Profiler() as profiler:
+        ...     OF = OrthogonalFunctions(num_func=6, method='symbolic')
+        >>> profiler.print()
+        phase                 calls      time (s)
+        --------------------  -----  ------------
+        gram_schmidt_process      1      1.43e+00
+        phi                       6      5.16e-04
+        simplify                 18      7.57e-01
+        normalize                 6      4.08e-01
+        inner_product            21      7.78e-01
+        map_inner_products        5      3.79e-01
+        get_symbolic_coeffs       1      1.43e-01
+        get_numeric_coeffs        1      7.78e-04
+
+    Here, the time of ``gram_schmidt_process`` includes the time of the
+    phases that are called by it.
+    """
+
+    # ----
+    # Init
+    # ----
+
+    def __init__(self, cprofile=False):
+        """
+        Initializes the records of the phases.
+        """
+
+        self.cprofile = cprofile
+        self._calls = {}
+        self._times = {}
+        self._cprofile = None
+
+    # -----
+    # Enter
+    # -----
+
+    def __enter__(self):
+        """
+        Starts recording.
+        """
+
+        _active_profilers.append(self)
+
+        if self.cprofile:
+            if self._cprofile is None:
+                self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+
+        return self
+
+    # ----
+    # Exit
+    # ----
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Stops recording.
+        """
+
+        if self._cprofile is not None:
+            self._cprofile.disable()
+
+        _active_profilers.remove(self)
+
+        return False
+
+    # --------
+    # Register
+    # --------
+
+    def register(self, phase):
+        """
+        Adds a phase to the report, so that the phases are reported in the
+        order of their first call.
+        """
+
+        if phase not in self._calls:
+            self._calls[phase] = 0
+            self._times[phase] = 0.0
+
+    # ------
+    # Record
+    # ------
+
+    def record(self, phase, elapsed):
+        """
+        Adds a call of a phase with its wall time.
+        """
+
+        self.register(phase)
+        self._calls[phase] += 1
+        self._times[phase] += elapsed
+
+    # ------
+    # Report
+    # ------
+
+    def report(self):
+        """
+        Structured report of the phases.
+
+        Returns
+        -------
+
+            report : dict
+                A dictionary with the names of the phases as the keys in the
+                order of their first call. Each value is a dictionary with
+                the keys ``'calls'`` for the number of calls and ``'time'``
+                for the total wall time in seconds.
+        """
+
+        return {phase: {'calls': self._calls[phase],
+                        'time': self._times[phase]}
+                for phase in self._calls}
+
+    # -----
+    # Print
+    # -----
+
+    def print(self):
+        """
+        Prints the report of the phases.
+        """
+
+        report = self.report()
+        width = max([len('phase')] + [len(phase) for phase in report])
+
+        print('%s  calls      time (s)' % 'phase'.ljust(width))
+        print('%s  -----  ------------' % ('-' * width))
+        for phase, record in report.items():
+            print('%s  %5d  %12.2e' % (phase.ljust(width), record['calls'],
+                                       record['time']))
+
+    # -----
+    # Stats
+    # -----
+
+    def stats(self):
+        """
+        Statistics of :mod:`cProfile`.
+
+        Returns
+        -------
+
+            stats : pstats.Stats
+                The statistics of all functions that are called while
+                recording.
+        """
+
+        if self._cprofile is None:
+            raise RuntimeError('The profiler should be created with ' +
+                               '"cprofile=True".')
+
+        return pstats.Stats(self._cprofile)
+
+    # ----------
+    # Dump Stats
+    # ----------
+
+    def dump_stats(self, filename):
+        """
+        Writes the statistics of :mod:`cProfile` to a file.
+
+        Parameters
+        ----------
+
+            filename : str
+                Name of the file. The file can be read by :mod:`pstats` or
+                by visualization tools such as ``snakeviz``.
+        """
+
+        self.stats().dump_stats(filename)
@@ -0,0 +1,255 @@
+# SPDX-FileCopyrightText: Copyright 2021, Siavash Ameli <sameli@berkeley.edu>
+# SPDX-License-Identifier: BSD-3-Clause
+# SPDX-FileType: SOURCE
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the license found in the LICENSE.txt file in the root directory
+# of this source tree.
+
+
+# =======
+# Imports
+# =======
+
+import numpy
+from .evaluation_utilities import get_block_evaluator
+from .profile_utilities import profiled
+
+__all__ = ['project_samples']
+
+# Number of points of the grid that are processed at once. This bounds the
+# memory of the block of the weighted functions.
+_BLOCK_SIZE = 2**14
+
+
+# =============
+# Check Samples
+# =============
+
+def check_samples(samples, t):
+    """
+    Checks the shapes of the samples and of the grid.
+
+    :param samples: One signal of the shape ``(num_points, )`` or a batch of
+        signals of the shape ``(num_signals, num_points)``.
+    :type samples: numpy.ndarray
+
+    :param t: The grid of the shape ``(num_points, )``.
+    :type t: numpy.ndarray
+
+    :raises ValueError: If the shapes do not match, or the grid has less than
+        two points.
+    """
+
+    if t.ndim != 1:
+        raise ValueError('"t_grid" should be a one-dimensional array.')
+    if t.size < 2:
+        raise ValueError('"t_grid" should have at least two points.')
+    if samples.ndim not in (1, 2):
+        raise ValueError('"samples" should be a one-dimensional or a ' +
+                         'two-dimensional array.')
+    if samples.shape[-1] != t.size:
+        raise ValueError('The last axis of "samples" should have the size ' +
+                         'of "t_grid".')
+
+
+# ===============
+# Get Log Weights
+# ===============
+
+def get_log_weights(t, start, stop):
+    """
+    Weights of the trapezoidal rule in :math:`s = \\log t` on a block of the
+    grid.
+
+    The weight of the point :math:`t_k` is :math:`(s_{k+1} - s_{k-1})/2`,
+    where :math:`s_{-1} = s_0` and :math:`s_N = s_{N-1}` at the ends of the
+    grid. Only the points of the block and their neighbors are read.
+
+    :param t: The grid, which is positive and strictly increasing.
+    :type t: numpy.ndarray
+
+    :param start: The index of the first point of the block.
+    :type start: int
+
+    :param stop: The index after the last point of the block.
+    :type stop: int
+
+    :return: The weights of the points of the block.
+    :rtype: numpy.ndarray
+
+    :raises ValueError: If the points are not positive and strictly
+        increasing.
+    """
+
+    low = max(start - 1, 0)
+    high = min(stop + 1, t.size)
+    neighbors = numpy.asarray(t[low:high], dtype=numpy.float64)
+
+    if (neighbors[0] <= 0.0) or numpy.any(numpy.diff(neighbors) <= 0.0):
+        raise ValueError('"t_grid" should be positive and strictly ' +
+                         'increasing.')
+
+    s = numpy.log(neighbors)
+    if start == 0:
+        s = numpy.r_[s[0], s]
+    if stop == t.size:
+        s = numpy.r_[s, s[-1]]
+
+    return 0.5 * (s[2:] - s[:-2])
+
+
+# ========
+# Get Tail
+# ========
+
+def get_tail(t, exponents, alpha, coeffs, method, evaluator):
+    """
+    Integrals :math:`\\int_0^{t_0} \\phi_i^{\\perp}(t) \\mathrm{d}t/t` of
+    the functions below the first point :math:`t_0` of the grid.
+
+    The integrals are the closed-form antiderivatives at :math:`t_0`, except
+    for the ``'stable'`` method, where the sums of the antiderivatives of the
+    powers lose all digits for many functions. Instead, the integrals are
+    :math:`\\phi_i^{\\perp}(t_0) / \\lambda_i` from the leading power
+    :math:`t^{\\lambda_i}` of the functions at zero, which is small on a
+    grid that starts near zero.
+
+    :param t: The grid.
+    :type t: numpy.ndarray
+
+    :param exponents: The exponents :math:`\\lambda_j`.
+    :type exponents: list
+
+    :param alpha: The coefficients :math:`\\alpha_i`.
+    :type alpha: list
+
+    :param coeffs: The packed coefficients :math:`a_{ij}`.
+    :type coeffs: TriangularCoeffs or list
+
+    :param method: The method of the evaluation of the functions.
+    :type method: str
+
+    :param evaluator: The evaluator of the functions on a block of points.
+    :type evaluator: callable
+
+    :return: The integrals of the functions.
+    :rtype: numpy.ndarray
+    """
+
+    num_func = len(coeffs)
+    first = numpy.asarray(t[:1], dtype=numpy.float64)
+    tail = numpy.empty((num_func, 1), dtype=numpy.float64)
+
+    if method == 'stable':
+        evaluator(first, tail)
+        tail[:, 0] /= [float(exponent) for exponent in exponents]
+    else:
+        tail_evaluator = get_block_evaluator(exponents, alpha, coeffs,
+                                             method, tail.dtype, 1,
+                                             derivative=-1)
+        tail_evaluator(first, tail)
+
+    return tail[:, 0]
+
+
+# ===============
+# Project Samples
+# ===============
+
+@profiled('project_samples')
+def project_samples(
+        samples,
+        t,
+        exponents,
+        alpha,
+        coeffs,
+        method='power',
+        expansions=None):
+    """
+    Projects sampled signals onto the orthonormal functions.
+
+    The inner products :math:`\\langle f, \\phi_i^{\\perp} \\rangle` with
+    respect to :math:`\\mathrm{d}t/t = \\mathrm{d}s`, where :math:`s = \\log
+    t`, are computed by the trapezoidal rule in :math:`s` on the grid. The
+    grid is processed in blocks. On each block, the functions are evaluated
+    once, are multiplied by the weights of the quadrature, and are
+    accumulated to the projections of all signals by one matrix product, so
+    that the matrix of the functions on the whole grid is never formed.
+
+    The part of the integral on :math:`[0, t_0]` below the grid is added by
+    taking the signals as constant on this interval, which is the product of
+    :math:`f(t_0)` and the closed-form integral of the functions.
+
+    :param samples: One signal of the shape ``(num_points, )`` or a batch of
+        signals of the shape ``(num_signals, num_points)``, sampled on the
+        grid. This can be a memory-mapped array.
+    :type samples: numpy.ndarray
+
+    :param t: The grid of the shape ``(num_points, )``, which is positive
+        and strictly increasing.
+    :type t: numpy.ndarray
+
+    :param exponents: The exponents :math:`\\lambda_j`.
+    :type exponents: list
+
+    :param alpha: The coefficients :math:`\\alpha_i`.
+    :type alpha: list
+
+    :param coeffs: The packed coefficients :math:`a_{ij}`, or the ragged list
+        of lists of the coefficients.
+    :type coeffs: TriangularCoeffs or list
+
+    :param method: The method of the evaluation of the functions. See
+        :func:`evaluate_functions` and :func:`get_tail`.
+    :type method: str
+
+    :param expansions: The expansions of :func:`fit_chebyshev_expansions`,
+        which are required by the ``'stable'`` method.
+    :type expansions: dict
+
+    :return: The projections of the shape ``(num_func, )`` for one signal,
+        or ``(num_signals, num_func)`` for a batch of signals.
+    :rtype: numpy.ndarray
+    """
+
+    if not isinstance(samples, numpy.ndarray):
+        samples = numpy.asarray(samples, dtype=numpy.float64)
+    if not isinstance(t, numpy.ndarray):
+        t = numpy.asarray(t, dtype=numpy.float64)
+    check_samples(samples, t)
+
+    batch = samples if samples.ndim == 2 else samples[numpy.newaxis, :]
+    num_signals = batch.shape[0]
+    num_func = len(coeffs)
+    dtype = numpy.dtype(numpy.float64)
+    block_size = min(_BLOCK_SIZE, t.size)
+
+    evaluator = get_block_evaluator(exponents, alpha, coeffs, method, dtype,
+                                    block_size, expansions)
+
+    # Buffers that are reused for all blocks
+    functions = numpy.empty((num_func, block_size), dtype=dtype)
+    product = numpy.empty((num_signals, num_func), dtype=dtype)
+    projections = numpy.zeros((num_signals, num_func), dtype=dtype)
+
+    for start in range(0, t.size, block_size):
+        stop = min(start + block_size, t.size)
+        block_functions = functions[:, :stop-start]
+
+        # Functions on the block, weighted by the quadrature
+        evaluator(numpy.asarray(t[start:stop], dtype=dtype), block_functions)
+        block_functions *= get_log_weights(t, start, stop)
+
+        block_samples = numpy.asarray(batch[:, start:stop], dtype=dtype)
+        numpy.matmul(block_samples, block_functions.T, out=product)
+        projections += product
+
+    # Integral below the grid with the signals held at their first sample
+    tail = get_tail(t, exponents, alpha, coeffs, method, evaluator)
+    projections += numpy.asarray(batch[:, :1], dtype=dtype) * tail
+
+    if samples.ndim == 1:
+        return projections[0]
+
+    return projections
@@ -0,0 +1,183 @@
+# SPDX-FileCopyrightText: Copyright 2021, Siavash Ameli <sameli@berkeley.edu>
+# SPDX-License-Identifier: BSD-3-Clause
+# SPDX-FileType: SOURCE
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the license found in the LICENSE.txt file in the root directory
+# of this source tree.
+
+
+# =======
+# Imports
+# =======
+
+import math
+import numpy
+from .evaluation_utilities import get_evaluation_matrix
+from .profile_utilities import profiled
+
+__all__ = ['log_quadrature', 'numeric_gram_matrix',
+           'check_numeric_orthonormality']
+
+# The quadrature is truncated where the slowest decaying product of two
+# functions, exp(-2 lambda_min s), is below exp(-_DECAY).
+_DECAY = 40.0
+
+
+# ==============
+# Log Quadrature
+# ==============
+
+def log_quadrature(exponents, num_nodes=16):
+    """
+    Quadrature nodes and weights of the integrals with the weight
+    :math:`t^{-1}` in the variable :math:`s = -\\log(t/L)`.
+
+    With :math:`t = L e^{-s}`, the inner product becomes
+    :math:`\\int_0^L f(t) g(t) \\mathrm{d}t / t = \\int_0^{\\infty} f(L
+    e^{-s}) g(L e^{-s}) \\mathrm{d}s`, where the products of the functions
+    are sums of the exponentials :math:`e^{-(\\lambda_i + \\lambda_j) s}`.
+    The half-line is divided to the dyadic intervals :math:`[0, 1], [1, 2],
+    [2, 4], \\dots`, on which the exponentials are smooth, and each interval
+    is integrated by the Gauss-Legendre rule. The intervals are truncated
+    where :math:`e^{-2 \\lambda_{\\min} s}` is negligible.
+
+    :param exponents: The exponents :math:`\\lambda_i` of the functions.
+    :type exponents: list
+
+    :param num_nodes: Number of Gauss-Legendre nodes on each interval.
+    :type num_nodes: int
+
+    :return: The nodes :math:`s_k` and the weights :math:`w_k`.
+    :rtype: tuple (numpy.ndarray, numpy.ndarray)
+    """
+
+    end = _DECAY / (2.0 * float(min(exponents)))
+    num_intervals = max(int(math.ceil(math.log2(end))), 0) + 1
+    edges = numpy.r_[0.0, 2.0**numpy.arange(num_intervals)]
+
+    x, w = numpy.polynomial.legendre.leggauss(num_nodes)
+    half_widths = 0.5 * numpy.diff(edges)
+    centers = 0.5 * (edges[:-1] + edges[1:])
+
+    nodes = (half_widths[:, numpy.newaxis] * x + centers[:, numpy.newaxis])
+    weights = half_widths[:, numpy.newaxis] * w
+
+    return nodes.ravel(), weights.ravel()
+
+
+# ===================
+# Numeric Gram Matrix
+# ===================
+
+def numeric_gram_matrix(
+        exponents,
+        alpha,
+        coeffs,
+        interval,
+        num_nodes=16):
+    """
+    Mutual inner products of the functions with the numeric coefficients.
+
+    The functions are evaluated in ``float64`` by the same coefficients
+    :math:`\\alpha_i a_{ij}` that are used by the numeric evaluation, at the
+    nodes of :func:`log_quadrature`. The powers
+    :math:`t^{\\lambda_j} = L^{\\lambda_j} e^{-\\lambda_j s}` are computed in
+    the variable :math:`s`, which avoids the underflow of :math:`t` near
+    zero.
+
+    :param exponents: The exponents :math:`\\lambda_i` of the functions.
+    :type exponents: list
+
+    :param alpha: The coefficients :math:`\\alpha_i`.
+    :type alpha: list
+
+    :param coeffs: The packed coefficients :math:`a_{ij}`, or the ragged list
+        of lists of the coefficients.
+    :type coeffs: TriangularCoeffs or list
+
+    :param interval: The interval of the domain of the functions in the form
+        ``[Start, End]``.
+    :type interval: list
+
+    :param num_nodes: Number of Gauss-Legendre nodes on each interval.
+    :type num_nodes: int
+
+    :return: The symmetric matrix of the inner products.
+    :rtype: numpy.ndarray
+    """
+
+    nodes, weights = log_quadrature(exponents, num_nodes=num_nodes)
+
+    exponents = numpy.array([float(exponent) for exponent in exponents])
+    log_end = math.log(float(interval[1]))
+    powers = numpy.exp(numpy.outer(exponents, log_end - nodes))
+
+    matrix = get_evaluation_matrix(alpha, coeffs, numpy.float64)
+    functions = matrix @ powers
+
+    gram = (functions * weights) @ functions.T
+
+    return 0.5 * (gram + gram.T)
+
+
+# ============================
+# Check Numeric Orthonormality
+# ============================
+
+@profiled('check_numeric_orthonormality')
+def check_numeric_orthonormality(
+        exponents,
+        alpha,
+        coeffs,
+        interval,
+        tol=1e-8,
+        verbose=False):
+    """
+    Checks the orthonormality of the functions with the numeric coefficients
+    by quadrature.
+
+    :param exponents: The exponents :math:`\\lambda_i` of the functions.
+    :type exponents: list
+
+    :param alpha: The coefficients :math:`\\alpha_i`.
+    :type alpha: list
+
+    :param coeffs: The packed coefficients :math:`a_{ij}`, or the ragged list
+        of lists of the coefficients.
+    :type coeffs: TriangularCoeffs or list
+
+    :param interval: The interval of the domain of the functions in the form
+        ``[Start, End]``.
+    :type interval: list
+
+    :param tol: Tolerance of the deviation of the inner products from the
+        identity matrix.
+    :type tol: float
+
+    :param verbose: If `True`, prints the matrix of the inner products.
+    :type verbose: bool
+
+    :return: The status of orthonormality, the matrix of the inner products
+        and the maximum absolute deviation of the matrix from the identity
+        matrix.
+    :rtype: tuple (bool, numpy.ndarray, float)
+    """
+
+    gram = numeric_gram_matrix(exponents, alpha, coeffs, interval)
+    max_error = float(numpy.max(numpy.abs(gram - numpy.eye(gram.shape[0]))))
+    status = bool(max_error <= tol)
+
+    # Print results
+    if verbose:
+        print('----------------------------------')
+        print('Mutual inner product of functions:')
+        print('----------------------------------')
+        print('')
+        with numpy.printoptions(precision=3, suppress=True):
+            print(gram)
+        print('')
+        print('Maximum error: %0.2e' % max_error)
+        print('')
+
+    return status, gram, max_error
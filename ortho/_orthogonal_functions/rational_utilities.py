@@ -0,0 +1,911 @@
+# SPDX-FileCopyrightText: Copyright 2021, Siavash Ameli <sameli@berkeley.edu>
+# SPDX-License-Identifier: BSD-3-Clause
+# SPDX-FileType: SOURCE
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the license found in the LICENSE.txt file in the root directory
+# of this source tree.
+
+
+# =======
+# Imports
+# =======
+
+import math
+import numbers
+from fractions import Fraction
+from .profile_utilities import profiled
+
+# sympy is imported only by the functions that build symbolic objects, so
+# that the exact rational process does not load sympy.
+
+
+# =============
+# Get exponents
+# =============
+
+def get_exponents(num_func, start_index):
+    """
+    Exponents of the non-orthogonal functions
+    :math:`\\phi_i(t) = t^{\\frac{1}{i+1}}`.
+
+    :param num_func: Number of functions.
+    :type num_func: int
+
+    :param start_index: The start index of the functions.
+    :type start_index: int
+
+    :return: List of exponents :math:`\\frac{1}{i+1}` as exact fractions.
+    :rtype: list
+    """
+
+    return [Fraction(1, i+start_index+1) for i in range(num_func)]
+
+
+# ===========
+# To Fraction
+# ===========
+
+def _to_fraction(value, name):
+    """
+    Converts an integer, a float, a fraction, a ``sympy`` rational or a
+    string such as ``'1/3'`` to an exact fraction. A float is converted to
+    the fraction of its exact binary value.
+    """
+
+    try:
+        if isinstance(value, (numbers.Rational, float)):
+            return Fraction(value)
+        return Fraction(str(value))
+    except (TypeError, ValueError, OverflowError):
+        raise ValueError('"%s" should be a finite real number.' % name)
+
+
+# ===================
+# Get Muntz Exponents
+# ===================
+
+def get_muntz_exponents(exponents, beta=0):
+    """
+    Checks and converts the exponents of general Muntz functions
+    :math:`t^{\\lambda_i}` that are orthonormal with respect to the weight
+    :math:`t^{\\beta - 1}`.
+
+    Since :math:`t^{\\lambda_i} t^{\\lambda_j} t^{\\beta - 1} =
+    t^{x_i} t^{x_j} t^{-1}` with the shifted exponents :math:`x_i =
+    \\lambda_i + \\beta/2`, the functions :math:`t^{x_i}` with the weight
+    :math:`t^{-1}` have the same Gram matrix, and their orthonormal
+    coefficients are the coefficients of the general functions. Hence, the
+    rational processes are used with the shifted exponents unchanged.
+
+    :param exponents: The distinct positive exponents :math:`\\lambda_i`
+        as integers, floats, fractions or strings such as ``'1/3'``.
+    :type exponents: list
+
+    :param beta: The exponent :math:`\\beta` of the weight.
+    :type beta: int, float, fractions.Fraction or str
+
+    :return: The exponents :math:`\\lambda_i`, the exponent
+        :math:`\\beta` and the shifted exponents :math:`x_i` as exact
+        fractions.
+    :rtype: tuple (list, fractions.Fraction, list)
+
+    :raises ValueError: If the exponents are not distinct and positive, or
+        the weight is not integrable against the functions, that is,
+        :math:`2 \\lambda_i + \\beta \\leq 0`.
+    """
+
+    if isinstance(exponents, (str, bytes)) or \
+            (not hasattr(exponents, '__len__')) or (len(exponents) == 0):
+        raise ValueError('"exponents" should be a non-empty list.')
+
+    exponents = [_to_fraction(exponent, 'exponents') for exponent in exponents]
+    beta = _to_fraction(beta, 'beta')
+
+    if min(exponents) <= 0:
+        raise ValueError('"exponents" should be positive.')
+    if len(set(exponents)) != len(exponents):
+        raise ValueError('"exponents" should be distinct.')
+
+    shifted_exponents = [exponent + beta / 2 for exponent in exponents]
+    if min(shifted_exponents) <= 0:
+        raise ValueError('"2 * exponents + beta" should be positive.')
+
+    return exponents, beta, shifted_exponents
+
+
+# ===========
+# Gram matrix
+# ===========
+
+@profiled('gram_matrix')
+def gram_matrix(exponents, beta=0):
+    """
+    Exact Gram matrix of the functions :math:`t^{\\lambda_i}` with respect to
+    the weight :math:`t^{\\beta - 1}` on the interval :math:`[0, 1]`.
+
+    Each inner product has the closed form
+
+    .. math::
+
+        \\int_0^1 t^{\\lambda_i} t^{\\lambda_j} t^{\\beta - 1}
+        \\mathrm{d}t = \\frac{1}{\\lambda_i + \\lambda_j + \\beta},
+
+    hence no symbolic integration is needed. On the interval :math:`[0, L]`
+    the Gram matrix is :math:`G_{ij} L^{\\lambda_i + \\beta/2}
+    L^{\\lambda_j + \\beta/2}`, which is only a diagonal scaling of the
+    matrix on :math:`[0, 1]`.
+
+    :param exponents: The exponents :math:`\\lambda_i` of the functions.
+    :type exponents: list
+
+    :param beta: The exponent :math:`\\beta` of the weight. The default
+        weight is :math:`t^{-1}`.
+    :type beta: int or fractions.Fraction
+
+    :return: The Gram matrix as a list of lists of fractions.
+    :rtype: list
+    """
+
+    return [[1 / (lambda_i + lambda_j + beta) for lambda_j in exponents]
+            for lambda_i in exponents]
+
+
+# =============================
+# Rational Gram-Schmidt Process
+# =============================
+
+@profiled('rational_gram_schmidt_process')
+def rational_gram_schmidt_process(gram, vectors=None, norms=None):
+    """
+    Gram-Schmidt orthogonalization of coefficient vectors in exact rational
+    arithmetic.
+
+    The i-th orthogonal function is
+    :math:`\\psi_i = \\sum_{k \\leq i} v_{ik} \\phi_k` with :math:`v_{ii} = 1`.
+    The inner products of the functions are obtained from the Gram matrix, so
+    no function is ever integrated.
+
+    :param gram: The Gram matrix of the non-orthogonal functions.
+    :type gram: list
+
+    :param vectors: The coefficient vectors of the leading orthogonal
+        functions that are already computed. If given, the process is
+        continued from these functions.
+    :type vectors: list
+
+    :param norms: The squared norms of the leading orthogonal functions that
+        are already computed.
+    :type norms: list
+
+    :return: The coefficient vectors :math:`v_{ik}` (as a ragged list of
+        lists) and the squared norms
+        :math:`\\langle \\psi_i, \\psi_i \\rangle`.
+    :rtype: tuple (list, list)
+    """
+
+    num_func = len(gram)
+    vectors = [] if vectors is None else list(vectors)
+    norms = [] if norms is None else list(norms)
+
+    for i in range(len(vectors), num_func):
+
+        # Start from the non-orthogonal function phi_i
+        vector = [Fraction(0)] * i + [Fraction(1)]
+
+        # Subtract the projection on each of the previous orthogonal functions
+        for j in range(i):
+            projection = sum(gram[i][k] * vectors[j][k]
+                             for k in range(j+1)) / norms[j]
+            for k in range(j+1):
+                vector[k] -= projection * vectors[j][k]
+
+        # Since psi_i is orthogonal to psi_j, j < i, the squared norm is
+        # <psi_i, psi_i> = <psi_i, phi_i>
+        norm = sum(gram[i][k] * vector[k] for k in range(i+1))
+
+        vectors.append(vector)
+        norms.append(norm)
+
+    return vectors, norms
+
+
+# ==========================
+# Rational LDL Factorization
+# ==========================
+
+def rational_ldl_factorization(exponents, diagonal=None):
+    """
+    Exact :math:`\\mathbf{L} \\mathbf{D} \\mathbf{L}^{\\intercal}`
+    factorization of the Gram matrix
+    :math:`G_{ij} = 1 / (\\lambda_i + \\lambda_j)`.
+
+    The Gram matrix is a Cauchy matrix, that is, it satisfies the rank-one
+    displacement equation
+    :math:`\\mathbf{\\Lambda} \\mathbf{G} + \\mathbf{G}
+    \\mathbf{\\Lambda} = \\mathbf{g} \\mathbf{g}^{\\intercal}` with
+    :math:`\\mathbf{g} = \\mathbf{1}`. Each Schur complement of the matrix
+    satisfies the same equation with an updated generator
+    :math:`\\mathbf{g}`, hence the factorization is performed on the
+    generator in :math:`\\mathcal{O}(n^2)` operations without forming the
+    matrix.
+
+    :param exponents: The exponents :math:`\\lambda_i` of the functions.
+    :type exponents: list
+
+    :param diagonal: The diagonal of :math:`\\mathbf{D}` of a leading block
+        of the matrix that is already factorized. If given, the
+        factorization is continued and only the trailing rows of
+        :math:`\\mathbf{L}` are computed.
+    :type diagonal: list
+
+    :return: The rows of the unit lower triangular matrix
+        :math:`\\mathbf{L}` (as a ragged list of rows) that are not in the
+        leading block, and the diagonal of :math:`\\mathbf{D}`.
+    :rtype: tuple (list, list)
+    """
+
+    num_func = len(exponents)
+    diagonal = [] if diagonal is None else list(diagonal)
+    start = len(diagonal)
+
+    # Generator at the pivots of the leading block. Since
+    # G_kk = g_k**2 / (2 lambda_k), the generator is known up to its sign,
+    # which is the sign of prod_{j<k} (lambda_k - lambda_j).
+    pivots = [None] * start
+    for k in range(start):
+        num_larger = sum(1 for j in range(k) if exponents[j] > exponents[k])
+        pivots[k] = (-1)**num_larger * \
+            _rational_sqrt(2 * exponents[k] * diagonal[k])
+
+    generator = [Fraction(1)] * (num_func - start)
+    lower = [[None] * (p+1) for p in range(start, num_func)]
+    diagonal += [None] * (num_func - start)
+
+    for k in range(num_func):
+
+        if k < start:
+            pivot = pivots[k]
+        else:
+            # Pivot of the Schur complement, G_kk = g_k**2 / (2 lambda_k)
+            pivot = generator[k-start]
+            diagonal[k] = pivot**2 / (2 * exponents[k])
+            lower[k-start][k] = Fraction(1)
+
+        # Column of L, G_pk / G_kk
+        for p in range(max(k+1, start), num_func):
+            lower[p-start][k] = (generator[p-start] / pivot) * \
+                (2 * exponents[k]) / (exponents[p] + exponents[k])
+
+        # Generator of the next Schur complement
+        for p in range(max(k+1, start), num_func):
+            generator[p-start] *= (exponents[p] - exponents[k]) / \
+                (exponents[p] + exponents[k])
+
+    return lower, diagonal
+
+
+# =============================
+# Inverse unit lower triangular
+# =============================
+
+def _inverse_unit_lower_triangular(lower, inverse=None):
+    """
+    Exact inverse of a unit lower triangular matrix given as a ragged list of
+    rows of fractions.
+
+    If the rows of the inverse of a leading block are given by ``inverse``,
+    ``lower`` contains only the trailing rows of the matrix and only the
+    trailing rows of the inverse are returned.
+
+    Each row of the inverse is kept as a list of integer numerators over a
+    common denominator, which avoids the reduction of every intermediate
+    fraction.
+    """
+
+    numerators = []
+    denominators = []
+
+    # Leading rows of the inverse as integers over a common denominator
+    for row in ([] if inverse is None else inverse):
+        denominator = math.lcm(*[entry.denominator for entry in row])
+        numerators.append([entry.numerator * (denominator // entry.denominator)
+                           for entry in row])
+        denominators.append(denominator)
+
+    start = len(numerators)
+    num_rows = start + len(lower)
+
+    for i in range(start, num_rows):
+
+        row_lower = lower[i-start]
+
+        # Common denominator of row i of the inverse
+        denominator = 1
+        for k in range(i):
+            denominator = math.lcm(
+                    denominator, row_lower[k].denominator * denominators[k])
+
+        # Row i of the inverse is e_i - sum_k L_ik (row k of the inverse)
+        row = [0] * (i+1)
+        row[i] = denominator
+        for k in range(i):
+            multiplier = row_lower[k].numerator * \
+                (denominator // (row_lower[k].denominator * denominators[k]))
+            if multiplier != 0:
+                for j in range(k+1):
+                    row[j] -= multiplier * numerators[k][j]
+
+        gcd = math.gcd(denominator, *row)
+        numerators.append([entry // gcd for entry in row])
+        denominators.append(denominator // gcd)
+
+    return [[Fraction(entry, denominators[i]) for entry in numerators[i]]
+            for i in range(start, num_rows)]
+
+
+# =========================
+# Rational Cholesky Process
+# =========================
+
+@profiled('rational_cholesky_process')
+def rational_cholesky_process(exponents, vectors=None, norms=None):
+    """
+    Orthogonalization of the functions :math:`t^{\\lambda_i}` by the exact
+    :math:`\\mathbf{L} \\mathbf{D} \\mathbf{L}^{\\intercal}`
+    factorization of their Gram matrix.
+
+    If :math:`\\mathbf{G} = \\mathbf{L} \\mathbf{D}
+    \\mathbf{L}^{\\intercal}`, the rows of
+    :math:`\\mathbf{V} = \\mathbf{L}^{-1}` are the coefficient vectors of
+    the orthogonal functions since
+    :math:`\\mathbf{V} \\mathbf{G} \\mathbf{V}^{\\intercal} =
+    \\mathbf{D}`. The output is the same as
+    :func:`rational_gram_schmidt_process`.
+
+    :param exponents: The exponents :math:`\\lambda_i` of the functions.
+    :type exponents: list
+
+    :param vectors: The coefficient vectors of the leading orthogonal
+        functions that are already computed. If given, the factorization is
+        continued from these functions.
+    :type vectors: list
+
+    :param norms: The squared norms of the leading orthogonal functions that
+        are already computed.
+    :type norms: list
+
+    :return: The coefficient vectors :math:`v_{ik}` (as a ragged list of
+        lists) and the squared norms of the orthogonal functions.
+    :rtype: tuple (list, list)
+    """
+
+    vectors = [] if vectors is None else list(vectors)
+    lower, diagonal = rational_ldl_factorization(exponents, diagonal=norms)
+    vectors += _inverse_unit_lower_triangular(lower, inverse=vectors)
+
+    return vectors, diagonal
+
+
+# ========================
+# Rational Product Process
+# ========================
+
+@profiled('rational_product_process')
+def rational_product_process(exponents, vectors=None, norms=None):
+    """
+    Orthogonalization of the functions :math:`t^{\\lambda_i}` by the
+    product formula of the orthogonal functions.
+
+    The functions
+
+    .. math::
+
+        \\psi_n(t) = \\frac{1}{2 \\pi \\mathrm{i}} \\oint
+        \\frac{\\prod_{j<n} (z + \\lambda_j)}{\\prod_{j \\leq n}
+        (z - \\lambda_j)} t^z \\, \\mathrm{d}z = \\sum_{k \\leq n} c_{nk}
+        t^{\\lambda_k},
+
+    where the contour encloses the exponents, are orthogonal on
+    :math:`[0, 1]` with respect to the weight :math:`t^{-1}` and have the
+    squared norms :math:`1 / (2 \\lambda_n)`. The residues :math:`c_{nk}`
+    are the coefficients :math:`a_{nk}` of the orthonormal functions. They
+    satisfy the recurrence
+
+    .. math::
+
+        c_{nk} = \\frac{\\lambda_k + \\lambda_{n-1}}{\\lambda_k - \\lambda_n}
+        c_{n-1,k}, \\quad k < n, \\qquad
+        c_{nn} = \\prod_{j<n} \\frac{\\lambda_n + \\lambda_j}{\\lambda_n -
+        \\lambda_j},
+
+    which is the differential recurrence
+    :math:`(D - \\lambda_n) \\psi_n = (D + \\lambda_{n-1}) \\psi_{n-1}`
+    with :math:`D = t \\, \\mathrm{d}/\\mathrm{d}t`. Hence, each
+    coefficient is computed with one rational product, which is
+    :math:`\\mathcal{O}(n^2)` operations in total and does not invert a
+    matrix. The output is the same as :func:`rational_cholesky_process`.
+
+    :param exponents: The exponents :math:`\\lambda_i` of the functions. The
+        exponents should be distinct.
+    :type exponents: list
+
+    :param vectors: The coefficient vectors of the leading orthogonal
+        functions that are already computed. If given, the recurrence is
+        continued from these functions.
+    :type vectors: list
+
+    :param norms: The squared norms of the leading orthogonal functions that
+        are already computed.
+    :type norms: list
+
+    :return: The coefficient vectors :math:`v_{ik}` (as a ragged list of
+        lists) and the squared norms of the orthogonal functions.
+    :rtype: tuple (list, list)
+    """
+
+    vectors = [] if vectors is None else list(vectors)
+    norms = [] if norms is None else list(norms)
+    start = len(vectors)
+
+    # Residues of the last function that is already computed
+    residues = None
+    if start > 0:
+        n = start - 1
+        leading = Fraction(1)
+        for j in range(n):
+            leading *= (exponents[n] + exponents[j]) / \
+                (exponents[n] - exponents[j])
+        residues = [leading * coeff for coeff in vectors[n]]
+
+    for n in range(start, len(exponents)):
+
+        # Residue at the new exponent
+        leading = Fraction(1)
+        for j in range(n):
+            leading *= (exponents[n] + exponents[j]) / \
+                (exponents[n] - exponents[j])
+
+        # Residues at the previous exponents by the recurrence
+        if n == 0:
+            residues = [leading]
+        else:
+            residues = [residue * (exponents[k] + exponents[n-1]) /
+                        (exponents[k] - exponents[n])
+                        for k, residue in enumerate(residues)]
+            residues.append(leading)
+
+        # Unit diagonal vector and its squared norm
+        vectors.append([residue / leading for residue in residues])
+        norms.append(1 / (2 * exponents[n] * leading**2))
+
+    return vectors, norms
+
+
+# ==================
+# Coeffs Closed Form
+# ==================
+
+def coeffs_closed_form(
+        start_index,
+        num_func,
+        validate=False):
+    """
+    Integer coefficients :math:`a_{ij}` of the orthonormal functions in closed
+    form.
+
+    Parameters
+    ----------
+
+        start_index : int
+            The index of the starting function, :math:`i_0`.
+
+        num_func : int
+            Number of orthogonal functions.
+
+        validate : bool, default=False
+            If `True`, the coefficients are cross-checked against the symbolic
+            Gram-Schmidt process. As the symbolic process is slow, this option
+            is only suitable for a small number of functions.
+
+    Returns
+    -------
+
+        coeffs : list of lists
+            Coefficients :math:`a_{ij}`, where the i-th list contains the
+            coefficients :math:`a_{ij}`, :math:`j = 0, \\dots, i`, of the
+            i-th orthonormal function.
+
+    Raises
+    ------
+
+        RuntimeError
+            If ``validate`` is `True` and the coefficients do not match the
+            symbolic Gram-Schmidt process.
+
+    See Also
+    --------
+
+    ortho.OrthogonalFunctions
+
+    Notes
+    -----
+
+    With :math:`m_i = i + i_0 + 1`, the coefficients of the orthonormal
+    functions :math:`\\phi_{i_0+i}^{\\perp}` are
+
+    .. math::
+
+        a_{ij} = (-1)^j \\frac{m_i}{m_j} \\binom{i}{j}
+        \\binom{i+j+2i_0+1}{i}, \\qquad j = 0, \\dots, i,
+
+    and :math:`\\alpha_i = (-1)^i \\sqrt{2/m_i}`. Each row is filled from
+    the ratio of its consecutive binomial products, that is, with
+    :math:`\\mathcal{O}(i)` integer operations and without ``sympy``.
+
+    Examples
+    --------
+
+    .. code-block:: python
+
+        >>> from ortho import coeffs_closed_form
+        >>> coeffs_closed_form(start_index=1, num_func=4)
+        [[1], [6, -5], [20, -40, 21], [50, -175, 210, -84]]
+    """
+
+    shift = 2 * start_index + 2
+    coeffs = []
+
+    for i in range(num_func):
+
+        m_i = i + start_index + 1
+
+        # binom(i, j) * binom(i+j+2i0+1, i) at j = 0
+        binomials = math.comb(i + shift - 1, i)
+        sign = 1
+
+        row = []
+        for j in range(i+1):
+
+            # m_i * binomials is always divisible by m_j
+            row.append(sign * ((m_i * binomials) // (j + start_index + 1)))
+
+            # Ratio of the binomial products of the consecutive coefficients
+            binomials = (binomials * (i - j) * (i + j + shift)) // \
+                ((j + 1) * (j + shift))
+            sign = -sign
+
+        coeffs.append(row)
+
+    if validate:
+
+        from .orthogonalization_utilities import gram_schmidt_process
+        from .orthogonalization_utilities import get_symbolic_coeffs
+
+        # Reference coefficients by the symbolic Gram-Schmidt process
+        phi_orthonormalized_list = gram_schmidt_process(
+                num_func, start_index, [0, 1])
+        _, sym_coeffs = get_symbolic_coeffs(phi_orthonormalized_list,
+                                            start_index)
+
+        for i in range(num_func):
+            if coeffs[i] != [int(coeff) for coeff in sym_coeffs[i]]:
+                raise RuntimeError('Closed-form coefficients of the ' +
+                                   'function %d ' % (i+start_index) +
+                                   'do not match the Gram-Schmidt process.')
+
+    return coeffs
+
+
+# =============
+# Rational sqrt
+# =============
+
+def _rational_sqrt(value):
+    """
+    Exact square root of a fraction that is the square of a rational number.
+    """
+
+    numerator = math.isqrt(value.numerator)
+    denominator = math.isqrt(value.denominator)
+
+    if (numerator**2 != value.numerator) or \
+            (denominator**2 != value.denominator):
+        raise ValueError('%s is not the square of a rational number.' % value)
+
+    return Fraction(numerator, denominator)
+
+
+# ===================
+# Get rational coeffs
+# ===================
+
+@profiled('get_rational_coeffs')
+def get_rational_coeffs(
+        exponents,
+        vectors,
+        norms,
+        start=0):
+    """
+    Converts orthogonal coefficient vectors to the coefficients
+    :math:`\\alpha_i` and :math:`a_{ij}` of the orthonormal functions.
+
+    The orthonormal functions are
+    :math:`\\phi_i^{\\perp} = \\alpha_i \\sum_j a_{ij} \\phi_j` where
+    :math:`\\alpha_i = \\pm \\sqrt{2 \\lambda_i}` and :math:`a_{ij}` are
+    rational (integers for the default exponents). The sign of
+    :math:`\\alpha_i` is chosen so that :math:`\\alpha_i a_{ii} > 0`.
+
+    :param exponents: The exponents :math:`\\lambda_i` of the functions.
+    :type exponents: list
+
+    :param vectors: Orthogonal coefficient vectors with unit diagonal.
+    :type vectors: list
+
+    :param norms: Squared norms of the orthogonal functions.
+    :type norms: list
+
+    :param start: Index of the first function to convert. The coefficients
+        of the functions before ``start`` are not returned.
+    :type start: int
+
+    :return: The squares :math:`\\alpha_i^2`, the signs of :math:`\\alpha_i`,
+        and the ragged list of lists of :math:`a_{ij}`.
+    :rtype: tuple (list, list, list)
+    """
+
+    num_func = len(vectors)
+    alpha_squared = [None] * num_func
+    alpha_sign = [None] * num_func
+    coeffs = [None] * num_func
+
+    for j in range(start, num_func):
+
+        alpha_squared[j] = 2 * exponents[j]
+
+        # The leading coefficient a_jj satisfies a_jj**2 = 1/(2 lambda_j N_j)
+        leading = _rational_sqrt(1 / (alpha_squared[j] * norms[j]))
+
+        # Sign of the leading coefficient of the product formula
+        num_larger = sum(1 for k in range(j) if exponents[k] > exponents[j])
+        alpha_sign[j] = (-1)**num_larger
+
+        coeffs[j] = [alpha_sign[j] * leading * coeff
+                     for coeff in vectors[j]]
+
+    return alpha_squared[start:], alpha_sign[start:], coeffs[start:]
+
+
+# ====================
+# Get rational vectors
+# ====================
+
+def get_rational_vectors(
+        exponents,
+        coeffs):
+    """
+    Converts the coefficients :math:`a_{ij}` of the orthonormal functions
+    back to the orthogonal coefficient vectors and their squared norms.
+
+    This is the inverse of :func:`get_rational_coeffs`. The vectors have a
+    unit diagonal, :math:`v_{ij} = a_{ij} / a_{ii}`, and since
+    :math:`a_{ii}^2 = 1 / (2 \\lambda_i N_i)`, the squared norms are
+    :math:`N_i = 1 / (2 \\lambda_i a_{ii}^2)`.
+
+    :param exponents: The exponents :math:`\\lambda_i` of the functions.
+    :type exponents: list
+
+    :param coeffs: The ragged list of lists of :math:`a_{ij}`.
+    :type coeffs: list
+
+    :return: The coefficient vectors :math:`v_{ij}` and the squared norms of
+        the orthogonal functions.
+    :rtype: tuple (list, list)
+    """
+
+    vectors = []
+    norms = []
+
+    for j, row in enumerate(coeffs):
+        vectors.append([coeff / row[j] for coeff in row])
+        norms.append(1 / (2 * exponents[j] * row[j]**2))
+
+    return vectors, norms
+
+
+# =================================
+# Get rational coeffs from symbolic
+# =================================
+
+def get_rational_coeffs_from_symbolic(
+        sym_alpha,
+        sym_coeffs):
+    """
+    Converts the symbolic coefficients :math:`\\alpha_i` and :math:`a_{ij}`
+    to exact rational coefficients.
+
+    This is the inverse of :func:`get_rational_symbolic_functions` on the
+    interval :math:`[0, 1]`.
+
+    :param sym_alpha: The symbolic coefficients :math:`\\alpha_i`.
+    :type sym_alpha: list
+
+    :param sym_coeffs: The symbolic coefficients :math:`a_{ij}`.
+    :type sym_coeffs: list
+
+    :return: The squares :math:`\\alpha_i^2`, the signs of :math:`\\alpha_i`,
+        and the ragged list of lists of :math:`a_{ij}`.
+    :rtype: tuple (list, list, list)
+
+    :raises ValueError: If the coefficients are not rational.
+    """
+
+    alpha_squared = []
+    alpha_sign = []
+    coeffs = []
+
+    for alpha, row in zip(sym_alpha, sym_coeffs):
+
+        square = alpha**2
+        if not square.is_Rational:
+            raise ValueError('%s is not the square root of a rational '
+                             'number.' % alpha)
+        alpha_squared.append(Fraction(int(square.p), int(square.q)))
+        alpha_sign.append(1 if alpha.is_positive else -1)
+
+        coeffs.append([])
+        for coeff in row:
+            if not coeff.is_Rational:
+                raise ValueError('%s is not a rational number.' % coeff)
+            coeffs[-1].append(Fraction(int(coeff.p), int(coeff.q)))
+
+    return alpha_squared, alpha_sign, coeffs
+
+
+# ===============================
+# Get rational symbolic functions
+# ===============================
+
+@profiled('get_rational_symbolic_functions')
+def get_rational_symbolic_functions(
+        exponents,
+        alpha_squared,
+        alpha_sign,
+        coeffs,
+        interval,
+        powers=None):
+    """
+    Builds the symbolic coefficients and orthonormal functions from their
+    exact rational coefficients.
+
+    The functions on :math:`[0, L]` are the functions on :math:`[0, 1]`
+    evaluated at :math:`t/L`, hence :math:`a_{ij}` are scaled by
+    :math:`L^{-\\lambda_j}`.
+
+    :param exponents: The exponents :math:`\\lambda_i` of the functions.
+        For the general functions of :func:`get_muntz_exponents`, these are
+        the shifted exponents, which determine the scaling.
+    :type exponents: list
+
+    :param alpha_squared: The squares of :math:`\\alpha_i`.
+    :type alpha_squared: list
+
+    :param alpha_sign: The signs of :math:`\\alpha_i`.
+    :type alpha_sign: list
+
+    :param coeffs: The coefficients :math:`a_{ij}` on the interval
+        :math:`[0, 1]`.
+    :type coeffs: list
+
+    :param interval: The interval of the domain of the functions in the form
+        ``[Start, End]``.
+    :type interval: list
+
+    :param powers: The exponents of the powers :math:`t^{\\lambda_j}` of the
+        functions. If `None`, these are ``exponents``.
+    :type powers: list
+
+    :return: The symbolic ``sym_alpha``, ``sym_coeffs`` and list of
+        orthonormal functions.
+    :rtype: tuple (list, list, list)
+    """
+
+    import sympy
+    from .declarations import t
+
+    end = sympy.S(interval[1])
+    sym_exponents = [sympy.Rational(exponent.numerator, exponent.denominator)
+                     for exponent in exponents]
+    if powers is None:
+        powers = exponents
+    basis = [t**sympy.Rational(power.numerator, power.denominator)
+             for power in powers]
+
+    num_func = len(coeffs)
+    sym_alpha = [None] * num_func
+    sym_coeffs = [None] * num_func
+    sym_phi = [None] * num_func
+
+    for j in range(num_func):
+
+        norm = sympy.sqrt(sympy.Rational(alpha_squared[j].numerator,
+                                         alpha_squared[j].denominator))
+        sym_alpha[j] = alpha_sign[j] * norm
+
+        sym_coeffs[j] = [sympy.Rational(coeff.numerator, coeff.denominator)
+                         for coeff in coeffs[j]]
+
+        # The functions on [0, L] are scaled by L**(-lambda_j)
+        if end != 1:
+            sym_coeffs[j] = [coeff / end**sym_exponents[i]
+                             for i, coeff in enumerate(sym_coeffs[j])]
+
+        # The sign of alpha is moved into the terms, similar to the output of
+        # the symbolic Gram-Schmidt process.
+        function = sympy.Add(*[sympy.Mul(alpha_sign[j] * coeff, basis[i])
+                               for i, coeff in enumerate(sym_coeffs[j])])
+
+        sym_phi[j] = norm * function
+
+    return sym_alpha, sym_coeffs, sym_phi
+
+
+# ===========================
+# Get rational numeric coeffs
+# ===========================
+
+@profiled('get_rational_numeric_coeffs')
+def get_rational_numeric_coeffs(
+        exponents,
+        alpha_squared,
+        alpha_sign,
+        coeffs,
+        interval):
+    """
+    Evaluates the exact rational coefficients to numerics.
+
+    The coefficients :math:`a_{ij}` remain integers if they are integers and
+    the interval is :math:`[0, 1]`. Otherwise, they are converted to floats
+    and scaled by :math:`L^{-\\lambda_j}`.
+
+    :param exponents: The exponents :math:`\\lambda_i` of the functions.
+        For the general functions of :func:`get_muntz_exponents`, these are
+        the shifted exponents.
+    :type exponents: list
+
+    :param alpha_squared: The squares of :math:`\\alpha_i`.
+    :type alpha_squared: list
+
+    :param alpha_sign: The signs of :math:`\\alpha_i`.
+    :type alpha_sign: list
+
+    :param coeffs: The coefficients :math:`a_{ij}` on the interval
+        :math:`[0, 1]`.
+    :type coeffs: list
+
+    :param interval: The interval of the domain of the functions in the form
+        ``[Start, End]``.
+    :type interval: list
+
+    :return: The list of :math:`\\alpha_i` and the ragged list of lists of
+        :math:`a_{ij}`.
+    :rtype: tuple (list, list)
+    """
+
+    end = interval[1]
+    num_func = len(coeffs)
+    alpha = []
+    numeric_coeffs = [None] * num_func
+
+    for j in range(num_func):
+        alpha.append(alpha_sign[j] * math.sqrt(alpha_squared[j]))
+
+        numeric_coeffs[j] = []
+        for i, coeff in enumerate(coeffs[j]):
+            if (end == 1) and (coeff.denominator == 1):
+                numeric_coeffs[j].append(int(coeff))
+            else:
+                numeric_coeffs[j].append(
+                        float(coeff) / end**float(exponents[i]))
+
+    return alpha, numeric_coeffs
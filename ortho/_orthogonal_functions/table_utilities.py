@@ -0,0 +1,294 @@
+# SPDX-FileCopyrightText: Copyright 2021, Siavash Ameli <sameli@berkeley.edu>
+# SPDX-License-Identifier: BSD-3-Clause
+# SPDX-FileType: SOURCE
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the license found in the LICENSE.txt file in the root directory
+# of this source tree.
+
+
+# =======
+# Imports
+# =======
+
+import os
+import json
+import struct
+import zipfile
+from fractions import Fraction
+import numpy
+from ..__version__ import __version__
+from .triangular_utilities import pack_rows
+from .profile_utilities import profiled
+
+__all__ = ['save_table', 'load_table', 'decode_rational']
+
+# Name and version of the format of the tables. The version is increased when
+# the layout of the arrays changes.
+_FORMAT = 'ortho-table'
+_FORMAT_VERSION = 1
+
+# Size and signature of the local file header of a zip member
+_LOCAL_HEADER_SIZE = 30
+_LOCAL_HEADER_SIGNATURE = b'PK\x03\x04'
+
+
+# ===============
+# Encode integers
+# ===============
+
+def _encode_integers(integers):
+    """
+    Concatenates the signed little-endian bytes of arbitrary-size integers.
+    Returns the bytes and the offsets of the integers in the bytes.
+    """
+
+    chunks = [integer.to_bytes(integer.bit_length() // 8 + 1, 'little',
+                               signed=True) for integer in integers]
+
+    offsets = numpy.zeros(len(chunks) + 1, dtype=numpy.int64)
+    numpy.cumsum([len(chunk) for chunk in chunks], out=offsets[1:])
+    data = numpy.frombuffer(b''.join(chunks), dtype=numpy.uint8)
+
+    return data, offsets
+
+
+# ===============
+# Decode integers
+# ===============
+
+def _decode_integers(data, offsets):
+    """
+    Inverse of :func:`_encode_integers`.
+    """
+
+    view = memoryview(numpy.ascontiguousarray(data))
+    offsets = offsets.tolist()
+
+    return [int.from_bytes(view[start:end], 'little', signed=True)
+            for start, end in zip(offsets[:-1], offsets[1:])]
+
+
+# ==========
+# Save table
+# ==========
+
+@profiled('save_table')
+def save_table(
+        path,
+        parameters,
+        alpha_squared,
+        alpha_sign,
+        coeffs,
+        alpha,
+        numeric_coeffs):
+    """
+    Writes the coefficients of the orthonormal functions to a binary table.
+
+    The table is an uncompressed ``.npz`` file with the arrays
+
+    * ``format``, ``format_version`` and ``metadata``: The name and version
+      of the format, and the JSON of the parameters and the package version.
+    * ``alpha`` and ``coeffs``: The ``float64`` copies of :math:`\\alpha_i`
+      and of the rows of :math:`a_{ij}` packed by :func:`pack_rows`.
+    * ``alpha_sign``: The signs of :math:`\\alpha_i`.
+    * ``integers`` and ``integer_offsets``: The exact numerators and
+      denominators of :math:`\\alpha_i^2` followed by those of the packed
+      :math:`a_{ij}` on the interval :math:`[0, 1]`, as the signed
+      little-endian bytes of the integers and their offsets.
+
+    The file is written to a temporary file that is atomically renamed, so
+    that concurrent processes never read a partially written table. The
+    table has the permissions of a new file under the umask of the process,
+    as the temporary file is created with those permissions.
+
+    :param path: The path of the file.
+    :type path: str
+
+    :param parameters: The parameters that determine the functions, such as
+        ``start_index``, ``num_func``, ``end_interval`` and ``method``.
+    :type parameters: dict
+
+    :param alpha_squared: The exact squares of :math:`\\alpha_i`.
+    :type alpha_squared: list
+
+    :param alpha_sign: The signs of :math:`\\alpha_i`.
+    :type alpha_sign: list
+
+    :param coeffs: The exact coefficients :math:`a_{ij}` on the interval
+        :math:`[0, 1]`.
+    :type coeffs: list
+
+    :param alpha: The numeric coefficients :math:`\\alpha_i`.
+    :type alpha: list
+
+    :param numeric_coeffs: The numeric coefficients :math:`a_{ij}` on the
+        interval of the functions.
+    :type numeric_coeffs: list
+    """
+
+    fractions = list(alpha_squared) + [coeff for row in coeffs
+                                       for coeff in row]
+    integers = [value for fraction in fractions
+                for value in (fraction.numerator, fraction.denominator)]
+    data, offsets = _encode_integers(integers)
+
+    metadata = dict(parameters, version=__version__)
+
+    arrays = {
+        'format': numpy.array(_FORMAT),
+        'format_version': numpy.array(_FORMAT_VERSION, dtype=numpy.int64),
+        'metadata': numpy.array(json.dumps(metadata, sort_keys=True)),
+        'alpha': numpy.array(alpha, dtype=numpy.float64),
+        'coeffs': pack_rows(numeric_coeffs),
+        'alpha_sign': numpy.array(alpha_sign, dtype=numpy.int8),
+        'integers': data,
+        'integer_offsets': offsets,
+    }
+
+    # The temporary file is in the directory of the table, so that it can be
+    # renamed atomically. It is created exclusively with the mode of a new
+    # file, to which the kernel applies the umask, so that the processes of
+    # other users can also memory-map the table.
+    temp_filename = '%s.%d.%s.tmp' % (os.path.abspath(path), os.getpid(),
+                                      os.urandom(4).hex())
+    descriptor = os.open(temp_filename, os.O_WRONLY | os.O_CREAT | os.O_EXCL,
+                         0o666)
+    try:
+        with os.fdopen(descriptor, 'wb') as file:
+            numpy.savez(file, **arrays)
+
+        os.replace(temp_filename, path)
+    except BaseException:
+        if os.path.exists(temp_filename):
+            os.remove(temp_filename)
+        raise
+
+
+# ==========
+# Memory map
+# ==========
+
+def _memory_map(path, file, info):
+    """
+    Memory-maps an uncompressed ``.npy`` member of a zip file. Returns `None`
+    if the member cannot be mapped.
+    """
+
+    if info.compress_type != zipfile.ZIP_STORED:
+        return None
+
+    # The data follows the local header, whose extra field may differ from
+    # the extra field of the central directory.
+    file.seek(info.header_offset)
+    header = file.read(_LOCAL_HEADER_SIZE)
+    if header[:4] != _LOCAL_HEADER_SIGNATURE:
+        return None
+    name_length, extra_length = struct.unpack('<HH', header[26:30])
+    file.seek(info.header_offset + _LOCAL_HEADER_SIZE + name_length +
+              extra_length)
+
+    version = numpy.lib.format.read_magic(file)
+    if version == (1, 0):
+        shape, fortran_order, dtype = \
+            numpy.lib.format.read_array_header_1_0(file)
+    else:
+        shape, fortran_order, dtype = \
+            numpy.lib.format.read_array_header_2_0(file)
+
+    if dtype.hasobject:
+        return None
+    if numpy.prod(shape, dtype=numpy.int64) == 0:
+        return numpy.empty(shape, dtype=dtype)
+
+    return numpy.memmap(path, dtype=dtype, mode='r', offset=file.tell(),
+                        shape=shape, order='F' if fortran_order else 'C')
+
+
+# ==========
+# Load table
+# ==========
+
+@profiled('load_table')
+def load_table(path, mmap=True):
+    """
+    Reads a table of :func:`save_table`.
+
+    :param path: The path of the file.
+    :type path: str
+
+    :param mmap: If `True`, the arrays are memory-mapped read-only from the
+        file rather than copied, so that the processes that load the same
+        table share its pages.
+    :type mmap: bool
+
+    :return: A dictionary with the keys ``'parameters'``, and the arrays
+        ``'alpha'``, ``'coeffs'``, ``'alpha_sign'``, ``'integers'`` and
+        ``'integer_offsets'`` of the table. The exact coefficients are not
+        decoded, see :func:`decode_rational`.
+    :rtype: dict
+
+    :raises ValueError: If the file is not a table or its format version is
+        not supported.
+    """
+
+    arrays = {}
+    with numpy.load(path, allow_pickle=False) as npz:
+
+        if ('format' not in npz.files) or (str(npz['format']) != _FORMAT):
+            raise ValueError('"%s" is not a table of the functions.' % path)
+        if int(npz['format_version']) != _FORMAT_VERSION:
+            raise ValueError('The format version %d of "%s" '
+                             % (int(npz['format_version']), path) +
+                             'is not supported.')
+
+        names = ['alpha', 'coeffs', 'alpha_sign', 'integers',
+                 'integer_offsets']
+        if mmap:
+            with open(path, 'rb') as file, zipfile.ZipFile(file) as archive:
+                for name in names:
+                    arrays[name] = _memory_map(
+                            path, file, archive.getinfo(name + '.npy'))
+
+        for name in names:
+            if arrays.get(name) is None:
+                arrays[name] = npz[name]
+
+        metadata = json.loads(str(npz['metadata']))
+
+    metadata.pop('version', None)
+
+    return dict(arrays, parameters=metadata)
+
+
+# ===============
+# Decode rational
+# ===============
+
+@profiled('decode_rational')
+def decode_rational(table):
+    """
+    Decodes the exact coefficients of a table of :func:`load_table`.
+
+    :param table: The table of :func:`load_table`.
+    :type table: dict
+
+    :return: The exact squares :math:`\\alpha_i^2` and the ragged list of
+        lists of the exact coefficients :math:`a_{ij}` on the interval
+        :math:`[0, 1]` as fractions.
+    :rtype: tuple (list, list)
+    """
+
+    num_func = table['alpha'].size
+    integers = _decode_integers(table['integers'], table['integer_offsets'])
+    fractions = [Fraction(numerator, denominator) for numerator, denominator
+                 in zip(integers[0::2], integers[1::2])]
+
+    # Unpack the rows of the exact coefficients
+    rational_coeffs = []
+    offset = num_func
+    for i in range(num_func):
+        rational_coeffs.append(fractions[offset:offset+i+1])
+        offset += i + 1
+
+    return fractions[:num_func], rational_coeffs
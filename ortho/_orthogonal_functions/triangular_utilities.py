@@ -0,0 +1,472 @@
+# SPDX-FileCopyrightText: Copyright 2021, Siavash Ameli <sameli@berkeley.edu>
+# SPDX-License-Identifier: BSD-3-Clause
+# SPDX-FileType: SOURCE
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the license found in the LICENSE.txt file in the root directory
+# of this source tree.
+
+
+# =======
+# Imports
+# =======
+
+import math
+import functools
+from fractions import Fraction
+import numpy
+
+__all__ = ['pack_rows', 'TriangularCoeffs']
+
+
+# =========
+# Pack rows
+# =========
+
+def pack_rows(rows, dtype=numpy.float64, start=0):
+    """
+    Packs the rows of a lower triangular matrix into a contiguous array.
+
+    The row :math:`i` of length :math:`i+1` is stored at the offset
+    :math:`i(i+1)/2`.
+
+    :param rows: The ragged list of lists of the rows.
+    :type rows: list
+
+    :param dtype: The data type of the array. If ``object``, the entries are
+        stored as they are, except that the fractions with the denominator
+        one are stored as integers. Otherwise, they are converted to floats.
+    :type dtype: numpy.dtype
+
+    :param start: The index of the first row, where the row :math:`i` has
+        the length :math:`i + 1 + \\mathrm{start}`.
+    :type start: int
+
+    :return: The one-dimensional array of the packed rows.
+    :rtype: numpy.ndarray
+
+    :raises ValueError: If the rows are not of the lengths of a lower
+        triangular matrix.
+    """
+
+    sizes = [len(row) for row in rows]
+    if sizes != list(range(start+1, start+len(rows)+1)):
+        raise ValueError('The rows should be the rows of a lower ' +
+                         'triangular matrix.')
+
+    packed = numpy.empty(sum(sizes), dtype=dtype)
+    convert = dtype != object
+
+    offset = 0
+    for row, size in zip(rows, sizes):
+        if convert:
+            packed[offset:offset+size] = [float(entry) for entry in row]
+        else:
+            packed[offset:offset+size] = [
+                int(entry) if isinstance(entry, Fraction) and
+                (entry.denominator == 1) else entry for entry in row]
+        offset += size
+
+    return packed
+
+
+# ==========
+# Scale rows
+# ==========
+
+def _scale_rows(rows, end, exponents):
+    """
+    Numeric rows of the exact rows on :math:`[0, 1]` that are scaled by
+    :math:`L^{-x_j}` to the interval :math:`[0, L]`.
+    """
+
+    if (end == 1) or (len(rows) == 0):
+        return rows
+
+    if (exponents is None) or (len(exponents) < max(map(len, rows))):
+        raise ValueError('"exponents" of the columns are required to ' +
+                         'scale the rows to the interval.')
+
+    return [[float(entry) / end**float(exponents[j])
+             for j, entry in enumerate(row)] for row in rows]
+
+
+# ================
+# Get leading rows
+# ================
+
+def _get_leading_rows(coeffs, stop):
+    """
+    The exact leading rows of the coefficients, which are decoded for the
+    slices of the coefficients.
+    """
+
+    return coeffs.tolist()[:stop]
+
+
+# =================
+# Triangular Coeffs
+# =================
+
+class TriangularCoeffs(object):
+    """
+    Lower triangular coefficients :math:`a_{ij}` packed in contiguous arrays.
+
+    The row :math:`i` holds the coefficients :math:`a_{ij}`,
+    :math:`j = 0, \\dots, i`, at the offset :math:`i(i+1)/2` of two arrays,
+    namely, an array of ``float64`` for the evaluation of the functions and
+    an array of objects for the exact values.
+
+    The exact values are the rational coefficients of the functions on the
+    interval :math:`[0, 1]`, which are integers for the default exponents.
+    On the interval :math:`[0, L]`, the coefficient of the column :math:`j`
+    is the exact value times the exact factor :math:`L^{-x_j}`, which is
+    irrational in general. Hence, the factor is kept separately by the end
+    :math:`L` and the exponents :math:`x_j` of the columns, and only the
+    numeric values are scaled.
+
+    Parameters
+    ----------
+
+        rows : list, default=None
+            The ragged list of lists of the rows.
+
+        numeric : numpy.ndarray, default=None
+            The packed ``float64`` rows. If `None`, they are converted from
+            ``rows`` and are scaled to the interval. This can be a read-only
+            array, such as a memory-mapped array, which is used without a
+            copy.
+
+        end : int or float, default=1
+            The end :math:`L` of the interval of the numeric rows.
+
+        exponents : list, default=None
+            The exponents :math:`x_j` of the columns, which are required if
+            ``end`` is not one.
+
+        decode : callable, default=None
+            A function without arguments that returns the exact rows. If
+            given, ``rows`` should be `None` and ``numeric`` is required.
+            The function is called on the first access of the exact rows,
+            so that the exact rows of a table are not decoded until they are
+            used.
+
+    Attributes
+    ----------
+
+        numeric : numpy.ndarray
+            The packed ``float64`` rows.
+
+        exact : numpy.ndarray
+            The packed exact rows on the interval :math:`[0, 1]` as an array
+            of integers and fractions.
+
+        end : int or float
+            The end :math:`L` of the interval.
+
+        exponents : list
+            The exponents :math:`x_j` of the scaling factors
+            :math:`L^{-x_j}` of the columns.
+
+    Methods
+    -------
+    extend
+    tolist
+    to_matrix
+
+    Notes
+    -----
+
+    The object behaves as a list of rows. Indexing with an integer gives a
+    view of the row in :attr:`numeric`, hence changing an entry of the row
+    changes the evaluation of the functions. Slicing the leading rows gives
+    a :class:`TriangularCoeffs` of these rows. The comparison with ``==``
+    compares the exact rows and the scaling factors with another object, or
+    the exact rows with a list of lists.
+
+    Examples
+    --------
+
+    .. code-block:: python
+
+        >>> from ortho import OrthogonalFunctions
+        >>> OF = OrthogonalFunctions(num_func=3)
+        >>> OF.coeffs
+        [[1], [6, -5], [20, -40, 21]]
+        >>> OF.coeffs[2]
+        array([ 20., -40.,  21.])
+        >>> OF.coeffs.numeric
+        array([  1.,   6.,  -5.,  20., -40.,  21.])
+    """
+
+    __slots__ = ('_num_rows', '_numeric', '_exact', '_end', '_exponents',
+                 '_decode')
+
+    # ----
+    # Init
+    # ----
+
+    def __init__(self, rows=None, numeric=None, end=1, exponents=None,
+                 decode=None):
+        """
+        Packs the rows.
+        """
+
+        self._decode = decode
+        if decode is not None:
+            if (rows is not None) or (numeric is None):
+                raise ValueError('"decode" should be given with "numeric" ' +
+                                 'and without "rows".')
+
+            # The exact rows are decoded on their first access
+            num_rows = (math.isqrt(8 * numeric.size + 1) - 1) // 2
+            if numeric.shape != ((num_rows * (num_rows + 1)) // 2, ):
+                raise ValueError('"numeric" should be the packed rows of a ' +
+                                 'lower triangular matrix.')
+            self._num_rows = num_rows
+            self._end = end
+            self._exponents = [] if exponents is None else \
+                list(exponents[:num_rows])
+            self._exact = None
+            self._numeric = numeric
+            return
+
+        rows = [] if rows is None else list(rows)
+        self._num_rows = len(rows)
+        self._end = end
+        self._exponents = [] if exponents is None else \
+            list(exponents[:self._num_rows])
+        self._exact = pack_rows(rows, dtype=object)
+
+        if numeric is None:
+            self._numeric = pack_rows(_scale_rows(rows, end, exponents))
+        elif numeric.shape != self._exact.shape:
+            raise ValueError('"numeric" should have the shape %s.'
+                             % str(self._exact.shape))
+        else:
+            self._numeric = numeric
+
+    # ----------
+    # Properties
+    # ----------
+
+    @property
+    def numeric(self):
+        """
+        The packed ``float64`` rows.
+        """
+
+        return self._numeric
+
+    @property
+    def exact(self):
+        """
+        The packed exact rows on the interval :math:`[0, 1]`.
+        """
+
+        if self._exact is None:
+            decode, self._decode = self._decode, None
+            exact = pack_rows(decode(), dtype=object)
+            if exact.shape != self._numeric.shape:
+                raise ValueError('The decoded rows do not match the ' +
+                                 'numeric rows.')
+            self._exact = exact
+
+        return self._exact
+
+    @property
+    def end(self):
+        """
+        The end of the interval of the numeric rows.
+        """
+
+        return self._end
+
+    @property
+    def exponents(self):
+        """
+        The exponents of the scaling factors of the columns.
+        """
+
+        return self._exponents
+
+    # ---
+    # Len
+    # ---
+
+    def __len__(self):
+        return self._num_rows
+
+    # --------
+    # Get item
+    # --------
+
+    def __getitem__(self, key):
+        """
+        A row as a view of the numeric array, or a slice of rows.
+        """
+
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self._num_rows)
+
+            # The leading rows are contiguous in the packed arrays
+            if (start == 0) and (step == 1):
+                size = (stop * (stop + 1)) // 2
+                rows = TriangularCoeffs(end=self._end)
+                rows._num_rows = stop
+                rows._exponents = self._exponents[:stop]
+                rows._numeric = self._numeric[:size]
+                if self._exact is None:
+                    rows._exact = None
+                    rows._decode = functools.partial(_get_leading_rows,
+                                                     self, stop)
+                else:
+                    rows._exact = self._exact[:size]
+                return rows
+
+            return [self[i] for i in range(start, stop, step)]
+
+        i = int(key)
+        if i < 0:
+            i += self._num_rows
+        if (i < 0) or (i >= self._num_rows):
+            raise IndexError('Row index out of range.')
+
+        offset = (i * (i + 1)) // 2
+        return self._numeric[offset:offset+i+1]
+
+    # ----
+    # Iter
+    # ----
+
+    def __iter__(self):
+        for i in range(self._num_rows):
+            yield self[i]
+
+    # --
+    # Eq
+    # --
+
+    def __eq__(self, other):
+        """
+        Compares the exact rows, and the scaling factors of the columns.
+        """
+
+        if isinstance(other, TriangularCoeffs):
+            if self._get_scale() != other._get_scale():
+                return False
+            return self.tolist() == other.tolist()
+
+        try:
+            return self.tolist() == [list(row) for row in other]
+        except TypeError:
+            return NotImplemented
+
+    __hash__ = None
+
+    # ---------
+    # Get scale
+    # ---------
+
+    def _get_scale(self):
+        """
+        The exact scaling factors, which are all one on :math:`[0, 1]`.
+        """
+
+        if self._end == 1:
+            return None
+
+        return (self._end, self._exponents)
+
+    # ----
+    # Repr
+    # ----
+
+    def __repr__(self):
+        return repr(self.tolist())
+
+    # ------
+    # Extend
+    # ------
+
+    def extend(self, rows, numeric=None, exponents=None):
+        """
+        Appends rows.
+
+        Parameters
+        ----------
+
+            rows : list
+                The ragged list of lists of the exact rows that continue the
+                lower triangular matrix.
+
+            numeric : list, default=None
+                The ragged list of lists of the numeric rows. If `None`,
+                they are converted from ``rows`` and are scaled to the
+                interval.
+
+            exponents : list, default=None
+                The exponents of the columns of the new rows, which are
+                required if the end of the interval is not one.
+        """
+
+        rows = list(rows)
+        if len(rows) == 0:
+            return
+
+        start = self._num_rows
+        if exponents is not None:
+            exponents = self._exponents + list(exponents[:len(rows)])
+        elif self._end != 1:
+            raise ValueError('"exponents" of the columns are required to ' +
+                             'scale the rows to the interval.')
+
+        if numeric is None:
+            numeric = _scale_rows(rows, self._end, exponents)
+
+        self._exact = numpy.concatenate(
+                [self.exact, pack_rows(rows, dtype=object, start=start)])
+        self._numeric = numpy.concatenate(
+                [self._numeric, pack_rows(numeric, start=start)])
+        if exponents is not None:
+            self._exponents = exponents
+        self._num_rows += len(rows)
+
+    # ------
+    # Tolist
+    # ------
+
+    def tolist(self):
+        """
+        The exact rows as a list of lists.
+        """
+
+        exact = self.exact.tolist()
+        return [exact[(i*(i+1))//2:((i+1)*(i+2))//2]
+                for i in range(self._num_rows)]
+
+    # ---------
+    # To matrix
+    # ---------
+
+    def to_matrix(self, dtype=numpy.float64):
+        """
+        The numeric rows as a square matrix padded with zeros.
+
+        Parameters
+        ----------
+
+            dtype : numpy.dtype, default=numpy.float64
+                The data type of the matrix.
+
+        Returns
+        -------
+
+            matrix : numpy.ndarray
+                The lower triangular matrix of the size ``len(self)``.
+        """
+
+        matrix = numpy.zeros((self._num_rows, self._num_rows), dtype=dtype)
+        matrix[numpy.tril_indices(self._num_rows)] = self._numeric
+
+        return matrix
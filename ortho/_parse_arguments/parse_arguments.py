@@ -95,6 +95,10 @@ Optional arguments:
                             Default is 1.
 -e --end-interval[=float]   End of the interval of functions domains. Real
                             number greater than zero. Default is 1.
+-m --method[=str]           Method of generating functions. Either
+                            "gram-schmidt", "cholesky", "product", or
+                            "symbolic".
+                            Default is "gram-schmidt".
 -c --check                  Checks orthogonality of generated functions.
 -p --plot                   Plots generated functions, also saves the plot as
                             pdf and svg file in the current directory.
@@ -192,9 +196,9 @@ def parse_arguments(argv, test=False):
     }
 
     try:
-        opts, args = getopt.getopt(argv[1:], "hvln:s:e:cp", [
+        opts, args = getopt.getopt(argv[1:], "hvln:s:e:m:cp", [
             "help", "version", "license", "num-func=", "start-func=",
-            "end-interval=", "check", "plot"])
+            "end-interval=", "method=", "check", "plot"])
     except getopt.GetoptError:
         print('Invalid option entered.')
         print_usage(argv[0])
@@ -221,6 +225,8 @@ def parse_arguments(argv, test=False):
             arguments['start_index'] = int(arg)
         elif opt in ("-e", "--end-interval"):
             arguments['end_interval'] = float(arg)
+        elif opt in ("-m", "--method"):
+            arguments['method'] = arg
         elif opt in ("-c", '--check'):
             arguments['check_orthogonality'] = True
         elif opt in ("-p", "--plot"):
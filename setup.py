@@ -152,6 +152,8 @@ def main(argv):
         packages=setuptools.find_packages(exclude=[
             'tests.*',
             'tests',
+            'benchmarks.*',
+            'benchmarks',
             'examples.*',
             'examples',
             'docs.*',
@@ -0,0 +1,47 @@
+#! /usr/bin/env python
+
+# SPDX-FileCopyrightText: Copyright 2021, Siavash Ameli <sameli@berkeley.edu>
+# SPDX-License-Identifier: BSD-3-Clause
+# SPDX-FileType: SOURCE
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the license found in the LICENSE.txt file in the root directory
+# of this source tree.
+
+
+# =======
+# Imports
+# =======
+
+from ortho import OrthogonalFunctions, coeffs_closed_form
+
+import warnings
+warnings.resetwarnings()
+warnings.filterwarnings("error")
+
+
+# =======================
+# Test Coeffs Closed Form
+# =======================
+
+def test_coeffs_closed_form():
+
+    # Cross-check with the symbolic Gram-Schmidt process
+    coeffs_closed_form(start_index=1, num_func=5, validate=True)
+
+    # Compare with the exact LDL factorization
+    for start_index in [0, 1, 2, 5]:
+
+        coeffs = coeffs_closed_form(start_index, 30)
+        OF = OrthogonalFunctions(start_index=start_index, num_func=30,
+                                 method='cholesky')
+
+        assert coeffs == OF.coeffs
+
+
+# ===========
+# Script Main
+# ===========
+
+if __name__ == "__main__":
+    test_coeffs_closed_form()
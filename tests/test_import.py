@@ -0,0 +1,91 @@
+#! /usr/bin/env python
+
+# SPDX-FileCopyrightText: Copyright 2021, Siavash Ameli <sameli@berkeley.edu>
+# SPDX-License-Identifier: BSD-3-Clause
+# SPDX-FileType: SOURCE
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the license found in the LICENSE.txt file in the root directory
+# of this source tree.
+
+
+# =======
+# Imports
+# =======
+
+import os
+import sys
+import subprocess
+import ortho
+
+import warnings
+warnings.resetwarnings()
+warnings.filterwarnings("error")
+
+
+# ================
+# Imported modules
+# ================
+
+def imported_modules(code):
+    """
+    Runs a code in a new interpreter with ``-X importtime`` and returns the
+    names of the imported modules.
+    """
+
+    # Import this copy of the package in the new interpreter
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.path.dirname(os.path.dirname(ortho.__file__))
+    env.pop('ORTHO_CACHE_DIR', None)
+
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                             capture_output=True, text=True, env=env,
+                             check=True)
+
+    modules = []
+    for line in process.stderr.splitlines():
+        if line.startswith('import time:'):
+            modules.append(line.split('|')[-1].strip())
+
+    return modules
+
+
+# ===========
+# Test Import
+# ===========
+
+def test_import():
+    """
+    Importing the package and the numeric evaluation do not load sympy and
+    matplotlib.
+    """
+
+    heavy_packages = ['sympy', 'matplotlib']
+
+    code_list = [
+        'import ortho',
+        'import ortho; OF = ortho.OrthogonalFunctions(num_func=9); ' +
+        'OF.evaluate(0.5); OF.check(mode="numeric")',
+    ]
+
+    for code in code_list:
+        modules = imported_modules(code)
+        assert 'ortho' in modules
+
+        for module in modules:
+            assert module.split('.')[0] not in heavy_packages, module
+
+    # Symbolic attributes load sympy, but not matplotlib
+    modules = imported_modules(
+            'import ortho; ortho.OrthogonalFunctions(num_func=3).sym_phi')
+    packages = set(module.split('.')[0] for module in modules)
+    assert 'sympy' in packages
+    assert 'matplotlib' not in packages
+
+
+# ===========
+# Script Main
+# ===========
+
+if __name__ == "__main__":
+    test_import()
@@ -15,10 +15,14 @@
 
 # matplotlib without display
 import os
+import tempfile
+from fractions import Fraction
 import matplotlib
 matplotlib.use('Agg')
 
 from ortho import OrthogonalFunctions                              # noqa: E402
+import sympy                                                       # noqa: E402
+import numpy                                                       # noqa: E402
 
 import warnings                                                    # noqa: E402
 warnings.resetwarnings()
@@ -67,9 +71,1033 @@ def test_orthogonal_functions():
     remove_file('orthogonal_functions.pdf')
 
 
+# ====================
+# Test Rational Method
+# ====================
+
+def test_rational_method():
+    """
+    Compares the exact rational Gram-Schmidt process with the symbolic
+    Gram-Schmidt process.
+    """
+
+    for start_index in [0, 1]:
+
+        arguments = {
+            'num_func': 4,
+            'start_index': start_index,
+            'end_interval': 1
+        }
+
+        OF_rational = OrthogonalFunctions(method='gram-schmidt', **arguments)
+        OF_symbolic = OrthogonalFunctions(method='symbolic', **arguments)
+
+        assert OF_rational.sym_alpha == OF_symbolic.sym_alpha
+        assert OF_rational.sym_coeffs == OF_symbolic.sym_coeffs
+        assert OF_rational.coeffs == OF_symbolic.coeffs
+
+        for phi_rational, phi_symbolic in zip(OF_rational.sym_phi,
+                                              OF_symbolic.sym_phi):
+            assert sympy.simplify(phi_rational - phi_symbolic) == 0
+
+
+# ====================
+# Test Cholesky Method
+# ====================
+
+def test_cholesky_method():
+    """
+    Compares the exact LDL factorization with the rational Gram-Schmidt
+    process.
+    """
+
+    # Integer coefficients a_ij printed in the docstring of print()
+    coeffs = [
+        [1],
+        [6, -5],
+        [20, -40, 21],
+        [50, -175, 210, -84],
+        [105, -560, 1134, -1008, 330],
+        [196, -1470, 4410, -6468, 4620, -1287]]
+
+    OF_cholesky = OrthogonalFunctions(num_func=12, method='cholesky')
+    OF_rational = OrthogonalFunctions(num_func=12, method='gram-schmidt')
+
+    assert OF_cholesky.coeffs[:len(coeffs)] == coeffs
+    assert OF_cholesky.sym_alpha == OF_rational.sym_alpha
+    assert OF_cholesky.sym_coeffs == OF_rational.sym_coeffs
+    assert OF_cholesky.sym_phi == OF_rational.sym_phi
+
+
+# ===================
+# Test Product Method
+# ===================
+
+def test_product_method():
+    """
+    Compares the recurrence of the product formula with the LDL
+    factorization and the symbolic Gram-Schmidt process.
+    """
+
+    for start_index in [0, 1, 3]:
+
+        OF_product = OrthogonalFunctions(num_func=30, method='product',
+                                         start_index=start_index)
+        OF_cholesky = OrthogonalFunctions(num_func=30, method='cholesky',
+                                          start_index=start_index)
+
+        assert OF_product._alpha_squared == OF_cholesky._alpha_squared
+        assert OF_product._alpha_sign == OF_cholesky._alpha_sign
+        assert OF_product._rational_coeffs == OF_cholesky._rational_coeffs
+
+        # Recurrence of the coefficients
+        exponents = OF_product._exponents
+        coeffs = OF_product._rational_coeffs
+        for i in range(1, 30):
+            for j in range(i):
+                assert (exponents[j] - exponents[i]) * coeffs[i][j] == \
+                    (exponents[j] + exponents[i-1]) * coeffs[i-1][j]
+
+    OF_product = OrthogonalFunctions(num_func=4, method='product')
+    OF_symbolic = OrthogonalFunctions(num_func=4, method='symbolic')
+    assert OF_product.sym_alpha == OF_symbolic.sym_alpha
+    assert OF_product.sym_coeffs == OF_symbolic.sym_coeffs
+
+    # The functions at the end of the interval are alpha
+    OF_product = OrthogonalFunctions(num_func=9, end_interval=2,
+                                     method='product')
+    phi = OF_product.evaluate(2.0)
+    assert numpy.allclose(phi, OF_product.alpha, atol=1e-12)
+
+
+# ======================
+# Test Triangular Coeffs
+# ======================
+
+def test_triangular_coeffs():
+    """
+    Packed storage of the coefficients.
+    """
+
+    from ortho._orthogonal_functions.triangular_utilities import \
+        TriangularCoeffs
+
+    rows = [[1], [6, -5], [20, -40, 21], [50, -175, 210, -84]]
+    OF = OrthogonalFunctions(num_func=4)
+
+    assert isinstance(OF.coeffs, TriangularCoeffs)
+    assert OF.coeffs == rows
+    assert rows == OF.coeffs
+    assert OF.coeffs[:2] == rows[:2]
+    assert OF.coeffs.tolist() == rows
+    assert len(OF.coeffs) == 4
+    assert OF.coeffs.numeric.dtype == numpy.float64
+    assert OF.coeffs.numeric.tolist() == [entry for row in rows
+                                          for entry in row]
+    assert numpy.array_equal(OF.coeffs[-1], rows[-1])
+    assert [row.tolist() for row in OF.coeffs] == rows
+    assert numpy.array_equal(OF.coeffs.to_matrix(),
+                             [row + [0] * (3 - i) for i, row in
+                              enumerate(rows)])
+
+    # Exact integers beyond the precision of float64
+    OF = OrthogonalFunctions(num_func=40, method='product')
+    assert OF.coeffs.tolist() == OF._rational_coeffs
+    assert OF.coeffs.numeric.size == 40 * 41 // 2
+
+    # The exact rows are rational on [0, 1], and the scaling to [0, L] is
+    # kept separately
+    for OF in [OrthogonalFunctions(num_func=6, end_interval=2),
+               OrthogonalFunctions.from_exponents([0.5, 1.5, 0.75], beta=1,
+                                                  end_interval=2)]:
+        assert all(isinstance(entry, (int, Fraction))
+                   for entry in OF.coeffs.exact)
+        assert OF.coeffs.tolist() == OF._rational_coeffs
+        assert OF.coeffs.end == 2
+        assert OF.coeffs.exponents == OF._shifted_exponents
+    assert OF.coeffs.numeric[2] == \
+        float(OF._rational_coeffs[1][1]) / 2**2.0
+    assert OrthogonalFunctions(num_func=6, end_interval=2).coeffs != \
+        OrthogonalFunctions(num_func=6).coeffs
+    assert TriangularCoeffs(rows, end=2, exponents=[1, 1, 1, 1]) == \
+        [row for row in rows]
+    assert TriangularCoeffs(rows, end=2, exponents=[1, 1, 1, 1])[3][0] == 25
+    assert TriangularCoeffs(rows, end=2, exponents=[1, 1, 1, 1])[:2] == \
+        TriangularCoeffs(rows[:2], end=2, exponents=[1, 1])
+
+    # Rows are views of the packed array
+    coeffs = TriangularCoeffs(rows)
+    coeffs[2][1] = 0.0
+    assert coeffs.numeric[4] == 0.0
+    assert coeffs == rows
+
+    coeffs.extend([[1, 2, 3, 4, 5]])
+    assert len(coeffs) == 5
+    try:
+        coeffs.extend([[1, 2]])
+    except ValueError:
+        pass
+    else:
+        raise AssertionError('The rows should be triangular.')
+
+    # The loaded coefficients are used from the table without a copy
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, 'ortho.npz')
+        OrthogonalFunctions(num_func=6).save(filename)
+        OF = OrthogonalFunctions.load(filename)
+        assert isinstance(OF.coeffs.numeric, numpy.memmap)
+        assert OF.coeffs == OrthogonalFunctions(num_func=6).coeffs
+
+
+# =============
+# Test Evaluate
+# =============
+
+def test_evaluate():
+    """
+    Compares the vectorized evaluation with the symbolic functions.
+    """
+
+    OF = OrthogonalFunctions(num_func=6, end_interval=2)
+    t = numpy.logspace(-6, numpy.log10(2), 500)
+
+    # Reference values from the symbolic functions
+    from ortho._orthogonal_functions.declarations import t as sym_t
+    reference = numpy.array([sympy.lambdify(sym_t, phi, 'numpy')(t)
+                             for phi in OF.sym_phi])
+
+    phi = OF.evaluate(t)
+    assert phi.shape == (6, t.size)
+    assert phi.dtype == numpy.float64
+    assert numpy.allclose(phi, reference, atol=1e-10)
+
+    # Preallocated output in single precision
+    out = numpy.empty((6, t.size), dtype=numpy.float32)
+    phi = OF.evaluate(t, out=out)
+    assert phi is out
+    assert numpy.allclose(phi, reference, atol=1e-3)
+
+    # Multi-dimensional input and scalar input
+    assert OF.evaluate(t.reshape(20, 25)).shape == (6, 20, 25)
+    assert OF.evaluate(0.5).shape == (6, )
+
+
+# =====================
+# Test Evaluate Methods
+# =====================
+
+def test_evaluate_methods():
+    """
+    Compares the methods to compute the powers of the points with the
+    symbolic functions.
+    """
+
+    from ortho._orthogonal_functions.declarations import t as sym_t
+
+    for start_index in [0, 1]:
+
+        OF = OrthogonalFunctions(num_func=9, start_index=start_index,
+                                 end_interval=2)
+        t = numpy.r_[0.0, numpy.logspace(-300, numpy.log10(2), 500)]
+
+        reference = numpy.array([sympy.lambdify(sym_t, phi, 'numpy')(t)
+                                 for phi in OF.sym_phi])
+
+        for method in ['power', 'log', 'horner']:
+            phi = OF.evaluate(t, method=method)
+            assert numpy.allclose(phi, reference, rtol=0, atol=1e-9)
+
+            chunks = [chunk.copy() for chunk in
+                      OF.evaluate_chunks(t, chunk_size=100, method=method)]
+            assert numpy.allclose(numpy.hstack(chunks), phi, atol=1e-12)
+
+    # The powers of t^(1/M) are too large for many functions
+    OF = OrthogonalFunctions(num_func=20)
+    try:
+        OF.evaluate(0.5, method='horner')
+    except ValueError:
+        pass
+    else:
+        raise AssertionError('The "horner" method should raise an error.')
+
+
+# ====================
+# Test Evaluate Stable
+# ====================
+
+def test_evaluate_stable():
+    """
+    Compares the stable evaluation of many functions with the evaluation in
+    multi-precision arithmetic.
+    """
+
+    num_func = 25
+    end_interval = 2
+    OF = OrthogonalFunctions(num_func=num_func, end_interval=end_interval,
+                             method='cholesky')
+    t = end_interval * numpy.r_[0.0, numpy.logspace(-300, 0, 40)]
+    reference = OF.evaluate(t, precision=30).astype(float)
+
+    phi = OF.evaluate(t, method='stable')
+    assert numpy.allclose(phi, reference, rtol=0, atol=1e-14)
+
+    # The power method loses all digits for this number of functions
+    assert not numpy.allclose(OF.evaluate(t), reference, atol=1e-2)
+
+    chunks = [chunk.copy() for chunk in
+              OF.evaluate_chunks(t, chunk_size=7, method='stable')]
+    assert numpy.allclose(numpy.hstack(chunks), phi, rtol=0, atol=1e-15)
+
+    # Points outside of the interval
+    try:
+        OF.evaluate(end_interval + 1.0, method='stable')
+    except ValueError:
+        pass
+    else:
+        raise AssertionError('Points outside of [0, L] should raise.')
+
+    # The expansions are fitted again for the extended functions
+    OF.extend(2)
+    assert OF.evaluate(t, method='stable').shape == (num_func + 2, t.size)
+
+    # The symbolic method does not keep the exact rational coefficients
+    OF1 = OrthogonalFunctions(num_func=3, method='symbolic')
+    OF2 = OrthogonalFunctions(num_func=3, method='cholesky')
+    assert numpy.allclose(OF1.evaluate(t[1:] / 2, method='stable'),
+                          OF2.evaluate(t[1:] / 2, method='stable'),
+                          rtol=0, atol=1e-15)
+
+
+# =======================
+# Test Evaluate Precision
+# =======================
+
+def test_evaluate_precision():
+    """
+    Compares the evaluation in arbitrary precision with the symbolic
+    functions.
+    """
+
+    import mpmath
+    from ortho._orthogonal_functions.declarations import t as sym_t
+
+    for method in ['cholesky', 'symbolic']:
+
+        OF = OrthogonalFunctions(num_func=4, end_interval=2, method=method)
+        t = numpy.array([[0.0, 0.25], [1.0, 0.25]])
+        phi = OF.evaluate(t, precision=60)
+
+        assert phi.shape == (4, 2, 2)
+        assert phi.dtype == object
+        assert all(value == 0 for value in phi[:, 0, 0])
+        assert numpy.array_equal(phi[:, 0, 1], phi[:, 1, 1])
+
+        with mpmath.workdps(80):
+            for i in range(4):
+                function = sympy.lambdify(sym_t, OF.sym_phi[i], 'mpmath')
+                for point in [0.25, 1.0]:
+                    k = 1 if point == 0.25 else 0
+                    error = abs(phi[i, 1, k] - function(mpmath.mpf(point)))
+                    assert error < mpmath.mpf(10)**(-55)
+
+    # Points in more than double precision
+    OF = OrthogonalFunctions(num_func=9)
+    phi1 = OF.evaluate(['0.1'], precision=40)[:, 0]
+    phi2 = OF.evaluate([0.1], precision=40)[:, 0]
+    assert all(abs(value) > 0 for value in (phi1 - phi2))
+    assert numpy.allclose(phi1.astype(float), OF.evaluate(0.1), atol=1e-10)
+
+
+# ====================
+# Test Evaluate Chunks
+# ====================
+
+def test_evaluate_chunks():
+    """
+    Compares the chunked evaluation with the vectorized evaluation.
+    """
+
+    OF = OrthogonalFunctions(num_func=9)
+    t = numpy.linspace(0, 1, 10001)
+    reference = OF.evaluate(t)
+
+    # Memory-mapped array of points
+    filename = 'evaluate_chunks.dat'
+    t_mmap = numpy.memmap(filename, dtype=numpy.float64, mode='w+',
+                          shape=t.shape)
+    t_mmap[:] = t
+    t_mmap.flush()
+
+    # Array, memory-mapped array, iterable of scalars and of arrays
+    sources = [
+        t,
+        t_mmap,
+        iter(t.tolist()),
+        (t[i:i+333] for i in range(0, t.size, 333))]
+
+    for source in sources:
+        chunks = [phi.copy() for phi in
+                  OF.evaluate_chunks(source, chunk_size=1000)]
+        assert len(chunks) == 11
+        assert numpy.allclose(numpy.hstack(chunks), reference, atol=1e-12)
+
+    # Buffers are reused between chunks
+    chunks = OF.evaluate_chunks(t, chunk_size=1000)
+    assert numpy.shares_memory(next(chunks), next(chunks))
+
+    # The points of a non-contiguous array are copied to one buffer
+    from ortho._orthogonal_functions.evaluation_utilities import \
+        _iterate_chunks
+
+    t_strided = numpy.linspace(0, 1, 2 * t.size - 1)[::2]
+    buffer = numpy.empty(1000)
+    for source in [t_strided, t_strided.astype(numpy.float32),
+                   t[:10000].reshape(100, 100).T]:
+        chunks = [chunk.copy() for chunk in _iterate_chunks(source, buffer)
+                  if numpy.shares_memory(chunk, buffer)]
+        assert numpy.array_equal(numpy.hstack(chunks), source.reshape(-1))
+    chunks = [phi.copy() for phi in
+              OF.evaluate_chunks(t_strided, chunk_size=1000)]
+    assert numpy.allclose(numpy.hstack(chunks), reference, atol=1e-12)
+
+    del t_mmap
+    remove_file(filename)
+
+
+# ========================
+# Test Evaluate Derivative
+# ========================
+
+def test_evaluate_derivative():
+    """
+    Compares the derivatives and the integrals of the functions with the
+    symbolic derivatives and antiderivatives.
+    """
+
+    from ortho._orthogonal_functions.declarations import t as sym_t
+
+    OF = OrthogonalFunctions(num_func=6, end_interval=2)
+    t = numpy.logspace(-4, numpy.log10(2), 200)
+
+    for derivative in [1, 2, 3]:
+        reference = numpy.array([
+            sympy.lambdify(sym_t, sympy.diff(phi, sym_t, derivative),
+                           'numpy')(t) for phi in OF.sym_phi])
+        scale = numpy.abs(reference).max()
+
+        for method in ['power', 'log', 'horner']:
+            dphi = OF.evaluate(t, method=method, derivative=derivative)
+            assert numpy.allclose(dphi, reference, rtol=0,
+                                  atol=1e-11 * scale)
+
+        # Chunks and preallocated output
+        chunks = [dphi.copy() for dphi in OF.evaluate_chunks(
+            t, chunk_size=64, derivative=derivative)]
+        assert numpy.allclose(numpy.hstack(chunks), reference, rtol=0,
+                              atol=1e-11 * scale)
+        out = numpy.empty((6, t.size), dtype=numpy.float64)
+        assert OF.evaluate(t, out=out, derivative=derivative) is out
+
+    # Integrals with respect to dt/t from the symbolic antiderivatives
+    antiderivatives = [
+        sympy.lambdify(sym_t, sympy.integrate(sympy.expand(phi / sym_t),
+                                              sym_t), 'numpy')
+        for phi in OF.sym_phi]
+    a = t[:-1]
+    b = t[1:]
+    reference = numpy.array([F(b) - F(a) for F in antiderivatives])
+
+    for method in ['power', 'log', 'horner']:
+        integrals = OF.integrate(a, b, method=method)
+        assert integrals.shape == (6, a.size)
+        assert numpy.allclose(integrals, reference, rtol=0, atol=1e-10)
+
+    # Broadcast of the ends, the integral from zero, and single precision
+    assert OF.integrate(0, b.reshape(-1, 1)).shape == (6, b.size, 1)
+    assert numpy.allclose(OF.integrate(0, 2), [F(2.0) for F in
+                                               antiderivatives])
+    integrals = OF.integrate(a.astype(numpy.float32),
+                             b.astype(numpy.float32))
+    assert integrals.dtype == numpy.float32
+
+    # Unsupported orders and methods
+    for derivative in [-1, 0.5, True]:
+        try:
+            OF.evaluate(t, derivative=derivative)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError('Invalid derivative was not rejected.')
+
+    try:
+        OF.evaluate(t, method='stable', derivative=1)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError('Derivative with "stable" was not rejected.')
+
+
+# ===============
+# Test Synthesize
+# ===============
+
+def test_synthesize():
+    """
+    Compares the synthesis of the expansions with the sums of the evaluated
+    functions, and synthesizes the projections of a signal.
+    """
+
+    OF = OrthogonalFunctions(num_func=9, end_interval=2)
+    t = numpy.linspace(0, 2, 1001)
+    c = numpy.random.RandomState(0).randn(5, 9)
+
+    for method in ['power', 'log', 'horner', 'stable']:
+        reference = c @ OF.evaluate(t, method=method)
+
+        # The folded sums round off differently from the sums of functions
+        f = OF.synthesize(c, t, method=method)
+        assert f.shape == (5, t.size)
+        assert numpy.allclose(f, reference, rtol=0, atol=1e-8)
+
+        f = OF.synthesize(c[3], t, method=method)
+        assert f.shape == t.shape
+        assert numpy.allclose(f, reference[3], rtol=0, atol=1e-8)
+
+    # Preallocated output, multi-dimensional and scalar input
+    out = numpy.empty((5, 7, 143), dtype=numpy.float32)
+    assert OF.synthesize(c, t.reshape(7, 143), out=out) is out
+    assert OF.synthesize(c[0], 0.5).shape == ()
+
+    # The synthesis of the projections of a function in the span
+    t = numpy.logspace(-300, numpy.log10(2), 10**5)
+    f = OF.synthesize(c[0], t)
+    assert numpy.allclose(OF.synthesize(OF.project(f, t), t), f, rtol=0,
+                          atol=1e-3)
+
+    try:
+        OF.synthesize(c[:, :8], t)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError('Coefficients of a wrong shape were accepted.')
+
+
+# ============
+# Test Project
+# ============
+
+def test_project():
+    """
+    Projects the expansions in the functions onto the functions, which
+    recovers the coefficients of the expansions.
+    """
+
+    for end_interval in [1, 2]:
+
+        OF = OrthogonalFunctions(num_func=9, end_interval=end_interval)
+        t = numpy.logspace(-300, numpy.log10(end_interval), 10**5)
+
+        coeffs = numpy.random.RandomState(0).randn(4, 9)
+        samples = coeffs @ OF.evaluate(t, method='stable')
+
+        for method in ['power', 'stable']:
+            projections = OF.project(samples, t, method=method)
+            assert projections.shape == (4, 9)
+            assert numpy.allclose(projections, coeffs, rtol=0, atol=1e-4)
+
+        # One signal, and a memory-mapped batch of signals
+        projections = OF.project(samples, t)
+        projection = OF.project(samples[1], t)
+        assert projection.shape == (9, )
+        assert numpy.allclose(projection, projections[1], rtol=0,
+                              atol=1e-12)
+
+    filename = 'project.dat'
+    samples_mmap = numpy.memmap(filename, dtype=numpy.float64, mode='w+',
+                                shape=samples.shape)
+    samples_mmap[:] = samples
+    samples_mmap.flush()
+    assert numpy.allclose(OF.project(samples_mmap, t), projections,
+                          rtol=0, atol=1e-12)
+    del samples_mmap
+    remove_file(filename)
+
+    # A constant signal projects to the integrals of the functions
+    projection = OF.project(numpy.ones_like(t), t)
+    assert numpy.allclose(projection, OF.integrate(0, end_interval),
+                          rtol=0, atol=1e-4)
+
+    # Invalid grids
+    for t_grid in [t[::-1], numpy.r_[0.0, t[1:]], t[:1]]:
+        try:
+            OF.project(numpy.ones_like(t_grid), t_grid)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError('Invalid grid was not rejected.')
+
+
+# ========
+# Test Fit
+# ========
+
+def test_fit():
+    """
+    Compares the streaming least-squares fit with a dense least-squares
+    solution, on one process, on a process pool, and over partial fits.
+    """
+
+    OF = OrthogonalFunctions(num_func=6, end_interval=2)
+    random = numpy.random.RandomState(0)
+    t = 2.0 * random.rand(20000)**4
+    coeffs = random.randn(3, 6)
+    samples = coeffs @ OF.evaluate(t) + 1e-6 * random.randn(3, t.size)
+
+    design = OF.evaluate(t).T
+    reference = numpy.linalg.lstsq(design, samples.T, rcond=None)[0].T
+
+    fit_coeffs = OF.fit(samples, t, chunk_size=3000)
+    assert fit_coeffs.shape == (3, 6)
+    assert numpy.allclose(fit_coeffs, reference, rtol=0, atol=1e-8)
+    assert numpy.allclose(fit_coeffs, coeffs, rtol=0, atol=1e-3)
+
+    # Blocks on a process pool
+    fit_coeffs = OF.fit(samples, t, chunk_size=3000, workers=2)
+    assert numpy.allclose(fit_coeffs, reference, rtol=0, atol=1e-8)
+
+    # Samples that arrive over time
+    OF.fit(samples[:, :100], t[:100])
+    for start in range(100, t.size, 4900):
+        fit_coeffs = OF.partial_fit(samples[:, start:start+4900],
+                                    t[start:start+4900])
+    assert numpy.allclose(fit_coeffs, reference, rtol=0, atol=1e-8)
+
+    # One signal
+    fit_coeffs = OF.fit(samples[2], t)
+    assert fit_coeffs.shape == (6, )
+    assert numpy.allclose(fit_coeffs, reference[2], rtol=0, atol=1e-8)
+
+    # Too few points and a different number of signals
+    for arguments in [(samples[:, :5], t[:5]),
+                      (numpy.ones(100), numpy.full(100, 0.5))]:
+        try:
+            OF.fit(*arguments)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError('Undetermined fit was not rejected.')
+
+    # Invalid numbers of processes
+    for workers in [0, -1, 2.0]:
+        try:
+            OF.fit(samples, t, workers=workers)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError('Invalid "workers" was not rejected.')
+
+    OF.fit(samples, t)
+    try:
+        OF.partial_fit(samples[0], t)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError('Different number of signals was not rejected.')
+
+
+# ===========
+# Test Extend
+# ===========
+
+def test_extend():
+    """
+    Compares the extended functions with the functions that are constructed
+    at once.
+    """
+
+    for method in ['gram-schmidt', 'cholesky', 'product', 'symbolic']:
+        for end_interval in [1, 2]:
+
+            num_func = 5 if method == 'symbolic' else 12
+            OF1 = OrthogonalFunctions(num_func=num_func-3, method=method,
+                                      end_interval=end_interval)
+            OF1.extend(1)
+            OF1.extend(2)
+            OF2 = OrthogonalFunctions(num_func=num_func, method=method,
+                                      end_interval=end_interval)
+
+            assert OF1.num_func == num_func
+            assert OF1.sym_phi == OF2.sym_phi
+            assert OF1.sym_alpha == OF2.sym_alpha
+            assert OF1.sym_coeffs == OF2.sym_coeffs
+            assert OF1.alpha == OF2.alpha
+            assert OF1.coeffs == OF2.coeffs
+
+    # Extension of functions that are loaded from the cache
+    with tempfile.TemporaryDirectory() as cache_dir:
+        OrthogonalFunctions(num_func=6, cache_dir=cache_dir)
+        OF1 = OrthogonalFunctions(num_func=6, cache_dir=cache_dir)
+        OF1.extend(3)
+        OF2 = OrthogonalFunctions(num_func=9, cache_dir=cache_dir)
+        assert OF1.coeffs == OF2.coeffs
+        assert len(os.listdir(cache_dir)) == 2
+
+
+# ==================
+# Test Save and Load
+# ==================
+
+def test_save_load():
+    """
+    Saves the functions to a binary table and loads them with and without
+    memory mapping.
+    """
+
+    from ortho._orthogonal_functions.table_utilities import load_table
+
+    with tempfile.TemporaryDirectory() as directory:
+
+        filename = os.path.join(directory, 'ortho.npz')
+
+        for method, num_func, end_interval in [('product', 12, 1),
+                                               ('product', 12, 2),
+                                               ('symbolic', 4, 1)]:
+
+            OF1 = OrthogonalFunctions(num_func=num_func, method=method,
+                                      end_interval=end_interval)
+            OF1.save(filename)
+
+            for mmap in [True, False]:
+                OF2 = OrthogonalFunctions.load(filename, mmap=mmap)
+
+                assert OF2.num_func == num_func
+                assert OF2.method == method
+                assert OF2.end_interval == end_interval
+                assert OF2.alpha.tolist() == OF1.alpha
+
+                # The exact coefficients are decoded on their first use
+                assert OF2._table is not None
+                assert OF2.coeffs == OF1.coeffs
+                assert OF2._table is not None
+                assert OF2.sym_alpha == OF1.sym_alpha
+                assert OF2.sym_coeffs == OF1.sym_coeffs
+
+                t = numpy.linspace(0, end_interval, 11)
+                assert numpy.array_equal(OF2.evaluate(t), OF1.evaluate(t))
+
+        # The table has the permissions of a new file
+        new_filename = os.path.join(directory, 'new')
+        with open(new_filename, 'wb'):
+            pass
+        assert os.stat(filename).st_mode & 0o777 == \
+            os.stat(new_filename).st_mode & 0o777
+
+        # The table is readable by numpy and its arrays are memory-mapped
+        table = load_table(filename)
+        assert isinstance(table['coeffs'], numpy.memmap)
+        with numpy.load(filename) as npz:
+            assert numpy.array_equal(npz['coeffs'], table['coeffs'])
+            assert npz['alpha'].tolist() == OF2.alpha.tolist()
+
+        # The numeric coefficients are used from the table without a copy
+        OF2 = OrthogonalFunctions.load(filename)
+        assert isinstance(OF2.alpha, numpy.memmap)
+        assert isinstance(OF2.coeffs.numeric, numpy.memmap)
+        OF2.sym_phi
+        assert OF2._table is None
+
+        # The loaded functions can be extended
+        OF1 = OrthogonalFunctions(num_func=6)
+        OF1.save(filename)
+        OF2 = OrthogonalFunctions.load(filename)
+        OF2.extend(3)
+        OF3 = OrthogonalFunctions(num_func=9)
+        assert OF2.coeffs == OF3.coeffs
+        assert OF2.alpha == OF3.alpha
+
+        # A file that is not a table
+        numpy.savez(filename, alpha=numpy.ones(3))
+        try:
+            OrthogonalFunctions.load(filename)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError('A file that is not a table should not ' +
+                                 'be loaded.')
+
+
+# ==========
+# Test Cache
+# ==========
+
+def test_cache():
+    """
+    Loads the functions from the on-disk cache and evicts old entries.
+    """
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+
+        for method in ['cholesky', 'symbolic']:
+            for end_interval in [1, 2]:
+
+                OF1 = OrthogonalFunctions(
+                        num_func=4, end_interval=end_interval, method=method,
+                        cache_dir=cache_dir)
+                OF2 = OrthogonalFunctions(
+                        num_func=4, end_interval=end_interval, method=method,
+                        cache_dir=cache_dir)
+
+                assert OF1.sym_phi == OF2.sym_phi
+                assert OF1.sym_alpha == OF2.sym_alpha
+                assert OF1.sym_coeffs == OF2.sym_coeffs
+                assert OF1.alpha == OF2.alpha
+                assert OF1.coeffs == OF2.coeffs
+
+        # The entries do not depend on the end of the interval
+        assert len(os.listdir(cache_dir)) == 2
+
+        # A small bound on the size of the cache keeps only the last entry
+        os.environ['ORTHO_CACHE_MAX_SIZE'] = '1'
+        try:
+            OrthogonalFunctions(num_func=5, cache_dir=cache_dir)
+        finally:
+            del os.environ['ORTHO_CACHE_MAX_SIZE']
+
+        assert len(os.listdir(cache_dir)) == 1
+
+
+# ============
+# Test Rescale
+# ============
+
+def test_rescale():
+    """
+    Compares the functions on [0, L] rescaled from [0, 1] by the symbolic
+    process with the functions of the product formula, and reuses a cache
+    entry of [0, 1] for other intervals.
+    """
+
+    for end_interval in [2, 0.5]:
+
+        OF_symbolic = OrthogonalFunctions(num_func=4, method='symbolic',
+                                          end_interval=end_interval)
+        OF_product = OrthogonalFunctions(num_func=4, method='product',
+                                         end_interval=end_interval)
+
+        assert OF_symbolic.sym_alpha == OF_product.sym_alpha
+        assert OF_symbolic.sym_coeffs == OF_product.sym_coeffs
+        assert OF_symbolic.sym_phi == OF_product.sym_phi
+        assert OF_symbolic.coeffs == OF_product.coeffs
+        assert numpy.allclose(OF_symbolic.alpha, OF_product.alpha)
+
+        # Scale invariance of the functions
+        t = numpy.linspace(0, 1, 11)
+        OF_unit = OrthogonalFunctions(num_func=4, method='product')
+        assert numpy.allclose(OF_product.evaluate(end_interval * t),
+                              OF_unit.evaluate(t))
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+
+        OrthogonalFunctions(num_func=4, method='symbolic',
+                            cache_dir=cache_dir)
+        OF2 = OrthogonalFunctions(num_func=4, method='symbolic',
+                                  end_interval=3, cache_dir=cache_dir)
+
+        assert len(os.listdir(cache_dir)) == 1
+        OF3 = OrthogonalFunctions(num_func=4, method='product',
+                                  end_interval=3)
+        assert OF2.sym_alpha == OF3.sym_alpha
+        assert OF2.sym_coeffs == OF3.sym_coeffs
+
+
+# ==========
+# Test Batch
+# ==========
+
+def test_batch():
+    """
+    Compares the functions of many sets of parameters with the functions
+    that are constructed one by one.
+    """
+
+    params_list = [
+        {'num_func': 9},
+        {'num_func': 12, 'end_interval': 2, 'method': 'product'},
+        {'num_func': 6, 'start_index': 0},
+        {'num_func': 4, 'end_interval': 0.5, 'method': 'product'},
+        {'num_func': 3, 'method': 'symbolic'},
+    ]
+
+    for workers in [None, 2]:
+
+        OFs = OrthogonalFunctions.batch(params_list, workers=workers)
+        assert len(OFs) == len(params_list)
+
+        for params, OF1 in zip(params_list, OFs):
+            OF2 = OrthogonalFunctions(**params)
+
+            assert OF1.num_func == OF2.num_func
+            assert OF1.start_index == OF2.start_index
+            assert OF1.end_interval == OF2.end_interval
+            assert OF1.method == OF2.method
+            assert OF1.alpha == OF2.alpha
+            assert OF1.coeffs == OF2.coeffs
+            assert OF1.sym_phi == OF2.sym_phi
+
+    for params in [{'num_funcs': 3}, {'method': 'qr'}, {'num_func': 0}]:
+        try:
+            OrthogonalFunctions.batch([params])
+        except ValueError:
+            pass
+        else:
+            raise AssertionError('Invalid parameters should raise an error.')
+
+
+# =============
+# Test Parallel
+# =============
+
+def test_parallel():
+    """
+    Compares the symbolic process and check on a process pool with the
+    serial computation.
+    """
+
+    OF1 = OrthogonalFunctions(num_func=4, method='symbolic')
+    OF2 = OrthogonalFunctions(num_func=4, method='symbolic', workers=2)
+
+    assert OF1.sym_phi == OF2.sym_phi
+    assert OF1.coeffs == OF2.coeffs
+
+    OF3 = OrthogonalFunctions(num_func=6)
+    assert OF3.check(workers=2)
+
+
+# ==================
+# Test Check Numeric
+# ==================
+
+def test_check_numeric():
+    """
+    Numeric orthonormality check by quadrature.
+    """
+
+    for end_interval in [1, 2.5]:
+        OF = OrthogonalFunctions(num_func=9, end_interval=end_interval)
+        status, gram, max_error = OF.check_numeric(tol=1e-8)
+
+        assert status
+        assert gram.shape == (9, 9)
+        assert max_error < 1e-8
+        assert numpy.allclose(gram, numpy.eye(9), atol=1e-8)
+        assert OF.check(mode='numeric', tol=1e-8) is True
+
+    # Perturbed coefficients are not orthonormal
+    OF.coeffs[3][1] += 1
+    status, _, max_error = OF.check_numeric()
+    assert not status
+    assert OF.check(mode='numeric') is False
+    assert max_error > 1e-2
+
+
+# ===================
+# Test From Exponents
+# ===================
+
+def test_from_exponents():
+    """
+    Functions of arbitrary exponents and weights, compared with the default
+    functions, the shifted Legendre polynomials, and between the methods.
+    """
+
+    # The default exponents as strings and fractions
+    OF1 = OrthogonalFunctions(num_func=6)
+    exponents = ['1/%d' % (i+2) for i in range(3)] + \
+        [Fraction(1, i+2) for i in range(3, 6)]
+    OF2 = OrthogonalFunctions.from_exponents(exponents)
+    assert OF2.alpha == OF1.alpha
+    assert OF2.coeffs == OF1.coeffs
+    assert OF2.sym_phi == OF1.sym_phi
+
+    # Polynomials with the weight w(t) = 1
+    for method in ['gram-schmidt', 'cholesky', 'product']:
+        OF = OrthogonalFunctions.from_exponents([1, 2, 3], beta=1,
+                                                method=method)
+        assert OF.coeffs.tolist() == [[1], [-3, 4], [6, -20, 15]]
+        assert OF.beta == 1
+        assert OF.check()
+
+    # Float exponents, a weight that is singular at zero, and a scaling
+    for end_interval in [1, 2]:
+        OFs = [OrthogonalFunctions.from_exponents(
+                   [0.5, 1.5, 0.75, 3.0, 2.0], beta=-0.5,
+                   end_interval=end_interval, method=method)
+               for method in ['gram-schmidt', 'cholesky', 'product']]
+        assert OFs[0].coeffs == OFs[1].coeffs == OFs[2].coeffs
+        assert OFs[0].check(mode='numeric')
+
+        # The values at the end of the interval are alpha * L**(-beta/2)
+        assert numpy.allclose(OFs[0].evaluate(end_interval),
+                              numpy.array(OFs[0].alpha) *
+                              end_interval**0.25)
+
+    # Projection with the weight, where the functions vanish fast at zero
+    t = numpy.logspace(-20, 0, 10**5)
+    coeffs = numpy.random.RandomState(0).randn(2, 3)
+    samples = coeffs @ OF.evaluate(t)
+    assert numpy.allclose(OF.project(samples, t), coeffs, rtol=0, atol=1e-4)
+
+    # Invalid exponents, weights and methods
+    for exponents, beta, method in [([1, 1], 0, 'product'),
+                                    ([0, 1], 0, 'product'),
+                                    ([1, 'one'], 0, 'product'),
+                                    ([], 0, 'product'),
+                                    ([1, 2], -2, 'product'),
+                                    ([1, 2], 0, 'symbolic')]:
+        try:
+            OrthogonalFunctions.from_exponents(exponents, beta=beta,
+                                               method=method)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError('Invalid exponents were not rejected.')
+
+    # Operations that are not available for custom exponents
+    for operation in [lambda: OF.extend(1), lambda: OF.save('ortho.npz'),
+                      lambda: OF.evaluate(0.5, method='stable'),
+                      lambda: OF.evaluate(0.5, precision=20)]:
+        try:
+            operation()
+        except ValueError:
+            pass
+        else:
+            raise AssertionError('Operation should not be available.')
+
+
 # ===========
 # Script Main
 # ===========
 
 if __name__ == "__main__":
     test_orthogonal_functions()
+    test_rational_method()
+    test_cholesky_method()
+    test_product_method()
+    test_triangular_coeffs()
+    test_evaluate()
+    test_evaluate_methods()
+    test_evaluate_stable()
+    test_evaluate_precision()
+    test_evaluate_chunks()
+    test_evaluate_derivative()
+    test_synthesize()
+    test_project()
+    test_fit()
+    test_save_load()
+    test_cache()
+    test_rescale()
+    test_extend()
+    test_batch()
+    test_parallel()
+    test_check_numeric()
+    test_from_exponents()
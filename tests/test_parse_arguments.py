@@ -27,7 +27,8 @@ warnings.filterwarnings("error")
 def test_parse_arguments():
 
     # Mock user argument
-    argv1 = ['', '-n', '8', '-s', '1', '-e', '1', '-c', '-p']
+    argv1 = ['', '-n', '8', '-s', '1', '-e', '1', '-m', 'cholesky', '-c',
+             '-p']
     argv2 = ['', '-h']
     argv3 = ['', '-l']
     argv4 = ['', '-v']
@@ -0,0 +1,73 @@
+#! /usr/bin/env python
+
+# SPDX-FileCopyrightText: Copyright 2021, Siavash Ameli <sameli@berkeley.edu>
+# SPDX-License-Identifier: BSD-3-Clause
+# SPDX-FileType: SOURCE
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the license found in the LICENSE.txt file in the root directory
+# of this source tree.
+
+
+# =======
+# Imports
+# =======
+
+import os
+import pstats
+import tempfile
+from ortho import OrthogonalFunctions, Profiler
+
+import warnings
+warnings.resetwarnings()
+warnings.filterwarnings("error")
+
+
+# =============
+# Test Profiler
+# =============
+
+def test_profiler():
+    """
+    Records the phases of the symbolic and rational processes.
+    """
+
+    # Context manager with cProfile
+    with Profiler(cprofile=True) as profiler:
+        OrthogonalFunctions(num_func=4, method='symbolic')
+
+    report = profiler.report()
+    assert report['phi']['calls'] == 4
+    assert report['normalize']['calls'] == 4
+    assert report['inner_product']['calls'] == 4 + 6
+    assert report['simplify']['calls'] == 3 * 4
+    assert report['get_symbolic_coeffs']['calls'] == 1
+    assert report['get_numeric_coeffs']['calls'] == 1
+    assert all(record['time'] >= 0 for record in report.values())
+
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, 'profile.prof')
+        profiler.dump_stats(filename)
+        assert pstats.Stats(filename).total_calls > 0
+
+    # No recording outside of the context
+    OrthogonalFunctions(num_func=4, method='symbolic')
+    assert profiler.report() == report
+
+    # Profiling of an object
+    OF = OrthogonalFunctions(num_func=9, profile=True)
+    OF.check(mode='numeric')
+    report = OF.profiler.report()
+    assert report['rational_gram_schmidt_process']['calls'] == 1
+    assert report['check_numeric_orthonormality']['calls'] == 1
+    OF.profiler.print()
+
+    assert OrthogonalFunctions(num_func=9).profiler is None
+
+
+# ===========
+# Script Main
+# ===========
+
+if __name__ == "__main__":
+    test_profiler()